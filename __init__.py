@@ -1 +1,7 @@
-from .dashboard import DashboardManager
+def __getattr__(name):
+    # Imported on first use so worker processes that only need the
+    # extraction modules don't pull in Streamlit through the dashboard
+    if name == 'DashboardManager':
+        from .dashboard import DashboardManager
+        return DashboardManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
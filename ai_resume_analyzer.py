@@ -3,17 +3,30 @@ import streamlit as st
 from dotenv import load_dotenv
 import google.generativeai as genai
 import pdfplumber
-from pdf2image import convert_from_path
-import pytesseract
-import tempfile
 import requests
 import json
 import math
 import re
 
+from .analysis_cache import get_analysis_cache
+from .docx_text import extract_docx_text
+from .extraction_engine import get_extraction_engine
+from .llm_cache import estimate_tokens, get_llm_cache
+from .profiling import StageProfiler
+from .upload_buffer import UploadBuffer
+
 
 class AIResumeAnalyzer:
+    # Bump when the prompts or response parsing change to invalidate cached analyses
+    ANALYZER_VERSION = 'ai_resume_analyzer/1'
+    GEMINI_MODEL = "gemini-1.5-flash"
+    # Bump when the Gemini prompt template changes to invalidate cached responses
+    GEMINI_PROMPT_VERSION = 'gemini_resume_analysis/1'
+
     def __init__(self):
+        # Bytes of the last upload copied out of memory (0 for in-memory uploads)
+        self.last_bytes_copied = 0
+        
         # Load environment variables
         load_dotenv()
         
@@ -25,164 +38,63 @@ class AIResumeAnalyzer:
             genai.configure(api_key=self.google_api_key)
     
     def extract_text_from_pdf(self, pdf_file):
-        """Extract text from PDF using pdfplumber and OCR if needed"""
-        text = ""
-        
-        # Save the uploaded file to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            if hasattr(pdf_file, 'getbuffer'):
-                temp_file.write(pdf_file.getbuffer())
-            elif hasattr(pdf_file, 'read'):
-                temp_file.write(pdf_file.read())
-                pdf_file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                temp_file.write(pdf_file)
-            temp_path = temp_file.name
-        
-        try:
-            # Try direct text extraction with pdfplumber
-            try:
-                with pdfplumber.open(temp_path) as pdf:
-                    for page in pdf.pages:
-                        try:
-                            # Suppress specific warnings about PDFColorSpace conversion
-                            import warnings
-                            with warnings.catch_warnings():
-                                warnings.filterwarnings("ignore", message=".*PDFColorSpace.*")
-                                warnings.filterwarnings("ignore", message=".*Cannot convert.*")
-                                page_text = page.extract_text()
-                                if page_text:
-                                    text += page_text + "\n"
-                        except Exception as e:
-                            # Don't show these specific errors to the user
-                            if "PDFColorSpace" not in str(e) and "Cannot convert" not in str(e):
-                                st.warning(f"Error extracting text from page with pdfplumber: {e}")
-            except Exception as e:
-                st.warning(f"pdfplumber extraction failed: {e}")
-            
-            # If pdfplumber extraction worked, return the text
-            if text.strip():
-                os.unlink(temp_path)  # Clean up the temp file
-                return text.strip()
-            
-            # Try PyPDF2 as a fallback
-            st.info("Trying PyPDF2 extraction method...")
-            try:
-                import pypdf
-                pdf_text = ""
-                with open(temp_path, 'rb') as file:
-                    pdf_reader = pypdf.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            pdf_text += page_text + "\n"
-                
-                if pdf_text.strip():
-                    os.unlink(temp_path)  # Clean up the temp file
-                    return pdf_text.strip()
-            except Exception as e:
-                st.warning(f"PyPDF2 extraction failed: {e}")
-            
-            # If we got here, both extraction methods failed
-            st.warning("Standard text extraction methods failed. Your PDF might be image-based or scanned.")
-            
-            # Try OCR as a last resort
-            try:
-                # Check if we can import the required OCR libraries
-                import pytesseract
-                from pdf2image import convert_from_path
-                
-                st.info("Attempting OCR for image-based PDF. This may take a moment...")
-                
-                # Check if poppler is installed
-                poppler_path = None
-                if os.name == 'nt':  # Windows
-                    # Try to find poppler in common locations
-                    possible_paths = [
-                        r'C:\poppler\Library\bin',
-                        r'C:\Program Files\poppler\bin',
-                        r'C:\Program Files (x86)\poppler\bin',
-                        r'C:\poppler\bin'
-                    ]
-                    for path in possible_paths:
-                        if os.path.exists(path):
-                            poppler_path = path
-                            st.success(f"Found Poppler at: {path}")
-                            break
-                    
-                    if not poppler_path:
-                        st.warning("Poppler not found in common locations. Using default path: C:\\poppler\\Library\\bin")
-                        poppler_path = r'C:\poppler\Library\bin'
-                
-                # Try to convert PDF to images
-                try:
-                    if poppler_path and os.name == 'nt':
-                        images = convert_from_path(temp_path, poppler_path=poppler_path)
-                    else:
-                        images = convert_from_path(temp_path)
-                    
-                    # Process each image with OCR
-                    ocr_text = ""
-                    for i, image in enumerate(images):
-                        st.info(f"Processing page {i+1} with OCR...")
-                        page_text = pytesseract.image_to_string(image)
-                        ocr_text += page_text + "\n"
-                    
-                    if ocr_text.strip():
-                        os.unlink(temp_path)  # Clean up the temp file
-                        return ocr_text.strip()
-                    else:
-                        st.error("OCR extraction yielded no text. Please check if the PDF contains actual text content.")
-                except Exception as e:
-                    st.error(f"PDF to image conversion failed: {e}")
-                    st.info("If you're on Windows, make sure Poppler is installed and in your PATH.")
-                    st.info("Download Poppler from: https://github.com/oschwartz10612/poppler-windows/releases/")
-            except ImportError as e:
-                st.error(f"OCR libraries not available: {e}")
-                st.info("Please install the required OCR libraries:")
-                st.code("pip install pytesseract pdf2image")
-                st.info("For Windows, also download and install:")
-                st.info("1. Tesseract OCR: https://github.com/UB-Mannheim/tesseract/wiki")
-                st.info("2. Poppler: https://github.com/oschwartz10612/poppler-windows/releases/")
-            except Exception as e:
-                st.error(f"OCR processing failed: {e}")
-        
-        except Exception as e:
-            st.error(f"PDF processing failed: {e}")
-        
-        # Clean up the temp file
-        try:
-            os.unlink(temp_path)
-        except:
-            pass
-        
-        # If all extraction methods failed, return an empty string
+        """Extract text from PDF with the shared extraction engine
+
+        The engine picks the cheapest text-layer backend likely to succeed,
+        OCRs only image-only pages and caches the result. The upload is
+        read in memory; a temp file is only written for OCR.
+        """
+        buffer = UploadBuffer(pdf_file)
+        self.last_bytes_copied = buffer.bytes_copied
+        result = get_extraction_engine().extract(buffer.data, getattr(pdf_file, 'name', None))
+        if result['backend'] is not None:
+            return result['text']
+
+        for attempt in result['attempts']:
+            if attempt['error']:
+                st.warning(f"{attempt['backend']} extraction failed: {attempt['error']}")
+        if not any(attempt['backend'] == 'ocr' and attempt['error'] is None for attempt in result['attempts']):
+            st.info("Image-based PDFs need OCR. Please install the required OCR libraries:")
+            st.code("pip install pytesseract pdf2image")
+            st.info("For Windows, also download and install:")
+            st.info("1. Tesseract OCR: https://github.com/UB-Mannheim/tesseract/wiki")
+            st.info("2. Poppler: https://github.com/oschwartz10612/poppler-windows/releases/")
         st.error("All text extraction methods failed. Please try a different PDF or manually extract the text.")
         return ""
-    
+
+    def iter_pages(self, pdf_file):
+        """Yield (page_number, text) for a PDF as each page is extracted
+
+        Pages come from the shared extraction engine (see
+        ExtractionEngine.iter_pages); image-only pages are OCR'd as they
+        are reached and a cache hit is yielded as a single page.
+        """
+        buffer = UploadBuffer(pdf_file)
+        self.last_bytes_copied = buffer.bytes_copied
+        yield from get_extraction_engine().iter_pages(buffer.data, getattr(pdf_file, 'name', None))
+
     def extract_text_from_docx(self, docx_file):
-        """Extract text from DOCX file"""
-        from docx import Document
-        
-        # Save the uploaded file to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
-            temp_file.write(docx_file.getbuffer())
-            temp_path = temp_file.name
+        """Extract text from DOCX file, including tables, text boxes, headers and footers"""
+        # The streaming extractor reads straight from the in-memory upload
+        buffer = UploadBuffer(docx_file)
+        self.last_bytes_copied = buffer.bytes_copied
         
         text = ""
         try:
-            doc = Document(temp_path)
-            for para in doc.paragraphs:
-                text += para.text + "\n"
+            text = extract_docx_text(buffer.data) + "\n"
         except Exception as e:
             st.error(f"Error extracting text from DOCX: {e}")
         
-        os.unlink(temp_path)  # Clean up the temp file
         return text
     
-    def analyze_resume_with_gemini(self, resume_text, job_description=None, job_role=None):
-        """Analyze resume using Google Gemini AI"""
+    def analyze_resume_with_gemini(self, resume_text, job_description=None, job_role=None, use_cache=True):
+        """Analyze resume using Google Gemini AI.
+
+        Responses are kept in the persistent LLM response cache, keyed by
+        model, GEMINI_PROMPT_VERSION, resume text, job role and job
+        description, so an unchanged request is answered without calling
+        the model (the result then has "cached": True).
+        """
         if not resume_text:
             return {"error": "Resume text is required for analysis."}
         
@@ -190,8 +102,6 @@ class AIResumeAnalyzer:
             return {"error": "Google API key is not configured. Please add it to your .env file."}
         
         try:
-            model = genai.GenerativeModel("gemini-1.5-flash")
-            
             base_prompt = f"""
             You are an expert resume analyst with deep knowledge of industry standards, job requirements, and hiring practices across various fields. Your task is to provide a comprehensive, detailed analysis of the resume provided.
             
@@ -257,8 +167,26 @@ class AIResumeAnalyzer:
                 [List specific requirements from the job description that are not addressed in the resume, with recommendations on how to address each gap]
                 """
             
-            response = model.generate_content(base_prompt)
-            analysis = response.text.strip()
+            cache = get_llm_cache() if use_cache else None
+            analysis = None
+            if cache is not None:
+                cache_key = cache.make_key(self.GEMINI_MODEL, self.GEMINI_PROMPT_VERSION,
+                                           resume_text, job_role, job_description)
+                analysis = cache.get(cache_key)
+            cached = analysis is not None
+            
+            if not cached:
+                model = genai.GenerativeModel(self.GEMINI_MODEL)
+                response = model.generate_content(base_prompt)
+                analysis = response.text.strip()
+                if cache is not None and analysis:
+                    usage = getattr(response, 'usage_metadata', None)
+                    cache.put(
+                        cache_key,
+                        analysis,
+                        getattr(usage, 'prompt_token_count', None) or estimate_tokens(base_prompt),
+                        getattr(usage, 'candidates_token_count', None) or estimate_tokens(analysis)
+                    )
             
             # Extract resume score if present
             resume_score = self._extract_score_from_text(analysis)
@@ -269,7 +197,8 @@ class AIResumeAnalyzer:
             return {
                 "analysis": analysis,
                 "resume_score": resume_score,
-                "ats_score": ats_score
+                "ats_score": ats_score,
+                "cached": cached
             }
         
         except Exception as e:
@@ -1187,7 +1116,7 @@ class AIResumeAnalyzer:
             print(f"Error extracting ATS score: {str(e)}")
             return 0
             
-    def analyze_resume(self, resume_text, job_role=None, role_info=None, model="Google Gemini"):
+    def analyze_resume(self, resume_text, job_role=None, role_info=None, model="Google Gemini", profile=None, use_cache=True):
         """
         Analyze a resume using the specified AI model
         
@@ -1196,10 +1125,34 @@ class AIResumeAnalyzer:
         - job_role: The target job role
         - role_info: Additional information about the job role
         - model: The AI model to use ("Google Gemini" or "Anthropic Claude")
+        - profile: True, a StageProfiler, or None to follow RESUME_PROFILING;
+          adds per-stage wall/CPU times under '_profile'
+        - use_cache: reuse the result of an identical earlier request
+          (same text, role, role info, model and ANALYZER_VERSION)
         
         Returns:
         - Dictionary containing analysis results
         """
+        profiler = StageProfiler.for_call('ai_resume_analyzer', profile)
+        if not use_cache:
+            return profiler.attach(self._analyze_resume(resume_text, job_role, role_info, model, profiler))
+
+        cache = get_analysis_cache()
+        with profiler.stage('cache_lookup'):
+            key = cache.make_key('ai_resume_analyzer', self.ANALYZER_VERSION, resume_text,
+                                 {'job_role': job_role, 'role_info': role_info, 'model': model})
+            result = cache.get(key)
+        if result is None:
+            result = self._analyze_resume(resume_text, job_role, role_info, model, profiler)
+            # Failed or empty model responses are retried on the next run
+            if 'error' not in result and result.get('full_response'):
+                cache.put(key, result)
+        else:
+            # Served without calling the model
+            result['cached'] = True
+        return profiler.attach(result)
+
+    def _analyze_resume(self, resume_text, job_role, role_info, model, profiler):
         import traceback
         
         try:
@@ -1212,52 +1165,54 @@ class AIResumeAnalyzer:
                 """
             
             # Choose the appropriate model for analysis
-            if model == "Google Gemini":
-                result = self.analyze_resume_with_gemini(resume_text, job_description, job_role)
-                model_used = "Google Gemini"
-            elif model == "Anthropic Claude":
-                result = self.analyze_resume_with_anthropic(resume_text, job_description, job_role)
-                # Get the actual model used from the result
-                model_used = result.get("model_used", "Anthropic Claude")
-            else:
-                # Default to Gemini if model not recognized
-                result = self.analyze_resume_with_gemini(resume_text, job_description, job_role)
-                model_used = "Google Gemini"
+            with profiler.stage('model_call'):
+                if model == "Google Gemini":
+                    result = self.analyze_resume_with_gemini(resume_text, job_description, job_role)
+                    model_used = "Google Gemini"
+                elif model == "Anthropic Claude":
+                    result = self.analyze_resume_with_anthropic(resume_text, job_description, job_role)
+                    # Get the actual model used from the result
+                    model_used = result.get("model_used", "Anthropic Claude")
+                else:
+                    # Default to Gemini if model not recognized
+                    result = self.analyze_resume_with_gemini(resume_text, job_description, job_role)
+                    model_used = "Google Gemini"
             
             # Process the result to extract structured information
-            analysis_text = result.get("analysis", "")
-            
-            # Extract strengths
-            strengths = []
-            if "## Key Strengths" in analysis_text:
-                strengths_section = analysis_text.split("## Key Strengths")[1].split("##")[0].strip()
-                strengths = [clean_markdown(s.strip().replace("- ", "").replace("* ", "").replace("• ", "")) 
-                            for s in strengths_section.split("\n") 
-                            if s.strip() and (s.strip().startswith("-") or s.strip().startswith("*") or s.strip().startswith("•"))]
-            
-            # Extract weaknesses/areas for improvement
-            weaknesses = []
-            if "## Areas for Improvement" in analysis_text:
-                weaknesses_section = analysis_text.split("## Areas for Improvement")[1].split("##")[0].strip()
-                weaknesses = [clean_markdown(w.strip().replace("- ", "").replace("* ", "").replace("• ", "")) 
-                             for w in weaknesses_section.split("\n") 
-                             if w.strip() and (w.strip().startswith("-") or w.strip().startswith("*") or w.strip().startswith("•"))]
-            
-            # Extract suggestions/recommendations
-            suggestions = []
-            if "## Recommended Courses" in analysis_text:
-                suggestions_section = analysis_text.split("## Recommended Courses")[1].split("##")[0].strip()
-                suggestions = [clean_markdown(s.strip().replace("- ", "").replace("* ", "").replace("• ", "")) 
-                                 for s in suggestions_section.split("\n") 
-                                 if s.strip() and (s.strip().startswith("-") or s.strip().startswith("*") or s.strip().startswith("•"))]
-            
-            # Extract score
-            score = result.get("resume_score", 0)
-            if not score:
-                score = self._extract_score_from_text(analysis_text)
-            
-            # Extract ATS score
-            ats_score = self._extract_ats_score_from_text(analysis_text)
+            with profiler.stage('response_parsing'):
+                analysis_text = result.get("analysis", "")
+            
+                # Extract strengths
+                strengths = []
+                if "## Key Strengths" in analysis_text:
+                    strengths_section = analysis_text.split("## Key Strengths")[1].split("##")[0].strip()
+                    strengths = [clean_markdown(s.strip().replace("- ", "").replace("* ", "").replace("• ", "")) 
+                                for s in strengths_section.split("\n") 
+                                if s.strip() and (s.strip().startswith("-") or s.strip().startswith("*") or s.strip().startswith("•"))]
+            
+                # Extract weaknesses/areas for improvement
+                weaknesses = []
+                if "## Areas for Improvement" in analysis_text:
+                    weaknesses_section = analysis_text.split("## Areas for Improvement")[1].split("##")[0].strip()
+                    weaknesses = [clean_markdown(w.strip().replace("- ", "").replace("* ", "").replace("• ", "")) 
+                                 for w in weaknesses_section.split("\n") 
+                                 if w.strip() and (w.strip().startswith("-") or w.strip().startswith("*") or w.strip().startswith("•"))]
+            
+                # Extract suggestions/recommendations
+                suggestions = []
+                if "## Recommended Courses" in analysis_text:
+                    suggestions_section = analysis_text.split("## Recommended Courses")[1].split("##")[0].strip()
+                    suggestions = [clean_markdown(s.strip().replace("- ", "").replace("* ", "").replace("• ", "")) 
+                                     for s in suggestions_section.split("\n") 
+                                     if s.strip() and (s.strip().startswith("-") or s.strip().startswith("*") or s.strip().startswith("•"))]
+            
+                # Extract score
+                score = result.get("resume_score", 0)
+                if not score:
+                    score = self._extract_score_from_text(analysis_text)
+            
+                # Extract ATS score
+                ats_score = self._extract_ats_score_from_text(analysis_text)
             
             # Return structured analysis
             return {
@@ -1267,7 +1222,9 @@ class AIResumeAnalyzer:
                 "weaknesses": weaknesses,
                 "suggestions": suggestions,
                 "full_response": analysis_text,
-                "model_used": model_used
+                "model_used": model_used,
+                # True when the model response came from the LLM response cache
+                "cached": result.get("cached", False)
             }
             
         except Exception as e:
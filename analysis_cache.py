@@ -0,0 +1,105 @@
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
+def normalize_text(text):
+    """Return text with line endings unified, as analyzed and hashed for the cache"""
+    return (text or '').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _digest(value):
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+class AnalysisCache:
+    """In-memory LRU cache of analysis results.
+
+    Entries are keyed by the analyzer name and version, the SHA-256 of the
+    normalized resume text and the SHA-256 of the requirements (job role,
+    required skills, model...) serialized with sorted keys. When an
+    analyzer is used with a new version, every entry of its older versions
+    is dropped, so bumping a version invalidates stale results at once.
+
+    Results are deep-copied in and out, so callers may modify what they get.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._versions = {}  # analyzer name -> version of the cached entries
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'invalidations': 0
+        }
+
+    @staticmethod
+    def make_key(analyzer, version, text, requirements=None):
+        """Build the cache key for one analysis request"""
+        requirements = json.dumps(requirements or {}, sort_keys=True, default=str)
+        return (analyzer, version, _digest(normalize_text(text)), _digest(requirements))
+
+    def _check_version(self, analyzer, version):
+        """Drop an analyzer's entries if they were produced by another version"""
+        if self._versions.get(analyzer, version) != version:
+            stale = [key for key in self._memory if key[0] == analyzer]
+            for key in stale:
+                del self._memory[key]
+            self._stats['invalidations'] += len(stale)
+        self._versions[analyzer] = version
+
+    def get(self, key):
+        """Return a copy of the cached result for key, or None on a miss"""
+        with self._lock:
+            self._check_version(key[0], key[1])
+            if key not in self._memory:
+                self._stats['misses'] += 1
+                return None
+            self._memory.move_to_end(key)
+            self._stats['hits'] += 1
+            result = self._memory[key]
+        return copy.deepcopy(result)
+
+    def put(self, key, result):
+        """Store a copy of result under key"""
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._check_version(key[0], key[1])
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._memory)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._memory.clear()
+
+
+_analysis_cache = None
+_analysis_cache_lock = threading.Lock()
+
+
+def get_analysis_cache():
+    """Return the process-wide analysis result cache shared by all analyzers"""
+    global _analysis_cache
+    if _analysis_cache is None:
+        with _analysis_cache_lock:
+            if _analysis_cache is None:
+                _analysis_cache = AnalysisCache()
+    return _analysis_cache
@@ -0,0 +1,214 @@
+import sys
+from dataclasses import dataclass
+
+# Fixed suggestions and deductions of the analyzers, by code. Compact
+# results store the code instead of the prose; any other text (such as
+# an error message) is stored interned as is.
+SUGGESTION_TEXT = {
+    'contact.email': "Add your email address",
+    'contact.phone': "Add your phone number",
+    'contact.linkedin': "Add your LinkedIn profile URL",
+    'summary.missing': "Add a professional summary to highlight your key qualifications",
+    'summary.short': "Expand your professional summary to better highlight your experience and goals",
+    'summary.long': "Consider making your summary more concise (aim for 50-75 words)",
+    'skills.missing': "Add a dedicated skills section",
+    'skills.few': "List more relevant technical and soft skills",
+    'skills.unmatched': "Add more skills that match the job requirements",
+    'experience.missing': "Add your work experience section",
+    'experience.dates': "Include dates for each work experience",
+    'experience.bullets': "Use bullet points to list your achievements and responsibilities",
+    'experience.verbs': "Start bullet points with strong action verbs",
+    'education.missing': "Add your educational background",
+    'education.dates': "Include graduation dates",
+    'education.degree': "Specify your degree type",
+    'education.gpa': "Include your GPA if it's above 3.0",
+    'format.short': "Resume is too short",
+    'format.headers': "No clear section headers found",
+    'format.bullets': "No bullet points found for listing details",
+    'format.spacing': "Inconsistent spacing between sections",
+    'format.contact': "Missing or improperly formatted contact information",
+    'overall.optimized': "Your resume is well-optimized for ATS systems",
+    'profile.words': "Add more detail to your resume - aim for at least 300 words",
+    'profile.skills': "Include more relevant technical skills and technologies",
+    'profile.sentences': "Add more achievements and responsibilities from your experience",
+    'profile.experience': "Highlight any internships, projects, or relevant coursework",
+    'profile.great': "Your resume looks great! Consider adding more quantifiable achievements"
+}
+_SUGGESTION_CODES = {text: code for code, text in SUGGESTION_TEXT.items()}
+
+# Sub-scores of a full ResumeAnalyzer analysis, in result order
+SECTION_NAMES = ('contact', 'summary', 'skills', 'experience', 'education', 'format')
+PERSONAL_FIELDS = ('name', 'email', 'phone', 'linkedin', 'github', 'portfolio')
+
+
+def suggestion_code(text):
+    """Return the code of a known suggestion, or the interned text itself"""
+    return _SUGGESTION_CODES.get(text) or sys.intern(text)
+
+
+def suggestion_text(code):
+    """Return the prose of a suggestion code (unknown codes are prose already)"""
+    return SUGGESTION_TEXT.get(code, code)
+
+
+def _codes(texts):
+    return tuple(suggestion_code(text) for text in texts)
+
+
+def _texts(codes):
+    return [suggestion_text(code) for code in codes]
+
+
+def _interned(values):
+    return tuple(sys.intern(value) for value in values)
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordMatch:
+    score: float
+    found_skills: tuple
+    missing_skills: tuple
+
+    @classmethod
+    def from_dict(cls, match):
+        return cls(match['score'], _interned(match['found_skills']), _interned(match['missing_skills']))
+
+    def to_dict(self):
+        return {
+            'score': self.score,
+            'found_skills': list(self.found_skills),
+            'missing_skills': list(self.missing_skills)
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeAnalysis:
+    """Compact form of a ResumeAnalyzer.analyze_resume result.
+
+    The overall suggestion list of a full analysis is not stored: it is
+    the concatenation of the per-section suggestion codes. Non-resume and
+    error results only carry the fields their dicts have.
+    """
+    ats_score: int
+    document_type: str
+    keyword_match: KeywordMatch
+    section_score: float
+    format_score: int
+    suggestions: tuple = ()           # Codes, for results without section suggestions
+    personal_info: tuple = None       # Values of PERSONAL_FIELDS
+    education: tuple = ()
+    experience: tuple = ()
+    projects: tuple = ()
+    skills: tuple = ()
+    summary: str = ''
+    section_suggestions: tuple = None  # One tuple of codes per SECTION_NAMES
+    section_scores: tuple = None       # One score per SECTION_NAMES
+    error: str = None
+
+    @classmethod
+    def from_dict(cls, result):
+        """Build the compact form of an analyze_resume result dict"""
+        common = {
+            'ats_score': result['ats_score'],
+            'document_type': sys.intern(result['document_type']),
+            'keyword_match': KeywordMatch.from_dict(result['keyword_match']),
+            'section_score': result['section_score'],
+            'format_score': result['format_score']
+        }
+        if 'section_scores' not in result:
+            return cls(suggestions=_codes(result['suggestions']),
+                       error=result.get('error'), **common)
+        return cls(
+            personal_info=tuple(result[field] for field in PERSONAL_FIELDS),
+            education=tuple(result['education']),
+            experience=tuple(result['experience']),
+            projects=tuple(result['projects']),
+            skills=_interned(result['skills']),
+            summary=result['summary'],
+            section_suggestions=tuple(_codes(result[f'{name}_suggestions']) for name in SECTION_NAMES),
+            section_scores=tuple(result['section_scores'][name] for name in SECTION_NAMES),
+            **common
+        )
+
+    def suggestion_codes(self):
+        """Return the codes of the overall suggestion list"""
+        if self.section_suggestions is None:
+            return self.suggestions
+        codes = tuple(code for codes in self.section_suggestions for code in codes)
+        return codes or ('overall.optimized',)
+
+    def to_dict(self):
+        """Return the analyze_resume result dict this was built from"""
+        if self.section_suggestions is None:
+            result = {} if self.error is None else {'error': self.error}
+            result.update({
+                'ats_score': self.ats_score,
+                'document_type': self.document_type,
+                'keyword_match': self.keyword_match.to_dict(),
+                'section_score': self.section_score,
+                'format_score': self.format_score,
+                'suggestions': _texts(self.suggestions)
+            })
+            return result
+
+        result = dict(zip(PERSONAL_FIELDS, self.personal_info))
+        result.update({
+            'ats_score': self.ats_score,
+            'document_type': self.document_type,
+            'keyword_match': self.keyword_match.to_dict(),
+            'section_score': self.section_score,
+            'format_score': self.format_score,
+            'education': list(self.education),
+            'experience': list(self.experience),
+            'projects': list(self.projects),
+            'skills': list(self.skills),
+            'summary': self.summary,
+            'suggestions': _texts(self.suggestion_codes())
+        })
+        for name, codes in zip(SECTION_NAMES, self.section_suggestions):
+            result[f'{name}_suggestions'] = _texts(codes)
+        result['section_scores'] = dict(zip(SECTION_NAMES, self.section_scores))
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileAnalysis:
+    """Compact form of an analyzer.ResumeAnalyzer.analyze_resume result"""
+    timestamp: str
+    word_count: int
+    sentence_count: int
+    skills_count: int
+    experience_years: int
+    profile_score: int
+    skills: tuple
+    suggestions: tuple  # (icon, code) pairs
+
+    @classmethod
+    def from_dict(cls, result):
+        metrics = result['metrics']
+        return cls(
+            timestamp=result['timestamp'],
+            word_count=metrics['word_count'],
+            sentence_count=metrics['sentence_count'],
+            skills_count=metrics['skills_count'],
+            experience_years=metrics['experience_years'],
+            profile_score=metrics['profile_score'],
+            skills=_interned(result['skills']),
+            suggestions=tuple((sys.intern(item['icon']), suggestion_code(item['text']))
+                              for item in result['suggestions'])
+        )
+
+    def to_dict(self):
+        return {
+            'timestamp': self.timestamp,
+            'metrics': {
+                'word_count': self.word_count,
+                'sentence_count': self.sentence_count,
+                'skills_count': self.skills_count,
+                'experience_years': self.experience_years,
+                'profile_score': self.profile_score
+            },
+            'skills': list(self.skills),
+            'suggestions': [{'icon': icon, 'text': suggestion_text(code)} for icon, code in self.suggestions]
+        }
+
@@ -1,24 +1,57 @@
-import spacy
 from collections import Counter
 from datetime import datetime
 
+from .analysis_results import ProfileAnalysis
+from .doc_cache import get_doc_cache
+from .nlp_models import get_nlp
+from .profile_matcher import get_profile_matcher
+
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, use_cache=True):
+        # Shared trimmed pipeline: tokens, like_num and sentencizer sentences only
+        self.nlp = get_nlp()
+        self.matcher = get_profile_matcher(self.nlp)
+        # Parsed Docs are kept on disk, so re-analyzing a text skips the pipeline
+        self.doc_cache = get_doc_cache() if use_cache else None
         
     def analyze_resume(self, resume_text):
         """Analyze resume text and return metrics"""
-        doc = self.nlp(resume_text)
+        if self.doc_cache is None:
+            return self._analyze_doc(self.nlp(resume_text))
+        return list(self.analyze_batch([resume_text]))[0]
+    
+    def analyze_batch(self, resume_texts, batch_size=64, n_process=1, compact=False):
+        """Analyze many resume texts, yielding one analyze_resume result per text in order.
+
+        Texts are streamed through nlp.pipe batch_size at a time, and with
+        n_process > 1 spread over that many spaCy worker processes, so
+        resume_texts can be a lazy iterable of any length. Worker processes
+        only pay off when the pipeline itself dominates: Docs are sent back
+        to this process, which still extracts skills and experience. Texts
+        parsed before are loaded from the Doc cache instead.
+
+        With compact=True results are ProfileAnalysis objects (call
+        to_dict() for the usual dict), for callers that keep many of them.
+        """
+        texts = (text or '' for text in resume_texts)
+        if self.doc_cache is None:
+            docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        else:
+            docs = self.doc_cache.parse(self.nlp, texts, batch_size=batch_size, n_process=n_process)
+        pack = ProfileAnalysis.from_dict if compact else (lambda result: result)
+        for doc in docs:
+            yield pack(self._analyze_doc(doc))
+    
+    def _analyze_doc(self, doc):
+        """Compute metrics, skills and suggestions of a processed resume"""
+        resume_text = doc.text
         
         # Basic metrics
         word_count = len(resume_text.split())
         sentence_count = len(list(doc.sents))
         
-        # Skills extraction
-        skills = self._extract_skills(doc)
-        
-        # Experience analysis
-        experience_years = self._analyze_experience(doc)
+        # Skills and experience, from one pass of the shared matchers
+        skills, experience_years = self._extract_profile(doc)
         
         # Calculate profile score
         profile_score = self._calculate_profile_score(
@@ -40,40 +73,10 @@ class ResumeAnalyzer:
             )
         }
     
-    def _extract_skills(self, doc):
-        """Extract skills from resume"""
-        # Common technical skills keywords
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., "machine learning")
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
-    
-    def _analyze_experience(self, doc):
-        """Analyze years of experience"""
-        # Simple heuristic - look for number + "years"
-        experience_years = 0
-        for token in doc:
-            if token.like_num and token.i < len(doc) - 1:
-                next_token = doc[token.i + 1]
-                if "year" in next_token.text.lower():
-                    try:
-                        experience_years = max(experience_years, int(token.text))
-                    except ValueError:
-                        continue
-        return experience_years
+    def _extract_profile(self, doc):
+        """Extract canonical skill names (in order of first mention) and years of experience"""
+        skill_ids, experience_years = self.matcher(doc)
+        return [self.matcher.lexicon.names[skill_id] for skill_id in skill_ids], experience_years
     
     def _calculate_profile_score(self, word_count, sentence_count, skills_count, experience_years):
         """Calculate profile score based on various metrics"""
@@ -30,6 +30,11 @@ from config.database import (
 from utils.ai_resume_analyzer import AIResumeAnalyzer
 from utils.resume_builder import ResumeBuilder
 from utils.resume_analyzer import ResumeAnalyzer
+from utils.builder_analysis import IncrementalAnalyzer
+from utils.role_matcher import RoleMatcher
+from utils.extraction_engine import join_pages
+from utils.extraction_workers import ExtractionError, get_sandboxed_extractor
+from utils.nlp_models import warmup, warmup_enabled
 import traceback
 import plotly.express as px
 import pandas as pd
@@ -48,6 +53,10 @@ st.set_page_config(
 class ResumeApp:
     def __init__(self):
         """Initialize the application"""
+        if warmup_enabled():
+            # Load the shared spaCy pipeline off the request path (no-op once loaded)
+            warmup()
+
         if 'form_data' not in st.session_state:
             st.session_state.form_data = {
                 'personal_info': {
@@ -93,8 +102,10 @@ class ResumeApp:
 
         self.analyzer = ResumeAnalyzer()
         self.ai_analyzer = AIResumeAnalyzer()
+        self.extraction_sandbox = get_sandboxed_extractor()
         self.builder = ResumeBuilder()
         self.job_roles = JOB_ROLES
+        self.role_matcher = RoleMatcher(JOB_ROLES)
 
         # Initialize session state
         if 'user_id' not in st.session_state:
@@ -565,6 +576,31 @@ class ResumeApp:
         st.session_state.analytics_data = analytics
         return analytics
 
+    def analyze_pdf_incrementally(self, uploaded_file, role_info):
+        """Analyze a PDF page by page, previewing contact info and summary early"""
+        preview = st.empty()
+        page_texts = []
+
+        def pages():
+            for page_number, page_text in self.analyzer.iter_pages(uploaded_file):
+                page_texts.append(page_text)
+                yield page_number, page_text
+
+        analysis = None
+        try:
+            for analysis in self.analyzer.iter_analysis(pages(), role_info):
+                if analysis.get('partial'):
+                    with preview.container():
+                        st.markdown(f"**{analysis.get('name', '')}** &nbsp; {analysis.get('email', '')} &nbsp; {analysis.get('phone', '')}")
+                        if analysis.get('summary'):
+                            st.caption(analysis['summary'])
+                        st.info(f"Parsed {analysis['pages_parsed']} page(s)...")
+        finally:
+            # Don't leave a stale preview behind when extraction fails halfway
+            preview.empty()
+        # Joined as iter_analysis and the extraction engine join them
+        return join_pages(page_texts), analysis
+
     def handle_resume_upload(self):
         """Handle resume upload and analysis"""
         uploaded_file = st.file_uploader(
@@ -894,6 +930,30 @@ class ResumeApp:
             'summary': summary
         })
 
+        # Live ATS score, re-scored on every change; only edited sections are recomputed
+        st.subheader("ATS Score Check")
+        col1, col2 = st.columns(2)
+        with col1:
+            score_category = st.selectbox(
+    "Target Job Category", list(self.job_roles.keys()), key="builder_score_category")
+        with col2:
+            score_role = st.selectbox(
+    "Target Role", list(self.job_roles[score_category].keys()), key="builder_score_role")
+
+        if 'builder_analyzer' not in st.session_state:
+            st.session_state.builder_analyzer = IncrementalAnalyzer(self.analyzer)
+        live_analysis = st.session_state.builder_analyzer.analyze(
+            st.session_state.form_data, self.job_roles[score_category][score_role])
+
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            st.metric("ATS Score", f"{live_analysis['ats_score']}/100")
+            st.metric("Skills Match", f"{int(live_analysis['keyword_match']['score'])}%")
+        with col2:
+            st.markdown("##### Suggestions")
+            for suggestion in live_analysis['suggestions'][:5]:
+                st.markdown(f"- {suggestion}")
+
         # Generate Resume button
         if st.button("Generate Resume 📄", type="primary"):
             print("Validating form data...")
@@ -1328,32 +1388,23 @@ class ResumeApp:
                     with st.spinner("Analyzing your document..."):
                         # Get file content
                         text = ""
+                        analysis = None
                         try:
                             if uploaded_file.type == "application/pdf":
                                 try:
-                                    text = self.analyzer.extract_text_from_pdf(uploaded_file)
+                                    # Stream pages so page-1 results show while later pages parse
+                                    text, analysis = self.analyze_pdf_incrementally(uploaded_file, role_info)
                                 except Exception as pdf_error:
-                                    st.error(f"PDF extraction failed: {str(pdf_error)}")
-                                    st.info("Trying alternative PDF extraction method...")
-                                    # Try AI analyzer as backup
-                                    try:
-                                        text = self.ai_analyzer.extract_text_from_pdf(uploaded_file)
-                                    except Exception as backup_error:
-                                        st.error(f"All PDF extraction methods failed: {str(backup_error)}")
-                                        return
-                            elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+                                    st.info(f"Fast PDF extraction failed ({str(pdf_error)}). Trying other extraction methods...")
+                            if not text.strip():
+                                # Let the extraction engine escalate to its other backends (or read
+                                # the DOCX), in a sandboxed worker so a hostile file cannot stall the app
+                                analysis = None
                                 try:
-                                    text = self.analyzer.extract_text_from_docx(uploaded_file)
-                                except Exception as docx_error:
-                                    st.error(f"DOCX extraction failed: {str(docx_error)}")
-                                    # Try AI analyzer as backup
-                                    try:
-                                        text = self.ai_analyzer.extract_text_from_docx(uploaded_file)
-                                    except Exception as backup_error:
-                                        st.error(f"All DOCX extraction methods failed: {str(backup_error)}")
-                                        return
-                            else:
-                                text = uploaded_file.getvalue().decode()
+                                    text = self.extraction_sandbox.extract_text(uploaded_file)
+                                except ExtractionError as extraction_error:
+                                    st.error(f"All extraction methods failed: {str(extraction_error)}")
+                                    return
                                 
                             if not text or text.strip() == "":
                                 st.error("Could not extract any text from the uploaded file. Please try a different file.")
@@ -1363,7 +1414,8 @@ class ResumeApp:
                             return
 
                         # Analyze the document
-                        analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
+                        if analysis is None:
+                            analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
                         
                         # Check if analysis returned an error
                         if 'error' in analysis:
@@ -1496,6 +1548,19 @@ class ResumeApp:
 
                         st.markdown("</div>", unsafe_allow_html=True)
 
+                        # Best-Fit Roles Card: the resume scored against every role at once
+                        st.markdown("""
+                        <div class="feature-card">
+                            <h2>Best-Fit Roles</h2>
+                        """, unsafe_allow_html=True)
+
+                        for match in self.role_matcher.rank_roles(text, top_k=3):
+                            st.markdown(f"**{match['role']}** ({match['category']}): {int(match['score'])}% match")
+                            if match['missing_skills']:
+                                st.caption(f"Missing: {', '.join(match['missing_skills'])}")
+
+                        st.markdown("</div>", unsafe_allow_html=True)
+
                     with col2:
                         # Format Score Card
                         st.markdown("""
@@ -2364,14 +2429,14 @@ class ResumeApp:
                                 # Update progress
                                 progress_bar.progress(10)
                                 
-                                # Extract text from the resume
+                                # Extract text from the resume in a sandboxed worker
                                 analyzer = AIResumeAnalyzer()
-                                if uploaded_file.type == "application/pdf":
-                                    resume_text = analyzer.extract_text_from_pdf(
-                                        uploaded_file)
-                                elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                                    resume_text = analyzer.extract_text_from_docx(
-                                        uploaded_file)
+                                if uploaded_file.type in ("application/pdf", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"):
+                                    try:
+                                        resume_text = self.extraction_sandbox.extract_text(uploaded_file)
+                                    except ExtractionError as extraction_error:
+                                        st.error(f"Could not extract text from your resume: {str(extraction_error)}")
+                                        st.stop()
                                 else:
                                     # For text files or other formats
                                     resume_text = uploaded_file.getvalue().decode('utf-8')
@@ -2426,6 +2491,8 @@ class ResumeApp:
                                 # Display the analysis result
                                 if analysis_result and "error" not in analysis_result:
                                     st.success("✅ Analysis complete!")
+                                    if analysis_result.get("cached"):
+                                        st.caption("Served from the analysis cache: this resume and role were analyzed before.")
                                     
                                     # Extract data from the analysis
                                     full_response = analysis_result.get(
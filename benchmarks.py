@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for Smart AI Resume Analyzer
+Run from the project root, for example:
+    python benchmarks.py extraction path/to/resume_corpus
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def print_table(rows, columns):
+    """Print rows (dicts) as an aligned plain-text table"""
+    widths = {column: max(len(column), *(len(_format(row.get(column))) for row in rows))
+              for column in columns}
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    for row in rows:
+        print("  ".join(_format(row.get(column)).ljust(widths[column]) for column in columns))
+
+
+def _format(value):
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    return str(value)
+
+
+def collect_files(path, extensions=('.pdf', '.docx')):
+    """Return every resume file under path, sorted"""
+    if os.path.isfile(path):
+        return [path]
+    files = []
+    for root, _, names in os.walk(path):
+        for name in names:
+            if name.lower().endswith(extensions):
+                files.append(os.path.join(root, name))
+    return sorted(files)
+
+
+def bench_extraction(args):
+    """Compare every extraction backend, and the engine's choice, on a corpus"""
+    from utils.extraction_engine import benchmark
+
+    paths = collect_files(args.corpus)
+    if not paths:
+        print(f"No PDF/DOCX files found under {args.corpus}")
+        return 1
+    print(f"Benchmarking extraction on {len(paths)} file(s), repeat={args.repeat}")
+    rows = benchmark(paths, repeat=args.repeat)
+    print_table(rows, ['backend', 'files', 'ok', 'success_rate', 'avg_seconds', 'chars'])
+    return 0
+
+
+def bench_docx(args):
+    """Compare the streaming DOCX extractor with python-docx"""
+    import time
+    from docx import Document
+    from utils.docx_text import extract_docx_text
+
+    paths = collect_files(args.corpus, extensions=('.docx',))
+    if not paths:
+        print(f"No DOCX files found under {args.corpus}")
+        return 1
+
+    rows = {name: {'extractor': name, 'files': len(paths), 'seconds': 0.0, 'chars': 0}
+            for name in ('docx-stream', 'python-docx')}
+    for path in paths:
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            text = extract_docx_text(path)
+            rows['docx-stream']['seconds'] += time.perf_counter() - start
+            rows['docx-stream']['chars'] += len(text)
+
+            start = time.perf_counter()
+            text = '\n'.join(paragraph.text for paragraph in Document(path).paragraphs)
+            rows['python-docx']['seconds'] += time.perf_counter() - start
+            rows['python-docx']['chars'] += len(text)
+
+    for row in rows.values():
+        row['avg_seconds'] = row['seconds'] / (row['files'] * args.repeat)
+    print(f"Benchmarking DOCX extraction on {len(paths)} file(s), repeat={args.repeat}")
+    print_table(list(rows.values()), ['extractor', 'files', 'avg_seconds', 'chars'])
+    return 0
+
+
+SYNTHETIC_SECTIONS = [
+    ('Professional Summary', ["Data engineer with eight years of experience building reliable pipelines "
+                              "and analytics platforms for fast growing product teams"]),
+    ('Work Experience', ["Senior Engineer, Acme Corp, 2019 - Present",
+                         "Led migration of batch jobs to streaming, cutting latency by 80%",
+                         "", "Engineer, Initech, 2015 - 2019", "Maintained billing services"]),
+    ('Education', ["B.Tech in Computer Science, State University, 2015"]),
+    ('Projects', ["Resume parser: open source tool for structured resume data",
+                  "", "Metrics dashboard: real-time service health views"]),
+    ('Technical Skills', ["Python, SQL, Spark, Airflow | Docker / Kubernetes"]),
+]
+
+
+def synthetic_resume(repeat):
+    """Return a resume whose sections are repeated to make a long document"""
+    lines = ["Jane Doe", "jane@example.com | +1 555 0100", ""]
+    for _ in range(repeat):
+        for header, body in SYNTHETIC_SECTIONS:
+            lines.extend([header] + body + [""])
+    return '\n'.join(lines)
+
+
+def synthetic_resumes(count, size=None):
+    """Return count distinct synthetic resumes, of size repeats or of one to three by default"""
+    return [synthetic_resume(size or index % 3 + 1) + f"\nCandidate {index}" for index in range(count)]
+
+
+SIZE_HELP = "How many times to repeat the synthetic resume sections"
+
+
+def add_size_args(parser, sizes=(1, 10, 100), repeat=5, repeat_help="Runs per size"):
+    """Add the synthetic resume size options shared by the text benchmarks.
+
+    sizes gives the defaults for --sizes, or a single int for --size;
+    repeat=None leaves out --repeat.
+    """
+    if isinstance(sizes, int):
+        parser.add_argument('--size', type=int, default=sizes, help=SIZE_HELP)
+    else:
+        parser.add_argument('--sizes', type=int, nargs='+', default=list(sizes), help=SIZE_HELP)
+    if repeat is not None:
+        parser.add_argument('--repeat', type=int, default=repeat, help=repeat_help)
+
+
+def _legacy_section_scan(text, keywords, resume_keywords):
+    """Per-section scan as ResumeAnalyzer did it before segment_sections"""
+    entries, current, in_section = [], [], False
+    for line in text.split('\n'):
+        line = line.strip()
+        if any(keyword.lower() in line.lower() for keyword in keywords):
+            if not any(keyword.lower() == line.lower() for keyword in keywords):
+                current.append(line)
+            in_section = True
+            continue
+        if in_section:
+            if line and any(keyword.lower() in line.lower() for keyword in resume_keywords):
+                if not any(key.lower() in line.lower() for key in keywords):
+                    in_section = False
+                    if current:
+                        entries.append(' '.join(current))
+                        current = []
+                    continue
+            if line:
+                current.append(line)
+            elif current:
+                entries.append(' '.join(current))
+                current = []
+    if current:
+        entries.append(' '.join(current))
+    return entries
+
+
+def bench_sections(args):
+    """Compare single-pass section segmentation with one scan per section"""
+    import time
+    from utils.resume_analyzer import ResumeAnalyzer
+
+    analyzer = ResumeAnalyzer()
+    resume_keywords = analyzer.document_types['resume']
+    rows = []
+    for repeat in args.sizes:
+        text = synthetic_resume(repeat)
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            legacy = {name: _legacy_section_scan(text, keywords, resume_keywords)
+                      for name, keywords in analyzer.section_keywords.items()}
+        legacy_seconds = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            sections = analyzer.segment_sections(text)
+        single_seconds = (time.perf_counter() - start) / args.repeat
+
+        rows.append({
+            'lines': text.count('\n') + 1,
+            'per_section_seconds': legacy_seconds,
+            'single_pass_seconds': single_seconds,
+            'speedup': legacy_seconds / single_seconds if single_seconds else 0.0
+        })
+    print(f"Benchmarking section segmentation, repeat={args.repeat}")
+    print_table(rows, ['lines', 'per_section_seconds', 'single_pass_seconds', 'speedup'])
+    return 0
+
+
+def bench_roles(args):
+    """Compare scoring one role with ranking every JOB_ROLES role"""
+    import time
+    from config.job_roles import JOB_ROLES
+    from utils.resume_analyzer import ResumeAnalyzer
+    from utils.role_matcher import RoleMatcher
+
+    analyzer = ResumeAnalyzer()
+    matcher = RoleMatcher(JOB_ROLES)
+    roles = [info for category in JOB_ROLES.values() for info in category.values()]
+    # Build the shared keyword automata outside the timed loops
+    matcher.rank_roles('')
+    for info in roles:
+        analyzer.calculate_keyword_match('', info['required_skills'])
+    rows = []
+    for repeat in args.sizes:
+        text = synthetic_resume(repeat)
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            analyzer.calculate_keyword_match(text, roles[0]['required_skills'])
+        one_role = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for info in roles:
+                analyzer.calculate_keyword_match(text, info['required_skills'])
+        each_role = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            matcher.rank_roles(text, top_k=None)
+        ranked = (time.perf_counter() - start) / args.repeat
+
+        rows.append({
+            'chars': len(text),
+            'roles': len(roles),
+            'one_role_seconds': one_role,
+            'loop_all_seconds': each_role,
+            'rank_all_seconds': ranked
+        })
+    print(f"Benchmarking role scoring, repeat={args.repeat}")
+    print_table(rows, ['chars', 'roles', 'one_role_seconds', 'loop_all_seconds', 'rank_all_seconds'])
+    return 0
+
+
+def bench_lexicon(args):
+    """Time a skill lexicon scan as the resume grows"""
+    import time
+    from utils.skills_lexicon import get_skill_lexicon
+
+    lexicon = get_skill_lexicon()
+    rows = []
+    for repeat in args.sizes:
+        text = synthetic_resume(repeat)
+        lower = text.lower()
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            ids = lexicon.find_ids(text, lower)
+        rows.append({'chars': len(text), 'skills_found': len(ids),
+                     'scan_seconds': (time.perf_counter() - start) / args.repeat})
+    print(f"Benchmarking skill lexicon scan, repeat={args.repeat}")
+    print_table(rows, ['chars', 'skills_found', 'scan_seconds'])
+    return 0
+
+
+def bench_parsed(args):
+    """Compare analyzer steps on raw text with the same steps on one ParsedResume"""
+    import time
+    import tracemalloc
+    from utils.parsed_resume import ParsedResume
+    from utils.resume_analyzer import ResumeAnalyzer
+
+    analyzer = ResumeAnalyzer()
+    required_skills = ['Python', 'SQL', 'Spark', 'Airflow', 'Docker', 'Java']
+
+    steps = [
+        analyzer.extract_personal_info,
+        analyzer.detect_document_type,
+        lambda resume: analyzer.calculate_keyword_match(resume, required_skills),
+        analyzer.extract_education,
+        analyzer.extract_experience,
+        analyzer.extract_projects,
+        analyzer.extract_skills,
+        analyzer.extract_summary,
+        analyzer.check_resume_sections,
+        analyzer.check_formatting
+    ]
+
+    def allocated_bytes(resume):
+        """Sum of each step's peak allocation: memory churned, not memory held"""
+        total = 0
+        for step in steps:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            step(resume)
+            total += tracemalloc.get_traced_memory()[1] - before
+        return total
+
+    rows = []
+    for repeat in args.sizes:
+        text = synthetic_resume(repeat)
+        for step in steps:
+            step(text)  # Build the shared keyword automata outside the measurements
+        for mode, prepare in (('raw text', lambda: text), ('ParsedResume', lambda: ParsedResume(text))):
+            tracemalloc.start()
+            allocated = allocated_bytes(prepare())
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                resume = prepare()
+                for step in steps:
+                    step(resume)
+            rows.append({
+                'lines': text.count('\n') + 1,
+                'input': mode,
+                'seconds': (time.perf_counter() - start) / args.repeat,
+                'allocated_kb': allocated / 1024
+            })
+    print(f"Benchmarking analyzer steps on raw text vs ParsedResume, repeat={args.repeat}")
+    print_table(rows, ['lines', 'input', 'seconds', 'allocated_kb'])
+    return 0
+
+
+def synthetic_candidates(count, vocabulary, seed=0):
+    """Yield (candidate_id, parsed) pairs with random skills from vocabulary"""
+    import random
+
+    rng = random.Random(seed)
+    fillers = ['agile', 'mentoring', 'stakeholder', 'reporting', 'migration', 'testing', 'optimization']
+    for candidate in range(count):
+        skills = rng.sample(vocabulary, rng.randint(5, 15))
+        text = (f"Engineer experienced in {skills[0]} and {rng.choice(vocabulary)}, "
+                f"focused on {' and '.join(rng.sample(fillers, 2))}.")
+        yield candidate, {'name': f"Candidate {candidate}", 'skills': skills, 'raw_text': text}
+
+
+def bench_screening(args):
+    """Time building a CandidateIndex and ranking it for every JOB_ROLES role"""
+    import time
+    from config.job_roles import JOB_ROLES
+    from utils.screening_engine import CandidateIndex
+
+    roles = [info for category in JOB_ROLES.values() for info in category.values()]
+    vocabulary = sorted({skill for info in roles for skill in info['required_skills']})
+    description = ("We are hiring a backend engineer to build APIs in Python and SQL, "
+                   "deploy services with Docker and design databases.")
+    rows = []
+    for count in args.sizes:
+        start = time.perf_counter()
+        index = CandidateIndex.from_resumes(synthetic_candidates(count, vocabulary), vocabulary)
+        index.top_candidates([], top_k=1)  # Freeze postings as part of the build
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for info in roles:
+            index.top_candidates(info['required_skills'], top_k=args.top_k)
+        role_seconds = (time.perf_counter() - start) / len(roles)
+
+        start = time.perf_counter()
+        index.search(description, top_k=args.top_k)
+        search_seconds = time.perf_counter() - start
+
+        rows.append({
+            'candidates': count,
+            'build_seconds': build_seconds,
+            'role_query_seconds': role_seconds,
+            'description_query_seconds': search_seconds
+        })
+    print(f"Benchmarking candidate screening, top_k={args.top_k}")
+    print_table(rows, ['candidates', 'build_seconds', 'role_query_seconds', 'description_query_seconds'])
+    return 0
+
+
+def bench_results(args):
+    """Compare the memory held by analysis result dicts and their compact forms"""
+    import gc
+    import pickle
+    import tracemalloc
+    from config.job_roles import JOB_ROLES
+    from utils.analysis_results import ResumeAnalysis
+    from utils.analyzer import ResumeAnalyzer as ProfileAnalyzer
+    from utils.resume_analyzer import ResumeAnalyzer
+
+    analyzer = ResumeAnalyzer(use_cache=False)
+    roles = [info for category in JOB_ROLES.values() for info in category.values()]
+    texts = synthetic_resumes(args.count)
+    # Results arrive pickled from batch workers, so nothing is shared between them
+    blobs = [
+        pickle.dumps(analyzer.analyze_resume({'raw_text': text}, roles[index % len(roles)]))
+        for index, text in enumerate(texts)
+    ]
+
+    # Profile results are built in this process by analyze_batch
+    profile_analyzer = ProfileAnalyzer(use_cache=False)
+    list(profile_analyzer.analyze_batch(texts))  # Fill the vocab before measuring
+
+    def held_bytes(build):
+        gc.collect()
+        tracemalloc.start()
+        held = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del held
+        return size
+
+    rows = []
+    for analyzer_name, form, build in (
+            ('resume_analyzer', 'dict', lambda: [pickle.loads(blob) for blob in blobs]),
+            ('resume_analyzer', 'ResumeAnalysis',
+             lambda: [ResumeAnalysis.from_dict(pickle.loads(blob)) for blob in blobs]),
+            ('analyzer', 'dict', lambda: list(profile_analyzer.analyze_batch(texts))),
+            ('analyzer', 'ProfileAnalysis', lambda: list(profile_analyzer.analyze_batch(texts, compact=True)))):
+        size = held_bytes(build)
+        rows.append({'analyzer': analyzer_name, 'form': form, 'results': args.count,
+                     'total_kb': size / 1024, 'bytes_per_result': size / args.count})
+    print("Benchmarking memory held by analysis results")
+    print_table(rows, ['analyzer', 'form', 'results', 'total_kb', 'bytes_per_result'])
+    return 0
+
+
+_NLP_LOAD_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+from utils.nlp_models import current_rss_mb, get_nlp
+rss_before = current_rss_mb()
+start = time.perf_counter()
+if {full}:
+    import spacy
+    nlp = spacy.load({model!r})
+else:
+    nlp = get_nlp({model!r})
+load_seconds = time.perf_counter() - start
+text = {text!r}
+start = time.perf_counter()
+for _ in range({repeat}):
+    sentences = len(list(nlp(text).sents))
+print(json.dumps({{'load_seconds': load_seconds, 'rss_delta_mb': current_rss_mb() - rss_before,
+                  'doc_ms': (time.perf_counter() - start) * 1000 / {repeat},
+                  'pipeline': ','.join(nlp.pipe_names), 'sentences': sentences}}))
+"""
+
+
+def bench_nlp(args):
+    """Compare a full spaCy model load with the shared trimmed pipeline, each in a fresh process"""
+    import json
+    import subprocess
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    rows = []
+    for label, full in (('spacy.load', True), ('get_nlp', False)):
+        script = _NLP_LOAD_SCRIPT.format(root=root, full=full, model=args.model,
+                                         text=synthetic_resume(args.size), repeat=args.repeat)
+        proc = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"{label} failed: {proc.stderr.strip().splitlines()[-1]}")
+            continue
+        row = json.loads(proc.stdout.strip().splitlines()[-1])
+        row['loader'] = label
+        rows.append(row)
+    print(f"Benchmarking spaCy pipeline load for {args.model}")
+    print_table(rows, ['loader', 'pipeline', 'load_seconds', 'rss_delta_mb', 'doc_ms', 'sentences'])
+    return 0
+
+
+def bench_profile_batch(args):
+    """Compare per-document profile analysis with batched nlp.pipe analysis"""
+    import time
+    from utils.analyzer import ResumeAnalyzer
+
+    analyzer = ResumeAnalyzer(use_cache=False)
+    texts = synthetic_resumes(args.count)
+
+    start = time.perf_counter()
+    for text in texts:
+        analyzer.analyze_resume(text)
+    rows = [{'method': 'analyze_resume', 'n_process': 1, 'seconds': time.perf_counter() - start}]
+    for n_process in args.processes:
+        start = time.perf_counter()
+        for _ in analyzer.analyze_batch(texts, batch_size=args.batch_size, n_process=n_process):
+            pass
+        rows.append({'method': 'analyze_batch', 'n_process': n_process, 'seconds': time.perf_counter() - start})
+    for row in rows:
+        row['docs_per_second'] = args.count / row['seconds']
+    print(f"Benchmarking profile analysis of {args.count} resumes, batch_size={args.batch_size}")
+    print_table(rows, ['method', 'n_process', 'seconds', 'docs_per_second'])
+    return 0
+
+
+def bench_profile_skills(args):
+    """Time profile matching as the skill vocabulary grows"""
+    import time
+    from utils.nlp_models import get_nlp
+    from utils.profile_matcher import ProfileMatcher
+    from utils.skills_lexicon import SKILLS, SkillLexicon
+
+    nlp = get_nlp()
+    docs = list(nlp.pipe(synthetic_resumes(args.count)))
+    rows = []
+    for extra in args.extra:
+        synthetic = tuple((f'Skill{index} Framework', 'Other', (f'sk{index}',), ()) for index in range(extra))
+        start = time.perf_counter()
+        matcher = ProfileMatcher(nlp, SkillLexicon(SKILLS + synthetic))
+        compile_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        for doc in docs:
+            matcher(doc)
+        rows.append({'skills': len(SKILLS) + extra, 'compile_seconds': compile_seconds,
+                     'ms_per_doc': (time.perf_counter() - start) * 1000 / len(docs)})
+    print(f"Benchmarking profile matching over {args.count} documents")
+    print_table(rows, ['skills', 'compile_seconds', 'ms_per_doc'])
+    return 0
+
+
+def bench_doc_cache(args):
+    """Compare re-analysing resumes by parsing them again and by loading cached Docs"""
+    import tempfile
+    import time
+    from utils.analyzer import ResumeAnalyzer
+    from utils.doc_cache import DocCache
+
+    texts = synthetic_resumes(args.count, args.size)
+    uncached = ResumeAnalyzer(use_cache=False)
+    cached = ResumeAnalyzer(use_cache=False)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cached.doc_cache = DocCache(os.path.join(tmp, 'doc_cache.db'), max_disk_entries=args.count)
+        for label, analyzer in (('parse', uncached), ('cache fill', cached), ('cache hit', cached)):
+            read = 0
+
+            def source():
+                nonlocal read
+                for text in texts:
+                    read += 1
+                    yield text
+
+            start = time.perf_counter()
+            cpu_start = time.process_time()
+            results = []
+            read_ahead = 0
+            # Texts read from the input beyond those yielded, bounded by the batch size
+            for result in analyzer.analyze_batch(source(), batch_size=args.batch_size):
+                results.append(result)
+                read_ahead = max(read_ahead, read - len(results))
+            rows.append({'run': label, 'seconds': time.perf_counter() - start,
+                         'cpu_seconds': time.process_time() - cpu_start,
+                         'max_read_ahead': read_ahead,
+                         'sentences': sum(result['metrics']['sentence_count'] for result in results)})
+        stats = cached.doc_cache.stats()
+        db_size = os.path.getsize(os.path.join(tmp, 'doc_cache.db'))
+    print(f"Benchmarking Doc cache, {args.count} resumes, {db_size / 1024:.0f} KB on disk, "
+          f"hit ratio {stats['hit_ratio']:.2f}")
+    print_table(rows, ['run', 'seconds', 'cpu_seconds', 'max_read_ahead', 'sentences'])
+    return 0
+
+
+def main():
+    """Parse the command line and run the selected benchmark"""
+    parser = argparse.ArgumentParser(description="Smart AI Resume Analyzer benchmarks")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    extraction = subparsers.add_parser('extraction', help="Compare text extraction backends")
+    extraction.add_argument('corpus', help="Directory (or single file) of PDF/DOCX resumes")
+    extraction.add_argument('--repeat', type=int, default=1, help="Runs per file and backend")
+    extraction.set_defaults(func=bench_extraction)
+
+    docx_parser = subparsers.add_parser('docx', help="Compare streaming DOCX extraction with python-docx")
+    docx_parser.add_argument('corpus', help="Directory (or single file) of DOCX resumes")
+    docx_parser.add_argument('--repeat', type=int, default=3, help="Runs per file and extractor")
+    docx_parser.set_defaults(func=bench_docx)
+
+    sections = subparsers.add_parser('sections', help="Compare single-pass section segmentation with per-section scans")
+    add_size_args(sections)
+    sections.set_defaults(func=bench_sections)
+
+    roles = subparsers.add_parser('roles', help="Compare one-role keyword matching with ranking every role")
+    add_size_args(roles)
+    roles.set_defaults(func=bench_roles)
+
+    lexicon = subparsers.add_parser('lexicon', help="Time a skill lexicon scan as the resume grows")
+    add_size_args(lexicon)
+    lexicon.set_defaults(func=bench_lexicon)
+
+    parsed = subparsers.add_parser('parsed', help="Compare analyzer steps on raw text and on a shared ParsedResume")
+    add_size_args(parsed)
+    parsed.set_defaults(func=bench_parsed)
+
+    screening = subparsers.add_parser('screening', help="Time top-K candidate ranking over synthetic resumes")
+    screening.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                           help="Numbers of synthetic candidates to index")
+    screening.add_argument('--top-k', type=int, default=10, help="Candidates returned per query")
+    screening.set_defaults(func=bench_screening)
+
+    results = subparsers.add_parser('results', help="Compare memory per analysis result as dicts and compact objects")
+    results.add_argument('--count', type=int, default=2000, help="Number of results to hold")
+    results.set_defaults(func=bench_results)
+
+    nlp = subparsers.add_parser('nlp', help="Compare a full spaCy model load with the shared trimmed pipeline")
+    nlp.add_argument('--model', default='en_core_web_sm', help="spaCy model package")
+    add_size_args(nlp, sizes=10, repeat=20, repeat_help="Documents processed after loading")
+    nlp.set_defaults(func=bench_nlp)
+
+    profile_batch = subparsers.add_parser('profile-batch', help="Compare per-document and batched profile analysis")
+    profile_batch.add_argument('--count', type=int, default=1000, help="Number of synthetic resumes")
+    profile_batch.add_argument('--batch-size', type=int, default=64, help="Documents per nlp.pipe batch")
+    profile_batch.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4],
+                               help="n_process values to try")
+    profile_batch.set_defaults(func=bench_profile_batch)
+
+    profile_skills = subparsers.add_parser('profile-skills', help="Time profile matching as the skill vocabulary grows")
+    profile_skills.add_argument('--count', type=int, default=300, help="Number of synthetic resumes")
+    profile_skills.add_argument('--extra', type=int, nargs='+', default=[0, 1000, 10000],
+                                help="Synthetic skills added to the lexicon")
+    profile_skills.set_defaults(func=bench_profile_skills)
+
+    doc_cache = subparsers.add_parser('doc-cache', help="Compare re-parsing resumes with loading cached Docs")
+    doc_cache.add_argument('--count', type=int, default=1000, help="Number of synthetic resumes")
+    add_size_args(doc_cache, sizes=10, repeat=None)
+    doc_cache.add_argument('--batch-size', type=int, default=64, help="Documents per lookup and nlp.pipe batch")
+    doc_cache.set_defaults(func=bench_doc_cache)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+from .parsed_resume import ParsedResume
+
+# Order of the rendered sections in the builder's document
+FORM_SECTIONS = ('contact', 'summary', 'experience', 'education', 'projects', 'skills')
+
+_SECTION_HEADERS = {
+    'summary': 'PROFESSIONAL SUMMARY',
+    'experience': 'EXPERIENCE',
+    'education': 'EDUCATION',
+    'projects': 'PROJECTS',
+    'skills': 'SKILLS'
+}
+
+_SKILL_CATEGORIES = (
+    ('technical', 'Technical Skills'),
+    ('soft', 'Soft Skills'),
+    ('languages', 'Languages'),
+    ('tools', 'Tools & Technologies')
+)
+
+
+def _lines(*values):
+    return [value.strip() for value in values if value and value.strip()]
+
+
+def _bullets(items):
+    return [f"• {item.strip()}" for item in items or [] if item and item.strip()]
+
+
+def _join(*parts, separator=' - '):
+    return separator.join(part.strip() for part in parts if part and part.strip())
+
+
+def render_form_sections(form_data):
+    """Render builder form data ({section: entries}) the way the resume document lays it out.
+
+    Returns a dict with the entry strings of every FORM_SECTIONS section;
+    summary has at most one entry and skills one per non-empty category.
+    """
+    info = form_data.get('personal_info', {})
+    contact = _lines(
+        info.get('full_name', ''),
+        _join(info.get('email', ''), info.get('phone', ''), info.get('location', ''), separator=' | '),
+        info.get('linkedin', ''),
+        info.get('portfolio', '')
+    )
+
+    experience = []
+    for exp in form_data.get('experiences', []):
+        entry = _lines(
+            _join(exp.get('position', ''), exp.get('company', '')),
+            _join(exp.get('start_date', ''), exp.get('end_date', '')),
+            exp.get('description', '')
+        ) + _bullets(exp.get('responsibilities')) + _bullets(exp.get('achievements'))
+        if entry:
+            experience.append('\n'.join(entry))
+
+    education = []
+    for edu in form_data.get('education', []):
+        entry = _lines(
+            _join(edu.get('degree', ''), edu.get('field', ''), separator=' in '),
+            edu.get('school', ''),
+            edu.get('graduation_date', ''),
+            f"GPA: {edu['gpa'].strip()}" if edu.get('gpa', '').strip() else ''
+        ) + _bullets(edu.get('achievements'))
+        if entry:
+            education.append('\n'.join(entry))
+
+    projects = []
+    for proj in form_data.get('projects', []):
+        entry = _lines(
+            proj.get('name', ''),
+            f"Technologies: {proj['technologies'].strip()}" if proj.get('technologies', '').strip() else '',
+            proj.get('description', '')
+        ) + _bullets(proj.get('responsibilities')) + _bullets(proj.get('achievements')) + _lines(proj.get('link', ''))
+        if entry:
+            projects.append('\n'.join(entry))
+
+    categories = form_data.get('skills_categories', {})
+    skills = [
+        f"{title}: {', '.join(categories[key])}"
+        for key, title in _SKILL_CATEGORIES if categories.get(key)
+    ]
+
+    return {
+        'contact': ['\n'.join(contact)] if contact else [],
+        'summary': _lines(form_data.get('summary', '')),
+        'experience': experience,
+        'education': education,
+        'projects': projects,
+        'skills': skills
+    }
+
+
+def section_text(name, entries):
+    """Return the document text of one rendered section ('' when it has no entries)"""
+    if not entries:
+        return ''
+    header = _SECTION_HEADERS.get(name)
+    return '\n'.join(([header] if header else []) + entries)
+
+
+def form_skills(form_data):
+    """Return every skill listed in the form, in category order without duplicates"""
+    categories = form_data.get('skills_categories', {})
+    skills = []
+    for key, _ in _SKILL_CATEGORIES:
+        for skill in categories.get(key, []):
+            if skill and skill not in skills:
+                skills.append(skill)
+    return skills
+
+
+def combine_format_facts(facts_list):
+    """Combine ResumeAnalyzer.format_facts of texts as if they were joined with newlines"""
+    combined = {
+        'length': sum(facts['length'] for facts in facts_list) + len(facts_list) - 1,
+        'has_headers': any(facts['has_headers'] for facts in facts_list),
+        'has_bullets': any(facts['has_bullets'] for facts in facts_list),
+        'blank_run': any(facts['blank_run'] for facts in facts_list),
+        'starts_blank': facts_list[0]['starts_blank'],
+        'ends_blank': facts_list[-1]['ends_blank'],
+        'has_contact_format': any(facts['has_contact_format'] for facts in facts_list)
+    }
+    # A blank line ending one text and one starting the next meet at the join
+    combined['blank_run'] = combined['blank_run'] or any(
+        previous['ends_blank'] and following['starts_blank']
+        for previous, following in zip(facts_list, facts_list[1:])
+    )
+    return combined
+
+
+class IncrementalAnalyzer:
+    """Re-scores the resume builder form, recomputing only what an edit touched.
+
+    Every section of the form is rendered to text and kept with its
+    ParsedResume, so an unchanged section is never rescanned. Each
+    sub-score (contact, summary, skills, experience, education, format) is
+    cached with the inputs it was computed from and recomputed only when
+    those change; ats_score is then rebuilt from the cached sub-scores.
+    The scoring rules are ResumeAnalyzer's own, so live scores match what
+    a full analysis reports for the same sections.
+    """
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self._sections = {}    # section -> (text, ParsedResume, format facts)
+        self._sub_scores = {}  # sub-score -> (inputs, (score, suggestions))
+        self.recomputed = []   # Sub-scores recomputed by the last analyze() call
+
+    def _section(self, name, text):
+        cached = self._sections.get(name)
+        if cached is None or cached[0] != text:
+            parsed = ParsedResume(text)
+            cached = (text, parsed, self.analyzer.format_facts(parsed))
+            self._sections[name] = cached
+        return cached
+
+    def _sub_score(self, name, inputs, compute):
+        cached = self._sub_scores.get(name)
+        if cached is None or cached[0] != inputs:
+            cached = (inputs, compute())
+            self._sub_scores[name] = cached
+            self.recomputed.append(name)
+        return cached[1]
+
+    def analyze(self, form_data, job_requirements):
+        """Return an analyze_resume-style result for the form, reusing unchanged work"""
+        self.recomputed = []
+        rendered = render_form_sections(form_data)
+        sections = {name: self._section(name, section_text(name, rendered[name])) for name in FORM_SECTIONS}
+        present = [sections[name] for name in FORM_SECTIONS if sections[name][0]]
+        if not present:
+            present = [self._section('empty', '')]
+
+        # Keyword hits and skill IDs of the whole document are the union of every section's
+        required_skills = job_requirements.get('required_skills', [])
+        keywords = self.analyzer.document_keywords + tuple(required_skills)
+        keyword_hits = frozenset().union(*(parsed.keywords_in(keywords) for _, parsed, _ in present))
+        skill_ids = frozenset().union(*(parsed.skill_ids for _, parsed, _ in present))
+        keyword_match = self.analyzer.calculate_keyword_match(None, required_skills, keyword_hits, skill_ids)
+
+        contact_text, contact, _ = sections['contact']
+        personal_info = self.analyzer.extract_personal_info(contact)
+        summary = rendered['summary'][0] if rendered['summary'] else ''
+        skills = form_skills(form_data)
+        format_facts = combine_format_facts([facts for _, _, facts in present])
+
+        def format_score():
+            score, deductions = self.analyzer.score_format_facts(format_facts)
+            return score, deductions if score < 100 else []
+
+        sub_scores = {
+            'contact': self._sub_score('contact', contact_text,
+                                       lambda: self.analyzer.contact_score(personal_info)),
+            'summary': self._sub_score('summary', summary,
+                                       lambda: self.analyzer.summary_score(summary)),
+            'skills': self._sub_score('skills', (tuple(skills), keyword_match['score']),
+                                      lambda: self.analyzer.skills_score(skills, keyword_match)),
+            'experience': self._sub_score('experience', sections['experience'][0],
+                                          lambda: self.analyzer.experience_score(rendered['experience'])),
+            'education': self._sub_score('education', (sections['education'][0], job_requirements.get('require_gpa', False)),
+                                         lambda: self.analyzer.education_score(rendered['education'], job_requirements)),
+            'format': self._sub_score('format', tuple(sorted(format_facts.items())), format_score)
+        }
+        section_score = self._sub_score('section_check', keyword_hits,
+                                        lambda: self.analyzer.check_resume_sections(None, keyword_hits))
+
+        result_sections = {
+            'education': rendered['education'],
+            'experience': rendered['experience'],
+            'projects': rendered['projects'],
+            'skills': skills,
+            'summary': summary
+        }
+        return self.analyzer.compose_result(personal_info, keyword_match, section_score,
+                                            result_sections, sub_scores)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Bulk resume screening for Smart AI Resume Analyzer
+Extracts and analyzes every PDF/DOCX resume in a directory or zip file
+against one JOB_ROLES role and streams the results to JSONL or CSV.
+
+Example:
+    python bulk_screen.py resumes.zip --role "Data Scientist" --output results.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+
+RESULT_FIELDS = [
+    'file', 'name', 'email', 'phone', 'document_type', 'ats_score',
+    'keyword_match_score', 'found_skills', 'missing_skills',
+    'format_score', 'section_score', 'extraction_backend', 'error'
+]
+
+# Per-process state, created once by the pool initializer
+_analyzer = None
+_engine = None
+
+
+def find_role(role_name, category=None):
+    """Return (category, role_info) for a JOB_ROLES role name"""
+    from config.job_roles import JOB_ROLES
+
+    for role_category, roles in JOB_ROLES.items():
+        if category and role_category != category:
+            continue
+        if role_name in roles:
+            return role_category, roles[role_name]
+    raise SystemExit(f"Unknown role: {role_name}")
+
+
+def iter_inputs(source):
+    """Yield (file_id, path, member) for every resume in a directory or zip.
+
+    For zip files path is the archive and member the entry inside it.
+    """
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for member in sorted(archive.namelist()):
+                if member.lower().endswith(RESUME_EXTENSIONS) and not member.endswith('/'):
+                    yield f"{os.path.basename(source)}:{member}", source, member
+        return
+
+    for root, _, names in os.walk(source):
+        for name in sorted(names):
+            if name.lower().endswith(RESUME_EXTENSIONS):
+                path = os.path.join(root, name)
+                yield os.path.relpath(path, source), path, None
+
+
+def _init_worker():
+    global _analyzer, _engine
+    from utils.extraction_engine import create_default_engine
+    from utils.resume_analyzer import ResumeAnalyzer
+
+    _analyzer = ResumeAnalyzer(use_cache=False)
+    # Every file is screened once, and pool workers cannot start nested process pools
+    _engine = create_default_engine(use_cache=False, parallel=False)
+
+
+def screen_file(file_id, path, member, role_info):
+    """Extract and analyze one resume; runs in a pool worker"""
+    row = {'file': file_id}
+    try:
+        if member is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        else:
+            with zipfile.ZipFile(path) as archive:
+                data = archive.read(member)
+
+        extraction = _engine.extract(data, member or path)
+        row['extraction_backend'] = extraction['backend']
+        if not extraction['text']:
+            row['error'] = "Could not extract any text"
+            return row
+
+        analysis = _analyzer.analyze_resume({'raw_text': extraction['text']}, role_info)
+        row.update({
+            'name': analysis.get('name', ''),
+            'email': analysis.get('email', ''),
+            'phone': analysis.get('phone', ''),
+            'document_type': analysis.get('document_type'),
+            'ats_score': analysis.get('ats_score', 0),
+            'keyword_match_score': analysis['keyword_match']['score'],
+            'found_skills': analysis['keyword_match']['found_skills'],
+            'missing_skills': analysis['keyword_match']['missing_skills'],
+            'format_score': analysis.get('format_score', 0),
+            'section_score': analysis.get('section_score', 0),
+            'error': analysis.get('error', '')
+        })
+    except Exception as e:
+        row['error'] = str(e)
+    return row
+
+
+class ResultWriter:
+    """Appends result rows to a JSONL or CSV file as they arrive"""
+
+    def __init__(self, path):
+        self.path = path
+        self.is_csv = path.lower().endswith('.csv')
+        write_header = self.is_csv and not os.path.exists(path)
+        self.file = open(path, 'a', newline='', encoding='utf-8')
+        if self.is_csv:
+            self.writer = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+            if write_header:
+                self.writer.writeheader()
+
+    def write(self, row):
+        if self.is_csv:
+            flat = {field: row.get(field, '') for field in RESULT_FIELDS}
+            for field in ('found_skills', 'missing_skills'):
+                flat[field] = ', '.join(row.get(field) or [])
+            self.writer.writerow(flat)
+        else:
+            self.file.write(json.dumps(row) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def load_manifest(path):
+    """Return the set of file ids already processed in an earlier run"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding='utf-8') as f:
+        return {line.rstrip('\n') for line in f if line.strip()}
+
+
+def run(args):
+    """Screen every pending resume and return the number processed"""
+    category, role_info = find_role(args.role, args.category)
+    manifest_path = args.manifest or args.output + '.manifest'
+    done = load_manifest(manifest_path)
+    pending = [item for item in iter_inputs(args.source) if item[0] not in done]
+
+    print(f"Screening {len(pending)} resume(s) for {args.role} ({category}); "
+          f"{len(done)} already processed")
+    if not pending:
+        return 0
+
+    writer = ResultWriter(args.output)
+    manifest = open(manifest_path, 'a', encoding='utf-8')
+    start = time.perf_counter()
+    processed = 0
+    next_report = args.progress_every
+    # Bound the number of queued jobs so large batches don't sit in memory
+    window = args.workers * 4
+    items = iter(pending)
+
+    def new_pool():
+        return ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker)
+
+    pool = new_pool()
+    try:
+        in_flight = {}      # future -> item
+        suspects = deque()  # Items lost in a crash, re-run alone to find the culprit
+        while True:
+            if suspects:
+                if not in_flight:
+                    item = suspects.popleft()
+                    in_flight[pool.submit(screen_file, *item, role_info)] = item
+            else:
+                while len(in_flight) < window:
+                    item = next(items, None)
+                    if item is None:
+                        break
+                    in_flight[pool.submit(screen_file, *item, role_info)] = item
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            rows = []
+            lost = []
+            for future in finished:
+                item = in_flight.pop(future)
+                try:
+                    rows.append(future.result())
+                except BrokenProcessPool:
+                    # A worker died (OOM kill, crash in a PDF library)
+                    lost.append(item)
+
+            if lost:
+                # A dead worker takes the whole pool down; keep what finished
+                for future, item in in_flight.items():
+                    if future.done() and future.exception() is None:
+                        rows.append(future.result())
+                    else:
+                        lost.append(item)
+                in_flight.clear()
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = new_pool()
+                if len(lost) == 1:
+                    # Alone in the pool, so this file is what killed the worker
+                    rows.append({'file': lost[0][0], 'error': "Worker process crashed"})
+                else:
+                    suspects.extend(lost)
+
+            for row in rows:
+                writer.write(row)
+                # Only record a file once its result is safely written
+                manifest.write(row['file'] + '\n')
+                manifest.flush()
+                processed += 1
+
+            if processed >= next_report:
+                elapsed = time.perf_counter() - start
+                print(f"  {processed}/{len(pending)} files, {processed / elapsed:.1f} files/sec")
+                next_report = (processed // args.progress_every + 1) * args.progress_every
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        writer.close()
+        manifest.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Done: {processed} file(s) in {elapsed:.1f}s ({processed / elapsed:.1f} files/sec)")
+    print(f"Results written to {args.output}")
+    return processed
+
+
+def main():
+    """Parse the command line and run bulk screening"""
+    parser = argparse.ArgumentParser(description="Bulk-screen resumes against a job role")
+    parser.add_argument('source', help="Directory or .zip file of PDF/DOCX resumes")
+    parser.add_argument('--role', required=True, help="Role name from JOB_ROLES, e.g. 'Data Scientist'")
+    parser.add_argument('--category', help="JOB_ROLES category, if the role name is ambiguous")
+    parser.add_argument('--output', default='screening_results.jsonl',
+                        help="Output file; .csv writes CSV, anything else JSONL")
+    parser.add_argument('--manifest', help="Processed-file manifest (default: <output>.manifest)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument('--progress-every', type=int, default=25, help="Report throughput every N files")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        print(f"Input not found: {args.source}")
+        sys.exit(1)
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
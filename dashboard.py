@@ -4,10 +4,15 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from config.database import get_database_connection
+from utils.llm_cache import get_llm_cache
+from utils.nlp_models import model_stats
+from utils.profiling import get_stage_histograms
+from utils.skills_lexicon import get_skill_lexicon, skills_from_column
 import io
 import uuid
 from plotly.subplots import make_subplots
 from io import BytesIO
+from collections import Counter
 
 class DashboardManager:
     def __init__(self):
@@ -157,47 +162,21 @@ class DashboardManager:
         return metrics
 
     def get_skill_distribution(self):
-        """Get skill distribution data"""
+        """Get skill distribution data, categorized by the canonical skills lexicon"""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            WITH RECURSIVE split(skill, rest) AS (
-                SELECT '', skills || ','
-                FROM resume_data
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split
-                WHERE rest <> ''
-            ),
-            SkillCategories AS (
-                SELECT 
-                    CASE 
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%python%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%java%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%javascript%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%c++%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%programming%' THEN 'Programming'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%sql%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%database%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%mongodb%' THEN 'Database'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%aws%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%cloud%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%azure%' THEN 'Cloud'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%agile%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%scrum%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%management%' THEN 'Management'
-                        ELSE 'Other'
-                    END as category,
-                    COUNT(*) as count
-                FROM split
-                WHERE skill <> ''
-                GROUP BY category
-            )
-            SELECT category, count
-            FROM SkillCategories
-            ORDER BY count DESC
-        """)
+        cursor.execute("SELECT skills FROM resume_data WHERE skills IS NOT NULL AND skills <> ''")
+        
+        lexicon = get_skill_lexicon()
+        category_counts = Counter(
+            lexicon.category_of(skill)
+            for (skills,) in cursor.fetchall()
+            for skill in skills_from_column(skills)
+        )
         
         categories, counts = [], []
-        for row in cursor.fetchall():
-            categories.append(row[0])
-            counts.append(row[1])
+        for category, count in category_counts.most_common():
+            categories.append(category)
+            counts.append(count)
             
         return categories, counts
 
@@ -474,6 +453,94 @@ class DashboardManager:
         else:
             st.info("No admin activity logs available")
 
+        # Render analysis timing section
+        self.render_performance_section()
+
+    def render_performance_section(self):
+        """Render per-stage analysis timings recorded by profiled analyses"""
+        st.markdown("<h2 class='section-title'>Analysis Performance</h2>", unsafe_allow_html=True)
+
+        llm_stats = get_llm_cache().stats()
+        if llm_stats['entries'] or llm_stats['hits'] + llm_stats['misses']:
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("AI Responses Cached", llm_stats['entries'])
+            col2.metric("AI Cache Hit Ratio", f"{llm_stats['hit_ratio']:.0%}")
+            col3.metric("Cached Responses Served", llm_stats['total_hits'])
+            col4.metric("Tokens Saved (est.)", f"{llm_stats['total_saved_tokens']:,}")
+
+        models = model_stats()
+        if models:
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        'Model': name,
+                        'Pipeline': ', '.join(stats['pipeline']),
+                        'Load Time (s)': round(stats['load_seconds'], 2),
+                        'RSS Growth (MB)': round(stats['rss_delta_mb'], 1),
+                        'Fallback': stats['fallback']
+                    }
+                    for name, stats in models.items()
+                ]),
+                use_container_width=True,
+                hide_index=True
+            )
+
+        histograms = get_stage_histograms()
+        rows = histograms.summary()
+        if not rows:
+            st.info("No profiled analyses yet. Set RESUME_PROFILING=1 to record stage timings.")
+            return
+
+        df = pd.DataFrame(rows).sort_values(['analyzer', 'mean_wall_ms'], ascending=[True, False])
+        st.dataframe(
+            df.rename(columns={
+                'analyzer': 'Analyzer',
+                'stage': 'Stage',
+                'count': 'Runs',
+                'mean_wall_ms': 'Mean Wall (ms)',
+                'p50_wall_ms': 'p50 Wall (ms)',
+                'p95_wall_ms': 'p95 Wall (ms)',
+                'max_wall_ms': 'Max Wall (ms)',
+                'mean_cpu_ms': 'Mean CPU (ms)'
+            }).round(2),
+            use_container_width=True,
+            hide_index=True
+        )
+
+        options = [(row['analyzer'], row['stage']) for row in rows]
+        analyzer, stage = st.selectbox(
+            "Stage histogram",
+            options,
+            format_func=lambda option: f"{option[0]} / {option[1]}",
+            key="profile_stage_histogram"
+        )
+        labels, counts = zip(*histograms.buckets(analyzer, stage))
+        fig = go.Figure(data=[
+            go.Bar(
+                x=labels,
+                y=counts,
+                marker_color=self.colors['secondary'],
+                text=counts,
+                textposition='auto',
+            )
+        ])
+        fig.update_layout(
+            title={
+                'text': f'Wall Time: {stage}',
+                'y': 0.95,
+                'x': 0.5,
+                'xanchor': 'center',
+                'yanchor': 'top'
+            },
+            height=350,
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color=self.colors['text']),
+            margin=dict(l=40, r=40, t=60, b=40),
+            yaxis=dict(gridcolor='rgba(255,255,255,0.1)', zeroline=False)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
     def export_to_excel(self):
         """Export data to Excel format"""
         query = """
@@ -256,6 +256,24 @@ def get_all_resume_data():
     finally:
         conn.close()
 
+def get_resumes_for_screening():
+    """Get the stored resumes' skills and text for bulk candidate ranking"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        SELECT id, name, email, target_role, skills, summary, experience
+        FROM resume_data
+        ORDER BY id
+        ''')
+        return cursor.fetchall()
+    except Exception as e:
+        print(f"Error getting resumes for screening: {str(e)}")
+        return []
+    finally:
+        conn.close()
+
 def verify_admin(email, password):
     """Verify admin credentials"""
     conn = get_database_connection()
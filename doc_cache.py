@@ -0,0 +1,225 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import deque
+from itertools import islice
+
+from spacy.tokens import DocBin
+
+from .nlp_models import model_version
+
+DEFAULT_CACHE_PATH = 'doc_cache.db'
+
+# Token text, whitespace and sentence boundaries are all the analyzers read
+DOC_ATTRS = ('ORTH', 'SPACY', 'SENT_START')
+
+
+class DocCache:
+    """On-disk (SQLite) cache of parsed spaCy Docs, serialized with DocBin.
+
+    Entries are keyed by the SHA-256 of the text plus the model_version of
+    the pipeline that parsed it, so a new model, spaCy release or pipe
+    layout never reads Docs produced by another. Only DOC_ATTRS are
+    stored, keeping entries small; a cached Doc is rebuilt against the
+    pipeline's vocab, so lexical attributes such as like_num work as on a
+    freshly parsed one.
+    """
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, max_disk_entries=5000):
+        self.db_path = db_path
+        self.max_disk_entries = max_disk_entries
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'disk_evictions': 0
+        }
+        self._disk_enabled = db_path is not None
+        if self._disk_enabled:
+            self._init_disk()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_disk(self):
+        """Create the cache table, disabling the cache on failure"""
+        try:
+            conn = self._connect()
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS doc_cache (
+                cache_key TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                last_access REAL NOT NULL
+            )
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_doc_cache_access
+            ON doc_cache (last_access)
+            ''')
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"Doc cache disabled: {str(e)}")
+            self._disk_enabled = False
+
+    @staticmethod
+    def make_key(text, version):
+        """Build the cache key for a text and a pipeline's model_version"""
+        return f"{hashlib.sha256(text.encode('utf-8')).hexdigest()}:{version}"
+
+    def get_many(self, vocab, keys):
+        """Return the cached Doc (or None) for every key, read in one query"""
+        docs = [None] * len(keys)
+        if self._disk_enabled and keys:
+            try:
+                conn = self._connect()
+                try:
+                    placeholders = ','.join('?' * len(keys))
+                    rows = dict(conn.execute(
+                        f'SELECT cache_key, data FROM doc_cache WHERE cache_key IN ({placeholders})', keys
+                    ).fetchall())
+                    if rows:
+                        conn.execute(
+                            f'UPDATE doc_cache SET last_access = ? WHERE cache_key IN ({placeholders})',
+                            (time.time(), *keys)
+                        )
+                        conn.commit()
+                finally:
+                    conn.close()
+                for index, key in enumerate(keys):
+                    if key in rows:
+                        docs[index] = next(DocBin().from_bytes(rows[key]).get_docs(vocab))
+            except (sqlite3.Error, ValueError) as e:
+                print(f"Doc cache read failed: {str(e)}")
+        hits = sum(doc is not None for doc in docs)
+        with self._lock:
+            self._stats['hits'] += hits
+            self._stats['misses'] += len(keys) - hits
+        return docs
+
+    def put_many(self, entries):
+        """Store (key, Doc) pairs in one transaction"""
+        if not self._disk_enabled:
+            return
+        now = time.time()
+        rows = [
+            (key, DocBin(attrs=DOC_ATTRS, docs=[doc]).to_bytes(), now)
+            for key, doc in entries
+        ]
+        if not rows:
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO doc_cache (cache_key, data, last_access) VALUES (?, ?, ?)',
+                    rows
+                )
+                cursor = conn.execute('''
+                DELETE FROM doc_cache WHERE cache_key IN (
+                    SELECT cache_key FROM doc_cache
+                    ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                ''', (self.max_disk_entries,))
+                conn.commit()
+                if cursor.rowcount > 0:
+                    with self._lock:
+                        self._stats['disk_evictions'] += cursor.rowcount
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Doc cache write failed: {str(e)}")
+
+    def parse(self, nlp, texts, batch_size=64, n_process=1):
+        """Yield a Doc per text in order, loading cached Docs and parsing the rest.
+
+        Texts are looked up batch_size at a time, one chunk after the
+        previous one has been yielded, so cached Docs come out at once and
+        at most about batch_size of them are held. Only the misses go
+        through nlp.pipe, and are then stored. With n_process > 1 a single
+        pipe is kept fed by looking further ahead (its workers start
+        once); in-process pipes are cheap to restart and only see the
+        misses already looked up. Exhaust the generator to store every miss.
+        """
+        version = model_version(nlp)
+        source = iter(texts)
+        pending = deque()  # (key, cached Doc or None) per looked-up text, in input order
+        queued = deque()   # Texts of pending misses not fed to nlp.pipe yet
+
+        def lookup():
+            """Look up the next chunk of texts; False once the input is exhausted"""
+            chunk = list(islice(source, batch_size))
+            if not chunk:
+                return False
+            keys = [self.make_key(text, version) for text in chunk]
+            for key, text, doc in zip(keys, chunk, self.get_many(nlp.vocab, keys)):
+                pending.append((key, doc))
+                if doc is None:
+                    queued.append(text)
+            return True
+
+        def feed():
+            while True:
+                while queued:
+                    yield queued.popleft()
+                if n_process == 1 or not lookup():
+                    return
+
+        parsed = None
+        new_entries = []
+        while pending or lookup():
+            key, doc = pending.popleft()
+            if doc is None:
+                # Misses are parsed in input order, so the next parsed Doc is this text's
+                doc = next(parsed, None) if parsed is not None else None
+                if doc is None:
+                    parsed = nlp.pipe(feed(), batch_size=batch_size, n_process=n_process)
+                    doc = next(parsed)
+                new_entries.append((key, doc))
+                if len(new_entries) >= batch_size:
+                    self.put_many(new_entries)
+                    new_entries = []
+            yield doc
+        self.put_many(new_entries)
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the number of cached Docs"""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        stats['disk_entries'] = 0
+        if self._disk_enabled:
+            try:
+                conn = self._connect()
+                stats['disk_entries'] = conn.execute('SELECT COUNT(*) FROM doc_cache').fetchone()[0]
+                conn.close()
+            except sqlite3.Error:
+                pass
+        return stats
+
+    def clear(self):
+        """Drop every cached Doc"""
+        if self._disk_enabled:
+            try:
+                conn = self._connect()
+                conn.execute('DELETE FROM doc_cache')
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"Doc cache clear failed: {str(e)}")
+
+
+_doc_cache = None
+_doc_cache_lock = threading.Lock()
+
+
+def get_doc_cache():
+    """Return the process-wide parsed Doc cache"""
+    global _doc_cache
+    if _doc_cache is None:
+        with _doc_cache_lock:
+            if _doc_cache is None:
+                _doc_cache = DocCache()
+    return _doc_cache
@@ -0,0 +1,126 @@
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+from .upload_buffer import UploadBuffer
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+# Separator between table cells on one output line; '|' is also one of the
+# skill separators ResumeAnalyzer.extract_skills understands
+CELL_SEPARATOR = ' | '
+
+_PART_NUMBER = re.compile(r'(\d+)\.xml$')
+
+
+def _part_order(name):
+    match = _PART_NUMBER.search(name)
+    return int(match.group(1)) if match else 0
+
+
+def _story_parts(names):
+    """Return headers, the main document and footers, in reading order"""
+    headers = sorted((n for n in names if re.match(r'word/header\d*\.xml$', n)), key=_part_order)
+    footers = sorted((n for n in names if re.match(r'word/footer\d*\.xml$', n)), key=_part_order)
+    return headers + ['word/document.xml'] + footers
+
+
+def _iter_part_lines(stream):
+    """Yield the text lines of one WordprocessingML part with an incremental parser.
+
+    Every paragraph becomes a line, including paragraphs inside text boxes;
+    each table row becomes one line with its cells joined by CELL_SEPARATOR.
+    Finished elements are detached from the tree as soon as they have been
+    read, so memory stays bounded by the deepest open element, not the
+    document size.
+    """
+    paragraphs = []  # Text fragments of each open paragraph (text boxes nest)
+    rows = []        # Cells of each open table row (tables nest)
+    cells = []       # Lines of each open table cell
+    elements = []
+    fallback_depth = 0
+
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            elements.append(elem)
+            if tag == MC + 'Fallback':
+                # mc:Fallback repeats the mc:Choice content (e.g. VML text boxes)
+                fallback_depth += 1
+            elif fallback_depth:
+                pass
+            elif tag == W + 'p':
+                paragraphs.append([])
+            elif tag == W + 'tr':
+                rows.append([])
+            elif tag == W + 'tc':
+                cells.append([])
+            continue
+
+        elements.pop()
+        if tag == MC + 'Fallback':
+            fallback_depth -= 1
+        elif fallback_depth:
+            pass
+        elif tag == W + 't':
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag in (W + 'tab', W + 'ptab'):
+            if paragraphs:
+                paragraphs[-1].append('\t')
+        elif tag in (W + 'br', W + 'cr'):
+            if paragraphs:
+                paragraphs[-1].append('\n')
+        elif tag == W + 'noBreakHyphen':
+            if paragraphs:
+                paragraphs[-1].append('-')
+        elif tag == W + 'p':
+            line = ''.join(paragraphs.pop())
+            if cells:
+                cells[-1].append(line)
+            else:
+                yield line
+        elif tag == W + 'tc':
+            cell_text = ' '.join(line for line in cells.pop() if line.strip())
+            if rows:
+                rows[-1].append(cell_text)
+        elif tag == W + 'tr':
+            line = CELL_SEPARATOR.join(cell for cell in rows.pop() if cell)
+            if cells:
+                cells[-1].append(line)
+            else:
+                yield line
+
+        if tag in (W + 'p', W + 'tbl', W + 'txbxContent') and elements:
+            # Detach the finished element so the parsed tree never grows
+            elements[-1].remove(elem)
+
+
+def iter_docx_lines(docx_file):
+    """Yield the text lines of a DOCX file: headers, body (with tables and
+    text boxes in reading order), then footers.
+
+    Header and footer lines already emitted by an earlier header/footer are
+    skipped, since first-page and default headers usually repeat each other.
+    """
+    buffer = UploadBuffer(docx_file)
+    with zipfile.ZipFile(buffer.stream()) as archive:
+        names = set(archive.namelist())
+        seen = set()
+        for part in _story_parts(names):
+            if part not in names:
+                continue
+            is_body = part == 'word/document.xml'
+            with archive.open(part) as stream:
+                for line in _iter_part_lines(stream):
+                    if not is_body:
+                        if line in seen:
+                            continue
+                        seen.add(line)
+                    yield line
+
+
+def extract_docx_text(docx_file):
+    """Return the full text of a DOCX file, one paragraph or table row per line"""
+    return '\n'.join(iter_docx_lines(docx_file))
@@ -0,0 +1,208 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from .upload_buffer import UploadBuffer
+
+DEFAULT_CACHE_PATH = 'extraction_cache.db'
+
+
+def read_file_bytes(file):
+    """Return the raw bytes of an uploaded file, a bytes object or a file path"""
+    return UploadBuffer(file).data
+
+
+class ExtractionCache:
+    """Two-tier (memory LRU + SQLite) cache of extracted document text.
+
+    Entries are keyed by the SHA-256 of the file bytes plus the version of
+    the extractor that produced the text, so bumping an extractor version
+    invalidates its old entries without touching the others.
+    """
+
+    def __init__(self, max_entries=128, db_path=DEFAULT_CACHE_PATH, max_disk_entries=5000):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'disk_evictions': 0
+        }
+        self._disk_enabled = db_path is not None
+        if self._disk_enabled:
+            self._init_disk()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_disk(self):
+        """Create the on-disk tier, falling back to memory only on failure"""
+        try:
+            conn = self._connect()
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                cache_key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                last_access REAL NOT NULL
+            )
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_extraction_cache_access
+            ON extraction_cache (last_access)
+            ''')
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"Extraction cache disk tier disabled: {str(e)}")
+            self._disk_enabled = False
+
+    @staticmethod
+    def make_key(data, extractor_version):
+        """Build the cache key for file bytes and an extractor version"""
+        return f"{hashlib.sha256(data).hexdigest()}:{extractor_version}"
+
+    def get(self, key):
+        """Return cached text for key, or None on a miss"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                return self._memory[key]
+
+        text = self._disk_get(key)
+        with self._lock:
+            if text is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['disk_hits'] += 1
+            self._memory_put(key, text)
+        return text
+
+    def put(self, key, text):
+        """Store extracted text in both tiers"""
+        with self._lock:
+            self._memory_put(key, text)
+        self._disk_put(key, text)
+
+    def get_or_extract(self, data, extractor_version, extract):
+        """Return cached text for data, calling extract(data) on a miss.
+
+        Empty results are not cached so a transient extraction failure is
+        retried on the next upload.
+        """
+        key = self.make_key(data, extractor_version)
+        text = self.get(key)
+        if text is None:
+            text = extract(data)
+            if text:
+                self.put(key, text)
+        return text
+
+    def _memory_put(self, key, text):
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def _disk_get(self, key):
+        if not self._disk_enabled:
+            return None
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    'SELECT text FROM extraction_cache WHERE cache_key = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    'UPDATE extraction_cache SET last_access = ? WHERE cache_key = ?',
+                    (time.time(), key)
+                )
+                conn.commit()
+                return row[0]
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Extraction cache read failed: {str(e)}")
+            return None
+
+    def _disk_put(self, key, text):
+        if not self._disk_enabled:
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    'INSERT OR REPLACE INTO extraction_cache (cache_key, text, last_access) VALUES (?, ?, ?)',
+                    (key, text, time.time())
+                )
+                cursor = conn.execute('''
+                DELETE FROM extraction_cache WHERE cache_key IN (
+                    SELECT cache_key FROM extraction_cache
+                    ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                ''', (self.max_disk_entries,))
+                conn.commit()
+                if cursor.rowcount > 0:
+                    with self._lock:
+                        self._stats['disk_evictions'] += cursor.rowcount
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Extraction cache write failed: {str(e)}")
+
+    def stats(self):
+        """Return hit/miss/eviction counters and current tier sizes"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+        stats['hits'] = stats['memory_hits'] + stats['disk_hits']
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        stats['disk_entries'] = 0
+        if self._disk_enabled:
+            try:
+                conn = self._connect()
+                stats['disk_entries'] = conn.execute(
+                    'SELECT COUNT(*) FROM extraction_cache'
+                ).fetchone()[0]
+                conn.close()
+            except sqlite3.Error:
+                pass
+        return stats
+
+    def clear(self):
+        """Drop every cached entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+        if self._disk_enabled:
+            try:
+                conn = self._connect()
+                conn.execute('DELETE FROM extraction_cache')
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"Extraction cache clear failed: {str(e)}")
+
+
+_extraction_cache = None
+_extraction_cache_lock = threading.Lock()
+
+
+def get_extraction_cache():
+    """Return the process-wide extraction cache shared by all extractors"""
+    global _extraction_cache
+    if _extraction_cache is None:
+        with _extraction_cache_lock:
+            if _extraction_cache is None:
+                _extraction_cache = ExtractionCache()
+    return _extraction_cache
@@ -0,0 +1,452 @@
+import os
+import threading
+import time
+
+from .docx_text import extract_docx_text
+from .extraction_cache import get_extraction_cache
+from .page_extraction import DEFAULT_WORKERS, find_poppler_path, iter_page_results, needs_ocr, ocr_pages
+from .upload_buffer import UploadBuffer
+
+# Bump when backends or the selection policy change the extracted text
+ENGINE_VERSION = 'extraction_engine/4'
+
+# Only the first few pages are inspected when probing document features
+PROBE_MAX_PAGES = 5
+
+# Observed timings replace the static cost prior after this many calls
+MIN_OBSERVED_CALLS = 3
+
+
+class ExtractionBackend:
+    """A registered text extractor with its cost prior and running metrics.
+
+    cost is the expected seconds per page before any call has been timed.
+    A backend is called as extract(buffer, features) and returns the text,
+    or an iterable of page texts, in page order, if paged. needs_images marks OCR backends: they
+    only make sense when the document contains images, and are called as
+    extract(buffer, features, page_numbers) to read just those 1-based
+    pages, returning their texts in the same order.
+    """
+
+    def __init__(self, name, extract, kinds, cost, needs_images=False, paged=False):
+        self.name = name
+        self.extract = extract
+        self.kinds = tuple(kinds)
+        self.cost = cost
+        self.needs_images = needs_images
+        self.paged = paged
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.total_time = 0.0
+        self.total_pages = 0
+        self.total_chars = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds, pages, text, ok):
+        with self._lock:
+            self.calls += 1
+            self.total_time += seconds
+            self.total_pages += max(1, pages)
+            self.total_chars += len(text or '')
+            if ok:
+                self.successes += 1
+            else:
+                self.failures += 1
+
+    def seconds_per_page(self):
+        """Observed seconds per page, or the static cost prior"""
+        if self.calls < MIN_OBSERVED_CALLS:
+            return self.cost
+        return self.total_time / self.total_pages
+
+    def success_rate(self):
+        """Laplace-smoothed probability that this backend yields usable text"""
+        return (self.successes + 1) / (self.calls + 2)
+
+    def metrics(self):
+        return {
+            'backend': self.name,
+            'calls': self.calls,
+            'successes': self.successes,
+            'failures': self.failures,
+            'success_rate': round(self.success_rate(), 3),
+            'avg_seconds': self.total_time / self.calls if self.calls else 0.0,
+            'seconds_per_page': self.seconds_per_page(),
+            'chars_per_page': self.total_chars / self.total_pages if self.total_pages else 0.0
+        }
+
+
+def detect_kind(data, filename=None):
+    """Return 'pdf', 'docx' or 'text' from magic bytes, then the file name"""
+    if data[:5] == b'%PDF-':
+        return 'pdf'
+    if data[:2] == b'PK':
+        return 'docx'
+    if filename:
+        extension = os.path.splitext(filename)[1].lower().lstrip('.')
+        if extension in ('pdf', 'docx'):
+            return extension
+    return 'text'
+
+
+def probe_document(data, kind):
+    """Collect cheap document features used to pick a backend.
+
+    For PDFs only page resources are inspected (fonts mean a text layer,
+    image XObjects mean scanned content); content streams are not parsed.
+    """
+    features = {
+        'kind': kind,
+        'size': len(data),
+        'page_count': 1,
+        'has_text': kind != 'pdf',
+        'has_images': False
+    }
+    if kind != 'pdf':
+        return features
+
+    try:
+        import io
+        import pypdf
+        reader = pypdf.PdfReader(io.BytesIO(data))
+        features['page_count'] = len(reader.pages)
+        for page in reader.pages[:PROBE_MAX_PAGES]:
+            resources = page.get('/Resources')
+            if resources is None:
+                continue
+            resources = resources.get_object()
+            if '/Font' in resources:
+                features['has_text'] = True
+            xobjects = resources.get('/XObject')
+            if xobjects is not None:
+                for xobject in xobjects.get_object().values():
+                    if xobject.get_object().get('/Subtype') == '/Image':
+                        features['has_images'] = True
+                        break
+    except Exception:
+        # Unknown structure: let every backend have a go
+        features['has_text'] = True
+        features['has_images'] = True
+    return features
+
+
+class ExtractionEngine:
+    """Single entry point for document text extraction.
+
+    Backends register with the kinds of document they handle and a cost
+    prior. For each document the engine probes its features, orders the
+    applicable backends by expected cost (seconds per page times page count,
+    divided by the observed success rate) and escalates to the next backend
+    only when the cheaper one fails or returns no usable text.
+
+    Pages of a text-layer result are triaged one by one: pages without a
+    usable text layer are OCR'd on their own and merged back in page
+    order, so a scanned page of a mixed PDF is neither lost nor a reason
+    to OCR the whole document. iter_pages() streams the same pages as
+    they are extracted.
+    """
+
+    def __init__(self, use_cache=True, parallel=True):
+        self.backends = {}
+        self.use_cache = use_cache
+        # Lets backends fan pages out to a process pool
+        self.parallel = parallel
+
+    def register_backend(self, name, extract, kinds, cost, needs_images=False, paged=False):
+        """Register a backend under name (see ExtractionBackend for the call signature)"""
+        self.backends[name] = ExtractionBackend(name, extract, kinds, cost, needs_images, paged)
+
+    def plan(self, features):
+        """Return the backends to try for a document, cheapest first"""
+        candidates = []
+        for backend in self.backends.values():
+            if features['kind'] not in backend.kinds:
+                continue
+            if backend.needs_images and not features['has_images']:
+                continue
+            if not features['has_text'] and features['has_images'] and not backend.needs_images:
+                # Image-only document: text-layer backends cannot succeed
+                continue
+            expected = backend.seconds_per_page() * features['page_count'] / backend.success_rate()
+            candidates.append((expected, backend))
+        candidates.sort(key=lambda candidate: candidate[0])
+        return [backend for _, backend in candidates]
+
+    def extract(self, file, filename=None):
+        """Extract text and return a dict with the text, chosen backend and attempts"""
+        buffer = UploadBuffer(file)
+        filename = filename or getattr(file, 'name', None)
+        kind = detect_kind(buffer.data, filename)
+
+        cache = get_extraction_cache() if self.use_cache else None
+        if cache is not None:
+            cache_key = cache.make_key(buffer.data, ENGINE_VERSION)
+            cached_text = cache.get(cache_key)
+            if cached_text is not None:
+                return {'text': cached_text, 'backend': 'cache', 'attempts': [], 'features': None}
+
+        features = probe_document(buffer.data, kind)
+        features['parallel'] = self.parallel
+        attempts = []
+        ocr_tried = False
+        for backend in self.plan(features):
+            if backend.needs_images and ocr_tried:
+                continue
+            pages = self._run(backend, buffer, features, attempts)
+            ocr_tried = ocr_tried or backend.needs_images
+            if pages is None:
+                continue
+            name = backend.name
+            ocr_page_numbers = []
+            if backend.paged and not backend.needs_images and not ocr_tried:
+                # Only pages without a usable text layer need OCR
+                ocr_page_numbers = [n for n, page_text in enumerate(pages, 1) if needs_ocr(page_text)]
+                if ocr_page_numbers:
+                    ocr_tried = True
+                    pages, ocr_name = self._ocr_pages(buffer, features, pages, ocr_page_numbers, attempts)
+                    if ocr_name is None:
+                        ocr_page_numbers = []
+                    else:
+                        name = f"{name}+{ocr_name}"
+            text = join_pages(pages)
+            if not needs_ocr(text):
+                if cache is not None:
+                    cache.put(cache_key, text)
+                return {'text': text, 'backend': name, 'attempts': attempts, 'features': features,
+                        'ocr_pages': ocr_page_numbers}
+
+        return {'text': '', 'backend': None, 'attempts': attempts, 'features': features, 'ocr_pages': []}
+
+    def iter_pages(self, file, filename=None):
+        """Yield (page_number, text) for a document as each page is extracted.
+
+        A PDF is streamed from the first backend of its plan, and pages
+        without a usable text layer are OCR'd as they are reached, so the
+        pages joined with join_pages() are the text extract() returns when
+        that backend succeeds; that text is then cached. Raises if the
+        pages hold no usable text, leaving escalation to extract(). Other
+        documents, cache hits and PDFs whose plan starts with OCR are
+        yielded as a single page.
+        """
+        buffer = UploadBuffer(file)
+        filename = filename or getattr(file, 'name', None)
+        kind = detect_kind(buffer.data, filename)
+
+        cache = get_extraction_cache() if self.use_cache else None
+        if cache is not None:
+            cache_key = cache.make_key(buffer.data, ENGINE_VERSION)
+            cached_text = cache.get(cache_key)
+            if cached_text is not None:
+                yield 1, cached_text
+                return
+
+        features = probe_document(buffer.data, kind)
+        features['parallel'] = self.parallel
+        plan = self.plan(features)
+        backend = plan[0] if plan else None
+        if backend is None or not backend.paged or backend.needs_images:
+            yield 1, self.extract_text(buffer.data, filename)
+            return
+
+        attempts = []
+        pages = []
+        ocr_seconds = 0.0
+        ocr_available = True
+        start = time.perf_counter()
+        try:
+            for page_number, page_text in enumerate(backend.extract(buffer, features), 1):
+                if ocr_available and needs_ocr(page_text):
+                    ocr_start = time.perf_counter()
+                    merged, ocr_name = self._ocr_pages(buffer, features, pages + [page_text],
+                                                       [page_number], attempts)
+                    ocr_seconds += time.perf_counter() - ocr_start
+                    # Don't retry OCR on every remaining page
+                    ocr_available = ocr_name is not None
+                    page_text = merged[-1]
+                pages.append(page_text)
+                yield page_number, page_text
+        except Exception as e:
+            backend.record(time.perf_counter() - start - ocr_seconds, len(pages), '', False)
+            raise Exception(f"{backend.name} extraction failed: {e}")
+
+        text = join_pages(pages)
+        ok = not needs_ocr(text)
+        backend.record(time.perf_counter() - start - ocr_seconds, len(pages), text, ok)
+        if not ok:
+            raise Exception(f"{backend.name} found no usable text")
+        if cache is not None:
+            cache.put(cache_key, text)
+
+    def _run(self, backend, buffer, features, attempts, page_numbers=None):
+        """Call a backend, record its metrics and attempt, and return its page texts (None on error)"""
+        start = time.perf_counter()
+        pages, error = None, None
+        try:
+            pages = call_backend(backend, buffer, features, page_numbers)
+        except Exception as e:
+            error = str(e)
+        seconds = time.perf_counter() - start
+        text = join_pages(pages or [])
+        ok = error is None and not needs_ocr(text)
+        backend.record(seconds, len(page_numbers) if page_numbers else features['page_count'], text, ok)
+        attempts.append({'backend': backend.name, 'seconds': seconds, 'ok': ok, 'error': error})
+        return pages
+
+    def _ocr_pages(self, buffer, features, pages, page_numbers, attempts):
+        """OCR the given pages with the cheapest OCR backend and merge them into pages.
+
+        Returns (pages, OCR backend name), the name being None if no OCR ran.
+        """
+        candidates = [backend for backend in self.backends.values()
+                      if backend.needs_images and features['kind'] in backend.kinds]
+        if not candidates:
+            return pages, None
+        backend = min(candidates, key=lambda candidate: candidate.seconds_per_page() / candidate.success_rate())
+        ocr_texts = self._run(backend, buffer, features, attempts, page_numbers)
+        if ocr_texts is None:
+            # OCR unavailable or failed: keep the text layer
+            return pages, None
+        pages = list(pages)
+        for page_number, ocr_text in zip(page_numbers, ocr_texts):
+            if len(ocr_text.strip()) > len(pages[page_number - 1].strip()):
+                pages[page_number - 1] = ocr_text
+        return pages, backend.name
+
+    def extract_text(self, file, filename=None):
+        """Return the extracted text, raising if every backend failed"""
+        result = self.extract(file, filename)
+        if result['backend'] is None:
+            errors = '; '.join(
+                f"{attempt['backend']}: {attempt['error'] or 'no usable text'}"
+                for attempt in result['attempts']
+            )
+            raise Exception(f"All extraction backends failed ({errors or 'no backend for this file type'})")
+        return result['text']
+
+    def metrics(self):
+        """Return per-backend timing and quality metrics"""
+        return [backend.metrics() for backend in self.backends.values()]
+
+
+def join_pages(pages):
+    """Join page texts in page order, skipping empty pages"""
+    return '\n'.join(page_text for page_text in pages if page_text).strip()
+
+
+def call_backend(backend, buffer, features, page_numbers=None):
+    """Run a backend on a document and return its text as a list of page texts.
+
+    OCR backends read page_numbers, or every page if None.
+    """
+    if backend.needs_images:
+        if page_numbers is None:
+            page_numbers = list(range(1, features['page_count'] + 1))
+        return list(backend.extract(buffer, features, page_numbers))
+    result = backend.extract(buffer, features)
+    return list(result) if backend.paged else [result or '']
+
+
+def _pdf_text_backend(library):
+    def extract(buffer, features):
+        pages = iter_page_results(buffer.data, library, parallel=features.get('parallel', False))
+        return (page_text for page_text, _ in pages)
+    return extract
+
+
+def _ocr_backend(buffer, features, page_numbers):
+    # Poppler needs a real path, so this is the one place a temp file is written
+    with buffer.temp_path(suffix='.pdf') as temp_path:
+        workers = DEFAULT_WORKERS if features.get('parallel', False) else 1
+        results = ocr_pages(temp_path, page_numbers, find_poppler_path(), workers=workers)
+    return [results[n] for n in page_numbers]
+
+
+def _docx_stream_backend(buffer, features):
+    return extract_docx_text(buffer.data).strip()
+
+
+def _docx_backend(buffer, features):
+    from docx import Document
+    doc = Document(buffer.stream())
+    return '\n'.join(paragraph.text for paragraph in doc.paragraphs).strip()
+
+
+def _plain_text_backend(buffer, features):
+    return buffer.data.decode('utf-8', errors='replace').strip()
+
+
+def create_default_engine(use_cache=True, parallel=True):
+    """Build an engine with the bundled PDF, OCR, DOCX and plain-text backends"""
+    engine = ExtractionEngine(use_cache=use_cache, parallel=parallel)
+    engine.register_backend('pypdf', _pdf_text_backend('pypdf'), ['pdf'], cost=0.01, paged=True)
+    engine.register_backend('PyPDF2', _pdf_text_backend('PyPDF2'), ['pdf'], cost=0.012, paged=True)
+    engine.register_backend('pdfplumber', _pdf_text_backend('pdfplumber'), ['pdf'], cost=0.05, paged=True)
+    engine.register_backend('ocr', _ocr_backend, ['pdf'], cost=2.0, needs_images=True, paged=True)
+    engine.register_backend('docx-stream', _docx_stream_backend, ['docx'], cost=0.002)
+    engine.register_backend('python-docx', _docx_backend, ['docx'], cost=0.01)
+    engine.register_backend('plain', _plain_text_backend, ['text'], cost=0.0001)
+    return engine
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_extraction_engine():
+    """Return the process-wide default extraction engine"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_default_engine()
+    return _engine
+
+
+def benchmark(paths, engine=None, repeat=1):
+    """Time every applicable backend, and the engine's own choice, on a corpus.
+
+    Returns one summary row per backend plus an 'engine' row. Caching is
+    bypassed so every run does real work.
+    """
+    engine = engine or create_default_engine(use_cache=False)
+    rows = {name: {'backend': name, 'files': 0, 'ok': 0, 'seconds': 0.0, 'chars': 0}
+            for name in list(engine.backends) + ['engine']}
+
+    for path in paths:
+        with open(path, 'rb') as f:
+            buffer = UploadBuffer(f.read())
+        features = probe_document(buffer.data, detect_kind(buffer.data, path))
+        features['parallel'] = engine.parallel
+        for backend in engine.backends.values():
+            if features['kind'] not in backend.kinds:
+                continue
+            row = rows[backend.name]
+            for _ in range(repeat):
+                start = time.perf_counter()
+                try:
+                    text = join_pages(call_backend(backend, buffer, features))
+                except Exception:
+                    text = ''
+                row['seconds'] += time.perf_counter() - start
+                row['files'] += 1
+                row['chars'] += len(text)
+                row['ok'] += 0 if needs_ocr(text) else 1
+
+        row = rows['engine']
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = engine.extract(buffer.data, path)
+            row['seconds'] += time.perf_counter() - start
+            row['files'] += 1
+            row['chars'] += len(result['text'])
+            row['ok'] += 1 if result['backend'] else 0
+
+    summary = []
+    for row in rows.values():
+        if not row['files']:
+            continue
+        row['avg_seconds'] = row['seconds'] / row['files']
+        row['success_rate'] = row['ok'] / row['files']
+        summary.append(row)
+    return summary
@@ -0,0 +1,201 @@
+import multiprocessing
+import queue
+import threading
+
+from .extraction_cache import get_extraction_cache
+from .extraction_engine import ENGINE_VERSION, create_default_engine, detect_kind
+from .page_extraction import count_pages
+from .upload_buffer import UploadBuffer
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 60  # Seconds of wall-clock time per document
+DEFAULT_MEMORY_LIMIT_MB = 1024  # Address-space cap per worker (POSIX only)
+DEFAULT_MAX_PAGES = 50
+DEFAULT_MAX_JOBS_PER_WORKER = 25
+DEFAULT_WAIT_TIMEOUT = 30  # Seconds to wait for a free worker
+
+
+class ExtractionError(Exception):
+    """Raised when a document cannot be extracted within the sandbox limits"""
+
+
+def _limit_memory(memory_limit_mb):
+    """Cap the worker's address space so a ballooning parser hits MemoryError"""
+    if not memory_limit_mb:
+        return
+    try:
+        import resource
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError):
+        # Not available on Windows or not permitted; rely on the timeout
+        pass
+
+
+def _worker_main(conn, memory_limit_mb, max_pages):
+    """Worker loop: receive (bytes, filename), send back ('ok', text) or ('error', message)"""
+    _limit_memory(memory_limit_mb)
+    # Workers are single-threaded sandboxes, so pages and OCR run serially
+    engine = create_default_engine(parallel=False)
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        data, filename = job
+        try:
+            if detect_kind(data, filename) == 'pdf':
+                page_count = count_pages(data)
+                if page_count > max_pages:
+                    raise ExtractionError(
+                        f"Document has {page_count} pages; the limit is {max_pages}"
+                    )
+            conn.send(('ok', engine.extract_text(data, filename)))
+        except MemoryError:
+            conn.send(('error', "Document exceeded the extraction memory limit"))
+        except Exception as e:
+            conn.send(('error', str(e)))
+
+
+class _Worker:
+    """One sandbox process and the pipe used to talk to it"""
+
+    def __init__(self, context, memory_limit_mb, max_pages):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_mb, max_pages),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def run(self, data, filename, timeout):
+        self.jobs += 1
+        try:
+            self.conn.send((data, filename))
+        except OSError:
+            raise ExtractionError("Extraction worker is not running")
+        if not self.conn.poll(timeout):
+            raise ExtractionError(f"Extraction timed out after {timeout} seconds")
+        try:
+            return self.conn.recv()
+        except EOFError:
+            # The process died, most likely killed for exceeding its limits
+            raise ExtractionError("Extraction worker crashed while processing the document")
+
+    def stop(self, force=False):
+        try:
+            if force:
+                self.process.kill()
+            else:
+                self.conn.send(None)
+            self.process.join(timeout=1)
+            if self.process.is_alive():
+                self.process.kill()
+        except Exception:
+            pass
+        self.conn.close()
+
+
+class SandboxedExtractor:
+    """Runs the extraction engine in a pool of isolated worker processes.
+
+    Workers run the same engine as in-process extraction (cost-based
+    backend choice, page-selective OCR and the extraction cache), so the
+    text is the same; only where it runs changes.
+
+    Each document gets a wall-clock timeout, each worker a memory cap and
+    a page cap, and workers are replaced after max_jobs_per_worker
+    documents. A worker that times out or crashes is killed and replaced
+    on its own, so other users' extractions keep running. When every
+    worker stays busy for wait_timeout seconds the document is refused
+    instead of queueing without bound.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT,
+                 memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, max_pages=DEFAULT_MAX_PAGES,
+                 max_jobs_per_worker=DEFAULT_MAX_JOBS_PER_WORKER,
+                 wait_timeout=DEFAULT_WAIT_TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_pages = max_pages
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.wait_timeout = wait_timeout
+        # Spawned (not forked) so workers never inherit server threads or locks
+        self._context = multiprocessing.get_context('spawn')
+        self._idle = queue.Queue()
+        self._started = False
+        self._lock = threading.Lock()
+
+    def _new_worker(self):
+        return _Worker(self._context, self.memory_limit_mb, self.max_pages)
+
+    def _ensure_started(self):
+        with self._lock:
+            if not self._started:
+                for _ in range(self.workers):
+                    self._idle.put(self._new_worker())
+                self._started = True
+
+    def extract_text(self, file, filename=None):
+        """Extract text in a sandbox worker, raising ExtractionError on any failure"""
+        buffer = UploadBuffer(file)
+        filename = filename or getattr(file, 'name', None)
+
+        # Cached text is returned without a round trip to a worker
+        cache = get_extraction_cache()
+        cached_text = cache.get(cache.make_key(buffer.data, ENGINE_VERSION))
+        if cached_text is not None:
+            return cached_text
+
+        self._ensure_started()
+        try:
+            worker = self._idle.get(timeout=self.wait_timeout)
+        except queue.Empty:
+            raise ExtractionError("All extraction workers are busy; please try again shortly")
+        healthy = False
+        try:
+            status, payload = worker.run(buffer.data, filename, self.timeout)
+            healthy = True
+        finally:
+            if healthy and worker.jobs < self.max_jobs_per_worker:
+                self._idle.put(worker)
+            else:
+                # Recycle: kill timed-out/crashed workers, retire worn-out ones
+                worker.stop(force=not healthy)
+                self._idle.put(self._new_worker())
+
+        if status == 'error':
+            raise ExtractionError(payload)
+        if not payload.strip():
+            raise ExtractionError("No extraction method could read text from this document")
+        return payload
+
+    def close(self):
+        """Stop every idle worker"""
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().stop()
+                except queue.Empty:
+                    break
+            self._started = False
+
+
+_sandbox = None
+_sandbox_lock = threading.Lock()
+
+
+def get_sandboxed_extractor():
+    """Return the process-wide sandboxed extractor"""
+    global _sandbox
+    if _sandbox is None:
+        with _sandbox_lock:
+            if _sandbox is None:
+                _sandbox = SandboxedExtractor()
+    return _sandbox
@@ -0,0 +1,150 @@
+import threading
+from collections import deque
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton that finds many keywords in one pass over a text.
+
+    Keywords and text are compared lowercased. A hit must sit on word
+    boundaries: a keyword starting (ending) with a letter or digit may not
+    be preceded (followed) by one, so 'java' does not match inside
+    'javascript'. A trailing plural 's' is allowed, so 'project' matches
+    'projects'. Keywords ending in punctuation, such as 'c++', only need
+    the boundary on their word side.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = sorted({keyword.lower() for keyword in keywords if keyword})
+        # State 0 is the root; transitions[state] maps a character to the
+        # next state, with failure links already folded in (a full DFA), so
+        # scanning costs one dict lookup per character
+        self._transitions = [{}]
+        self._outputs = [()]
+        self._build()
+
+    def _build(self):
+        goto = [{}]
+        outputs = [[]]
+        for keyword in self.keywords:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(keyword)
+
+        fail = [0] * len(goto)
+        transitions = [dict(goto[0])]
+        transitions.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # Inherit the failure state's transitions, then override with our own
+            transitions[state] = dict(transitions[fail[state]])
+            for char, next_state in goto[state].items():
+                fail[next_state] = transitions[fail[state]].get(char, 0) if state else 0
+                outputs[next_state].extend(outputs[fail[next_state]])
+                transitions[state][char] = next_state
+                queue.append(next_state)
+
+        # Transitions back to the root are the default and need not be stored
+        self._transitions = [
+            {char: target for char, target in table.items() if target}
+            for table in transitions
+        ]
+        self._outputs = [tuple(output) for output in outputs]
+
+    def find_all(self, text, lowered=False):
+        """Return (offset, keyword) for every word-bounded hit, in text order.
+
+        Offsets index the lowercased text; pass lowered=True if text
+        already is.
+        """
+        if not lowered:
+            text = text.lower()
+        length = len(text)
+        transitions = self._transitions
+        outputs = self._outputs
+        hits = []
+        state = 0
+        for end, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            for keyword in outputs[state]:
+                start = end - len(keyword) + 1
+                if _is_word_char(keyword[0]) and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if _is_word_char(keyword[-1]) and end + 1 < length and _is_word_char(text[end + 1]):
+                    # Allow a plural 's' right before the boundary
+                    if not (text[end + 1] == 's' and
+                            (end + 2 >= length or not _is_word_char(text[end + 2]))):
+                        continue
+                hits.append((start, keyword))
+        hits.sort()
+        return hits
+
+    def keywords_in(self, text, lowered=False):
+        """Return the set of keywords found in text"""
+        return {keyword for _, keyword in self.find_all(text, lowered)}
+
+
+def normalize_keywords(keywords):
+    """Return keywords as the lowercased frozenset the automaton matches"""
+    return frozenset(keyword.lower() for keyword in keywords if keyword)
+
+
+# Every keyword any caller has asked for; the shared automaton covers them all
+_vocabulary = set()
+_shared_matcher = None
+_shared_lock = threading.Lock()
+
+
+def register_keywords(keywords):
+    """Add keywords to the shared automaton's vocabulary.
+
+    Components register their fixed keyword sets (document types, section
+    headers, lexicon aliases, role skills) when they are built, so the
+    automaton is compiled once, on first use, with all of them.
+    """
+    global _shared_matcher
+    keywords = normalize_keywords(keywords)
+    if keywords <= _vocabulary:
+        return
+    with _shared_lock:
+        if not keywords <= _vocabulary:
+            _vocabulary.update(keywords)
+            _shared_matcher = None
+
+
+def get_keyword_matcher(keywords=()):
+    """Return the process-wide automaton, covering at least keywords.
+
+    There is one automaton per process over every registered keyword, so a
+    document is scanned once whichever keyword sets are asked of it; use
+    keywords_in() (or filter the hits) to keep only the wanted ones. A
+    keyword nobody registered is added and the automaton rebuilt once.
+    """
+    global _shared_matcher
+    register_keywords(keywords)
+    matcher = _shared_matcher
+    if matcher is None:
+        with _shared_lock:
+            if _shared_matcher is None:
+                _shared_matcher = KeywordMatcher(_vocabulary)
+            matcher = _shared_matcher
+    return matcher
+
+
+def keywords_in(text, keywords, lowered=False):
+    """Return the lowercased keywords found in text with the shared automaton"""
+    keywords = normalize_keywords(keywords)
+    return get_keyword_matcher(keywords).keywords_in(text, lowered) & keywords
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = 'llm_cache.db'
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+def estimate_tokens(text):
+    """Rough token count of a text (about four characters per token)"""
+    return max(1, len(text or '') // 4)
+
+
+class LLMResponseCache:
+    """SQLite cache of LLM responses with a time-to-live and a size limit.
+
+    Entries are keyed by the SHA-256 of the model, the prompt template
+    version and every prompt input (resume text, job role, job
+    description), so changing any of them, or bumping the template
+    version, asks the model again. Entries older than ttl_seconds are
+    ignored and purged; past max_entries the least recently used go.
+
+    Each entry keeps the token counts of the request it saves and how
+    often it was served, so stats() can report the tokens not spent.
+    """
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, ttl_seconds=DEFAULT_TTL_SECONDS, max_entries=1000):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'evictions': 0,
+            'saved_tokens': 0
+        }
+        self._disk_enabled = db_path is not None
+        if self._disk_enabled:
+            self._init_disk()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_disk(self):
+        """Create the cache table, disabling the cache on failure"""
+        try:
+            conn = self._connect()
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                prompt_tokens INTEGER NOT NULL,
+                response_tokens INTEGER NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_llm_cache_access
+            ON llm_cache (last_access)
+            ''')
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"LLM response cache disabled: {str(e)}")
+            self._disk_enabled = False
+
+    @staticmethod
+    def make_key(model, prompt_version, resume_text, job_role=None, job_description=None):
+        """Build the cache key for one model request"""
+        payload = json.dumps([model, prompt_version, resume_text, job_role, job_description])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return the cached response for key, or None on a miss or an expired entry"""
+        if not self._disk_enabled:
+            return None
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    'SELECT response, prompt_tokens, response_tokens, created_at FROM llm_cache WHERE cache_key = ?',
+                    (key,)
+                ).fetchone()
+                if row is not None and row[3] < now - self.ttl_seconds:
+                    conn.execute('DELETE FROM llm_cache WHERE cache_key = ?', (key,))
+                    conn.commit()
+                    with self._lock:
+                        self._stats['expired'] += 1
+                    row = None
+                if row is None:
+                    with self._lock:
+                        self._stats['misses'] += 1
+                    return None
+                conn.execute(
+                    'UPDATE llm_cache SET hits = hits + 1, last_access = ? WHERE cache_key = ?',
+                    (now, key)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"LLM response cache read failed: {str(e)}")
+            return None
+        response, prompt_tokens, response_tokens, _ = row
+        with self._lock:
+            self._stats['hits'] += 1
+            self._stats['saved_tokens'] += prompt_tokens + response_tokens
+        return response
+
+    def put(self, key, response, prompt_tokens=None, response_tokens=None):
+        """Store a response with the token counts of its request (estimated if unknown)"""
+        if not self._disk_enabled:
+            return
+        now = time.time()
+        if response_tokens is None:
+            response_tokens = estimate_tokens(response)
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    '''INSERT OR REPLACE INTO llm_cache
+                    (cache_key, response, prompt_tokens, response_tokens, hits, created_at, last_access)
+                    VALUES (?, ?, ?, ?, 0, ?, ?)''',
+                    (key, response, prompt_tokens or 0, response_tokens, now, now)
+                )
+                expired = conn.execute(
+                    'DELETE FROM llm_cache WHERE created_at < ?', (now - self.ttl_seconds,)
+                ).rowcount
+                evicted = conn.execute('''
+                DELETE FROM llm_cache WHERE cache_key IN (
+                    SELECT cache_key FROM llm_cache
+                    ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                ''', (self.max_entries,)).rowcount
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"LLM response cache write failed: {str(e)}")
+            return
+        with self._lock:
+            self._stats['expired'] += max(expired, 0)
+            self._stats['evictions'] += max(evicted, 0)
+
+    def stats(self):
+        """Return this process's counters plus totals over the entries on disk.
+
+        total_hits and total_saved_tokens count every time a stored entry
+        was served, across processes and restarts.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        stats['entries'] = stats['total_hits'] = stats['total_saved_tokens'] = 0
+        if self._disk_enabled:
+            try:
+                conn = self._connect()
+                entries, total_hits, saved = conn.execute(
+                    'SELECT COUNT(*), SUM(hits), SUM(hits * (prompt_tokens + response_tokens)) FROM llm_cache'
+                ).fetchone()
+                conn.close()
+                stats.update(entries=entries, total_hits=total_hits or 0, total_saved_tokens=saved or 0)
+            except sqlite3.Error:
+                pass
+        return stats
+
+    def clear(self):
+        """Drop every cached response"""
+        if self._disk_enabled:
+            try:
+                conn = self._connect()
+                conn.execute('DELETE FROM llm_cache')
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"LLM response cache clear failed: {str(e)}")
+
+
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """Return the process-wide LLM response cache"""
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMResponseCache()
+    return _llm_cache
@@ -0,0 +1,123 @@
+import os
+import threading
+import time
+
+DEFAULT_MODEL = 'en_core_web_sm'
+
+# The analyzers only read tokens, lexical attributes (like_num) and sentence
+# boundaries, so every trained pipe is left out and the rule-based
+# sentencizer stands in for the parser's sentence boundaries
+EXCLUDED_PIPES = ('tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner', 'senter')
+
+# Experience units glued to a number ('5years', '5+yrs', '18months') are
+# split off by the tokenizer, so the profile matcher sees them as 'N years'
+GLUED_UNIT_INFIX = r'(?<=[0-9+])(?=(?i:years?|yrs?|months?|mos?)$)'
+# Bump when the tokenizer customization changes to invalidate cached Docs
+TOKENIZER_VERSION = 'units/1'
+
+_models = {}
+_stats = {}
+_loading = {}  # Model name -> warmup thread
+_lock = threading.Lock()
+_load_locks = {}
+
+
+def current_rss_mb():
+    """Return the resident set size of this process in MB (0.0 if unknown)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        # Peak rather than current RSS where /proc is unavailable (kB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if peak > 1 << 30 else peak / 1024
+    except (ImportError, OSError):
+        return 0.0
+
+
+def _load(name):
+    import spacy
+    from spacy.util import compile_infix_regex
+
+    try:
+        nlp = spacy.load(name, exclude=list(EXCLUDED_PIPES))
+        fallback = False
+    except OSError as e:
+        # Model package not installed: the blank English pipeline has the same
+        # tokenizer and lexical attributes
+        print(f"spaCy model {name} unavailable, using blank English pipeline: {str(e)}")
+        nlp = spacy.blank('en')
+        fallback = True
+    if 'sentencizer' not in nlp.pipe_names:
+        nlp.add_pipe('sentencizer')
+    nlp.tokenizer.infix_finditer = compile_infix_regex(
+        list(nlp.Defaults.infixes or ()) + [GLUED_UNIT_INFIX]
+    ).finditer
+    return nlp, fallback
+
+
+def get_nlp(name=DEFAULT_MODEL):
+    """Return the process-wide trimmed pipeline for a spaCy model, loading it once.
+
+    Concurrent first callers wait for a single load instead of loading the
+    model several times.
+    """
+    nlp = _models.get(name)
+    if nlp is not None:
+        return nlp
+    with _lock:
+        load_lock = _load_locks.setdefault(name, threading.Lock())
+    with load_lock:
+        if name not in _models:
+            rss_before = current_rss_mb()
+            start = time.perf_counter()
+            nlp, fallback = _load(name)
+            nlp('warmup')  # First call initializes lazily built tables
+            _stats[name] = {
+                'load_seconds': time.perf_counter() - start,
+                'rss_delta_mb': current_rss_mb() - rss_before,
+                'pipeline': list(nlp.pipe_names),
+                'fallback': fallback
+            }
+            _models[name] = nlp
+    return _models[name]
+
+
+def model_version(nlp):
+    """Return a string identifying what a pipeline produces: model, version, pipes, tokenizer and spaCy version"""
+    import spacy
+
+    meta = nlp.meta
+    return (f"{meta['lang']}_{meta['name']}-{meta['version']}[{','.join(nlp.pipe_names)}]"
+            f"/{TOKENIZER_VERSION}/spacy-{spacy.__version__}")
+
+
+def warmup(name=DEFAULT_MODEL, background=True):
+    """Load a model ahead of its first use.
+
+    With background=True the load runs in a daemon thread, which is
+    returned (None if the model is already loaded or loading).
+    """
+    if not background:
+        get_nlp(name)
+        return None
+    with _lock:
+        if name in _models or name in _loading:
+            return None
+        thread = threading.Thread(target=get_nlp, args=(name,), name=f"nlp-warmup-{name}", daemon=True)
+        _loading[name] = thread
+    thread.start()
+    return thread
+
+
+def warmup_enabled():
+    """Whether the app should warm models up at startup (RESUME_NLP_WARMUP=1)"""
+    return os.environ.get('RESUME_NLP_WARMUP', '').lower() in ('1', 'true', 'yes')
+
+
+def model_stats():
+    """Return load time, RSS growth and pipeline of every loaded model"""
+    return {name: dict(stats) for name, stats in _stats.items()}
@@ -0,0 +1,171 @@
+import io
+import multiprocessing
+import os
+import threading
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+# Documents with fewer pages than this are always extracted serially; below
+# it the cost of shipping the PDF to worker processes outweighs the gain.
+PARALLEL_MIN_PAGES = 8
+DEFAULT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+PDF_BACKENDS = ('pypdf', 'PyPDF2', 'pdfplumber')
+
+# One shared pool per worker count; pools are never shut down while the
+# process runs, since other sessions may still be submitting to them
+_pools = {}
+_pool_lock = threading.Lock()
+
+
+def _open_pdf(pdf_bytes, backend):
+    """Open PDF bytes with the given backend, returning (document, pages)"""
+    if backend == 'pypdf':
+        import pypdf
+        reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
+        return None, reader.pages
+    if backend == 'PyPDF2':
+        import PyPDF2
+        reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        return None, reader.pages
+    if backend == 'pdfplumber':
+        import pdfplumber
+        pdf = pdfplumber.open(io.BytesIO(pdf_bytes))
+        return pdf, pdf.pages
+    raise ValueError(f"Unknown PDF backend: {backend}")
+
+
+def _iter_page_range(pdf_bytes, backend, start, end):
+    """Yield (text, error) for pages [start, end) as each one is extracted"""
+    document, pages = _open_pdf(pdf_bytes, backend)
+    try:
+        for index in range(start, min(end, len(pages))):
+            try:
+                with warnings.catch_warnings():
+                    # Suppress specific warnings about PDFColorSpace conversion
+                    warnings.filterwarnings("ignore", message=".*PDFColorSpace.*")
+                    warnings.filterwarnings("ignore", message=".*Cannot convert.*")
+                    page_text = pages[index].extract_text() or ""
+            except Exception as e:
+                yield "", str(e)
+            else:
+                yield page_text, None
+    finally:
+        if document is not None:
+            document.close()
+
+
+def _extract_page_range(pdf_bytes, backend, start, end):
+    """Extract pages [start, end) and return a list of (text, error) pairs.
+
+    Runs inside worker processes, so errors are returned instead of shown.
+    """
+    return list(_iter_page_range(pdf_bytes, backend, start, end))
+
+
+def count_pages(pdf_bytes, backend='pypdf'):
+    """Return the number of pages in a PDF"""
+    document, pages = _open_pdf(pdf_bytes, backend)
+    try:
+        return len(pages)
+    finally:
+        if document is not None:
+            document.close()
+
+
+def get_process_pool(workers=None):
+    """Return the shared extraction process pool with the given number of workers"""
+    workers = workers or DEFAULT_WORKERS
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            # Spawned, not forked: the Streamlit server is multithreaded, and a
+            # forked child can inherit a lock held by another thread
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _pools[workers] = pool
+        return pool
+
+
+def iter_page_results(pdf_bytes, backend='pypdf', parallel=False, workers=None,
+                      min_pages=PARALLEL_MIN_PAGES):
+    """Yield (text, error) pairs in page order as pages become available.
+
+    Serially, each page is yielded as soon as it is extracted. With
+    parallel=True and at least min_pages pages, the page range is split
+    into one contiguous chunk per worker and extracted in a process pool;
+    each chunk is yielded as soon as it and every chunk before it are done.
+    """
+    workers = workers or DEFAULT_WORKERS
+    if not parallel or workers < 2:
+        yield from _iter_page_range(pdf_bytes, backend, 0, float('inf'))
+        return
+
+    page_count = count_pages(pdf_bytes, backend)
+    if page_count < min_pages:
+        yield from _iter_page_range(pdf_bytes, backend, 0, page_count)
+        return
+
+    chunk_size = -(-page_count // workers)  # Ceiling division
+    pool = get_process_pool(workers)
+    futures = [
+        pool.submit(_extract_page_range, pdf_bytes, backend, start, start + chunk_size)
+        for start in range(0, page_count, chunk_size)
+    ]
+    for future in futures:  # Futures are in page order
+        yield from future.result()
+
+
+# Pages whose text layer has fewer non-whitespace characters than this are
+# treated as image-only and sent to OCR.
+OCR_MIN_CHARS = 20
+
+
+def needs_ocr(page_text, min_chars=OCR_MIN_CHARS):
+    """Return True when a page has no usable text layer"""
+    return len(''.join(page_text.split())) < min_chars
+
+
+# Where the Poppler binaries usually live on Windows, first match wins
+WINDOWS_POPPLER_PATHS = (
+    r'C:\poppler\Library\bin',
+    r'C:\Program Files\poppler\bin',
+    r'C:\Program Files (x86)\poppler\bin',
+    r'C:\poppler\bin'
+)
+
+
+def find_poppler_path():
+    """Return the Poppler binary directory on Windows, None elsewhere (Poppler is on PATH)"""
+    if os.name != 'nt':
+        return None
+    for path in WINDOWS_POPPLER_PATHS:
+        if os.path.exists(path):
+            return path
+    return WINDOWS_POPPLER_PATHS[0]
+
+
+def _ocr_page(pdf_path, page_number, poppler_path=None):
+    """Rasterise a single 1-based page and OCR it (runs in worker processes)"""
+    import pytesseract
+    from pdf2image import convert_from_path
+
+    kwargs = {'first_page': page_number, 'last_page': page_number}
+    if poppler_path:
+        kwargs['poppler_path'] = poppler_path
+    images = convert_from_path(pdf_path, **kwargs)
+    return "\n".join(pytesseract.image_to_string(image) for image in images)
+
+
+def ocr_pages(pdf_path, page_numbers, poppler_path=None, workers=None):
+    """OCR only the given 1-based pages and return {page_number: text}.
+
+    Each page is rasterised on its own, and pages are spread across the
+    shared process pool when more than one needs OCR.
+    """
+    workers = workers or DEFAULT_WORKERS
+    if len(page_numbers) < 2 or workers < 2:
+        return {n: _ocr_page(pdf_path, n, poppler_path) for n in page_numbers}
+
+    pool = get_process_pool(workers)
+    futures = {n: pool.submit(_ocr_page, pdf_path, n, poppler_path) for n in page_numbers}
+    return {n: future.result() for n, future in futures.items()}
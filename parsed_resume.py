@@ -0,0 +1,120 @@
+import re
+from functools import cached_property
+
+from .keyword_matcher import get_keyword_matcher, normalize_keywords
+from .skills_lexicon import get_skill_lexicon
+
+# Patterns shared by every analyzer step, compiled once per process
+EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_PATTERN = re.compile(r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB_PATTERN = re.compile(r'github\.com/[\w-]+')
+CONTACT_FORMAT_PATTERNS = [
+    re.compile(r'\b[\w\.-]+@[\w\.-]+\.\w+\b'),  # email
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),  # phone
+    re.compile(r'linkedin\.com/\w+'),  # LinkedIn
+]
+CONTACT_WORD_PATTERN = re.compile(r'\b(?:email|phone|address|tel|mobile|linkedin)\b')
+YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+BULLET_PATTERN = re.compile(r'[•\-\*]')
+ACTION_VERB_PATTERN = re.compile(r'\b(developed|managed|created|implemented|designed|led|improved)\b')
+DEGREE_PATTERN = re.compile(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b')
+GPA_PATTERN = re.compile(r'\b(gpa|cgpa|grade|percentage)\b')
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+class ParsedResume:
+    """Resume text prepared once and shared by every analyzer step.
+
+    Each view (lines, lowercased lines, sentence spans, tokens, regex hits,
+    skill mentions) is computed on first use and then reused, so an
+    analysis splits, lowercases and scans the text once however many steps
+    read it. Results derived by an analyzer (keyword hits, sections) are
+    memoized as well.
+    """
+
+    def __init__(self, text):
+        self.text = text or ''
+        self._memo = {}
+
+    @classmethod
+    def of(cls, resume):
+        """Return resume itself if it is already parsed, else parse the text"""
+        return resume if isinstance(resume, cls) else cls(resume)
+
+    def memo(self, key, compute):
+        """Return a cached derived value, computing it on first request"""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def lines(self):
+        return self.text.split('\n')
+
+    @cached_property
+    def stripped_lines(self):
+        return [line.strip() for line in self.lines]
+
+    @cached_property
+    def lower_lines(self):
+        """Stripped, lowercased lines"""
+        return [line.lower() for line in self.stripped_lines]
+
+    @cached_property
+    def sentence_spans(self):
+        """(start, end) offsets of the '.'-separated sentences of the text"""
+        spans = []
+        start = 0
+        for match in re.finditer(r'\.', self.text):
+            spans.append((start, match.start()))
+            start = match.end()
+        spans.append((start, len(self.text)))
+        return spans
+
+    @cached_property
+    def tokens(self):
+        """Set of lowercased word tokens"""
+        return set(_TOKEN_PATTERN.findall(self.lower))
+
+    @cached_property
+    def word_count(self):
+        return len(self.text.split())
+
+    @cached_property
+    def contact_matches(self):
+        """First email, phone, LinkedIn and GitHub match in the text (or None)"""
+        return {
+            'email': EMAIL_PATTERN.search(self.text),
+            'phone': PHONE_PATTERN.search(self.text),
+            'linkedin': LINKEDIN_PATTERN.search(self.text),
+            'github': GITHUB_PATTERN.search(self.text)
+        }
+
+    @cached_property
+    def has_contact_format(self):
+        """Whether any well-formatted email, phone or LinkedIn URL appears"""
+        return any(pattern.search(self.text) for pattern in CONTACT_FORMAT_PATTERNS)
+
+    def keyword_hits(self, matcher):
+        """(offset, keyword) hits of the shared keyword automaton, scanned once per automaton"""
+        return self.memo(('keyword_hits', matcher), lambda: matcher.find_all(self.lower, lowered=True))
+
+    @cached_property
+    def skill_ids(self):
+        """Canonical skill IDs (skills_lexicon) mentioned in the text"""
+        lexicon = get_skill_lexicon()
+        return lexicon.find_ids(self.text, self.lower, self.keyword_hits(get_keyword_matcher()))
+
+    def keywords_in(self, keywords):
+        """Return the (lowercased) keywords found, filtered from the shared automaton's hits"""
+        keywords = normalize_keywords(keywords)
+        matcher = get_keyword_matcher(keywords)
+        found = self.memo(('keywords', matcher),
+                          lambda: frozenset(keyword for _, keyword in self.keyword_hits(matcher)))
+        return found & keywords
@@ -0,0 +1,107 @@
+import re
+import threading
+
+from spacy.matcher import PhraseMatcher
+
+from .skills_lexicon import get_skill_lexicon
+
+YEAR_WORDS = ('year', 'years', 'yr', 'yrs')
+MONTH_WORDS = ('month', 'months', 'mo', 'mos')
+
+_NUMBER = r'\d+(?:\.\d+)?'
+# The number before a unit word: 5, 5+, 3-5 or 3–5 (the upper bound counts)
+_QUANTITY = re.compile(f'(?:{_NUMBER}[-–])?({_NUMBER})\\+?')
+
+
+class ProfileMatcher:
+    """Finds skills and experience expressions in a spaCy Doc.
+
+    Every skill name and alias of the lexicon (and its plural) is a
+    PhraseMatcher pattern on lowercased tokens, so matching costs one hash
+    lookup per token however many skills there are; overlapping hits
+    resolve leftmost-longest like SkillLexicon.find. The experience unit
+    words are patterns of the same matcher, so one pass finds both, and
+    only the token before each unit hit is read: 'N years', 'N+ yrs',
+    ranges ('3-5 years', the upper bound counts) and month spans ('18
+    months', whole years). The shared pipeline's tokenizer splits units
+    glued to their quantity ('5+years' -> '5+', 'years'; see
+    nlp_models.GLUED_UNIT_INFIX), so those are found by the same pass.
+
+    spaCy's rule-based Matcher is not used: it costs far more per token
+    than a phrase lookup, even with a single pattern.
+    """
+
+    def __init__(self, nlp, lexicon=None):
+        self.nlp = nlp
+        self.lexicon = lexicon or get_skill_lexicon()
+        self.phrase_matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+        # Ambiguous skill words ('Swift', 'Unity') only count with their exact case
+        self.cased_matcher = PhraseMatcher(nlp.vocab, attr='ORTH')
+        self._skill_ids = {}  # Match ID -> skill ID
+        for skill_id in range(len(self.lexicon)):
+            key = nlp.vocab.strings.add(f'SKILL_{skill_id}')
+            self._skill_ids[key] = skill_id
+            aliases = self.lexicon.aliases_of(skill_id)
+            aliases += [alias + 's' for alias in aliases if alias[-1].isalpha()]
+            # Token boundaries depend on case ('node.js' is one token,
+            # 'Node.Js' three), so each spelling gets its own pattern
+            spellings = {variant for alias in aliases for variant in (alias, alias.title(), alias.upper())}
+            patterns = {tuple(token.lower_ for token in doc): doc for doc in nlp.tokenizer.pipe(sorted(spellings))}
+            self.phrase_matcher.add(f'SKILL_{skill_id}', list(patterns.values()))
+            cased_forms = self.lexicon.cased_forms_of(skill_id)
+            # The tokenizer keeps a capital and its period together ('R.')
+            cased_forms += [form + '.' for form in cased_forms if len(form) == 1]
+            if cased_forms:
+                self.cased_matcher.add(f'SKILL_{skill_id}', list(nlp.tokenizer.pipe(cased_forms)))
+
+        self._units = {}  # Match ID -> units per year
+        for label, unit_words, per_year in (('EXPERIENCE_YEARS', YEAR_WORDS, 1),
+                                            ('EXPERIENCE_MONTHS', MONTH_WORDS, 12)):
+            self.phrase_matcher.add(label, list(nlp.tokenizer.pipe(unit_words)))
+            self._units[nlp.vocab.strings[label]] = per_year
+
+    @staticmethod
+    def _is_initial(doc, end):
+        """Whether a cased hit ending at end is a middle initial ('R. Smith')"""
+        token = doc[end - 1]
+        return (len(token) == 2 and token.text[1] == '.' and end < len(doc)
+                and token.whitespace_ == ' ' and doc[end].text[:1].isupper())
+
+    def __call__(self, doc):
+        """Return (skill IDs in order of first mention, years of experience) of a Doc"""
+        cased_hits = [hit for hit in self.cased_matcher(doc) if not self._is_initial(doc, hit[2])]
+        hits = sorted(self.phrase_matcher(doc) + cased_hits, key=lambda hit: (hit[1], -hit[2]))
+        skill_ids = []
+        experience_years = 0
+        end = 0
+        for match_id, start, match_end in hits:
+            per_year = self._units.get(match_id)
+            if per_year is not None:
+                # The number is the token before the unit, or before a lone '+'
+                number = start - 2 if start > 1 and doc[start - 1].text == '+' else start - 1
+                match = _QUANTITY.fullmatch(doc[number].text) if number >= 0 else None
+                if match:
+                    experience_years = max(experience_years, int(float(match.group(1)) / per_year))
+            elif start >= end:
+                skill_id = self._skill_ids[match_id]
+                if skill_id not in skill_ids:
+                    skill_ids.append(skill_id)
+                end = match_end
+        return skill_ids, experience_years
+
+
+_profile_matchers = {}
+_profile_matchers_lock = threading.Lock()
+
+
+def get_profile_matcher(nlp):
+    """Return the ProfileMatcher of a pipeline, compiled on first use"""
+    matcher = _profile_matchers.get(id(nlp))
+    if matcher is None:
+        with _profile_matchers_lock:
+            matcher = _profile_matchers.get(id(nlp))
+            if matcher is None:
+                # The matcher holds on to nlp, so its id is never reused
+                matcher = ProfileMatcher(nlp)
+                _profile_matchers[id(nlp)] = matcher
+    return matcher
@@ -0,0 +1,163 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds (milliseconds) of the histogram buckets; the last bucket is open-ended
+BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+def profiling_enabled():
+    """Whether analyses are profiled when the caller does not say (RESUME_PROFILING=1)"""
+    return os.environ.get('RESUME_PROFILING', '').lower() in ('1', 'true', 'yes')
+
+
+class StageProfiler:
+    """Records wall-clock and CPU time per named stage of one analysis.
+
+    A disabled profiler keeps the same interface and records nothing, so
+    analysis code can wrap its stages unconditionally.
+    """
+
+    def __init__(self, analyzer, enabled=True):
+        self.analyzer = analyzer
+        self.enabled = enabled
+        self.stages = {}
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+    @classmethod
+    def for_call(cls, analyzer, profile=None):
+        """Return the profiler for one call: the caller's own, or a new one.
+
+        profile may be a StageProfiler (e.g. one that already timed
+        extraction), True/False, or None to follow profiling_enabled().
+        """
+        if isinstance(profile, cls):
+            return profile
+        return cls(analyzer, profiling_enabled() if profile is None else bool(profile))
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block as stage name (repeated stages accumulate)"""
+        if not self.enabled:
+            yield
+            return
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.stages.setdefault(name, {'wall_ms': 0.0, 'cpu_ms': 0.0})
+            timing['wall_ms'] += (time.perf_counter() - start_wall) * 1000
+            timing['cpu_ms'] += (time.process_time() - start_cpu) * 1000
+
+    def to_dict(self):
+        return {
+            'analyzer': self.analyzer,
+            'stages': {name: dict(timing) for name, timing in self.stages.items()},
+            'total_wall_ms': (time.perf_counter() - self._start_wall) * 1000,
+            'total_cpu_ms': (time.process_time() - self._start_cpu) * 1000
+        }
+
+    def attach(self, result):
+        """Add the profile to result under '_profile' and record it in the histograms"""
+        if not self.enabled or not isinstance(result, dict):
+            return result
+        profile = self.to_dict()
+        get_stage_histograms().record(profile)
+        result['_profile'] = profile
+        return result
+
+
+class _Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        index = 0
+        while index < len(BUCKET_BOUNDS_MS) and value > BUCKET_BOUNDS_MS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples (at most the max)"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(BUCKET_BOUNDS_MS[index], self.max) if index < len(BUCKET_BOUNDS_MS) else self.max
+        return self.max
+
+
+class StageHistograms:
+    """Process-wide wall and CPU time histograms per analyzer and stage"""
+
+    def __init__(self):
+        self._histograms = {}  # (analyzer, stage) -> {'wall': _Histogram, 'cpu': _Histogram}
+        self._lock = threading.Lock()
+
+    def record(self, profile):
+        """Add one StageProfiler.to_dict() result; its total counts as stage 'total'"""
+        stages = dict(profile['stages'])
+        stages['total'] = {'wall_ms': profile['total_wall_ms'], 'cpu_ms': profile['total_cpu_ms']}
+        with self._lock:
+            for stage, timing in stages.items():
+                key = (profile['analyzer'], stage)
+                if key not in self._histograms:
+                    self._histograms[key] = {'wall': _Histogram(), 'cpu': _Histogram()}
+                self._histograms[key]['wall'].add(timing['wall_ms'])
+                self._histograms[key]['cpu'].add(timing['cpu_ms'])
+
+    def summary(self):
+        """Return one row per analyzer and stage with counts and timing statistics"""
+        with self._lock:
+            rows = []
+            for (analyzer, stage), histograms in self._histograms.items():
+                wall, cpu = histograms['wall'], histograms['cpu']
+                rows.append({
+                    'analyzer': analyzer,
+                    'stage': stage,
+                    'count': wall.count,
+                    'mean_wall_ms': wall.total / wall.count,
+                    'p50_wall_ms': wall.percentile(0.5),
+                    'p95_wall_ms': wall.percentile(0.95),
+                    'max_wall_ms': wall.max,
+                    'mean_cpu_ms': cpu.total / cpu.count
+                })
+            return rows
+
+    def buckets(self, analyzer, stage, metric='wall'):
+        """Return (bucket label, count) pairs for one stage's histogram"""
+        with self._lock:
+            histogram = self._histograms.get((analyzer, stage), {}).get(metric)
+            counts = list(histogram.counts) if histogram else [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        labels = [f"≤{bound:g} ms" for bound in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]:g} ms"]
+        return list(zip(labels, counts))
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+_histograms = None
+_histograms_lock = threading.Lock()
+
+
+def get_stage_histograms():
+    """Return the process-wide stage timing histograms"""
+    global _histograms
+    if _histograms is None:
+        with _histograms_lock:
+            if _histograms is None:
+                _histograms = StageHistograms()
+    return _histograms
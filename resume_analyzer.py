@@ -1,7 +1,72 @@
-import re
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from .analysis_cache import get_analysis_cache, normalize_text
+from .analysis_results import ResumeAnalysis
+from .docx_text import extract_docx_text
+from .extraction_cache import read_file_bytes
+from .extraction_engine import get_extraction_engine, join_pages
+from .keyword_matcher import register_keywords
+from .profiling import StageProfiler
+from .skills_lexicon import get_skill_lexicon
+from .parsed_resume import (
+    ACTION_VERB_PATTERN, BULLET_PATTERN, CONTACT_WORD_PATTERN, DEGREE_PATTERN, GPA_PATTERN,
+    YEAR_PATTERN, ParsedResume
+)
+
+
+def _compile_keyword_index(groups):
+    """Compile {group: keywords} into (keyword, groups) pairs for substring tests.
+
+    A keyword containing another keyword of the same group is redundant
+    (the shorter one always matches too) and is dropped. A line contains a
+    keyword of a group exactly when the group appears in the pairs it matches.
+    """
+    owners = {}
+    for group, keywords in groups.items():
+        lowered = {keyword.lower() for keyword in keywords}
+        for keyword in lowered:
+            if not any(other != keyword and other in keyword for other in lowered):
+                owners.setdefault(keyword, set()).add(group)
+    return [(keyword, frozenset(owner_groups)) for keyword, owner_groups in owners.items()]
+
+
+# Analyzer used by batch worker processes, set by the pool initializer
+_batch_analyzer = None
+
+
+def _init_batch_worker(use_cache):
+    global _batch_analyzer
+    _batch_analyzer = ResumeAnalyzer(use_cache=use_cache)
+
+
+def _analyze_batch_item(text, job_requirements):
+    return _batch_analyzer.analyze_resume({'raw_text': text}, job_requirements)
+
+
+def _analysis_error(message):
+    """Return the result dict analyze_resume reports for a failed analysis"""
+    return {
+        'error': f"Resume analysis failed: {message}",
+        'ats_score': 0,
+        'document_type': 'unknown',
+        'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
+        'section_score': 0,
+        'format_score': 0,
+        'suggestions': [f"Error analyzing resume: {message}. Please check your file and try again."]
+    }
+
 
 class ResumeAnalyzer:
-    def __init__(self):
+    # Bump when analyze_resume output changes to invalidate cached results
+    ANALYZER_VERSION = 'resume_analyzer/4'
+
+    def __init__(self, use_cache=True):
+        self.use_cache = use_cache
+
         # Document type indicators
         self.document_types = {
             'resume': [
@@ -21,16 +86,89 @@ class ResumeAnalyzer:
                 'date of issue', 'identification'
             ]
         }
+
+        # Indicators of the sections every resume should have
+        self.essential_sections = {
+            'contact': ['email', 'phone', 'address', 'linkedin'],
+            'education': ['education', 'university', 'college', 'degree', 'academic'],
+            'experience': ['experience', 'work', 'employment', 'job', 'internship'],
+            'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
+        }
+
+        # Every document-type and section keyword, matched in one scan
+        self.document_keywords = tuple(
+            keyword
+            for keyword_sets in (self.document_types, self.essential_sections)
+            for keywords in keyword_sets.values()
+            for keyword in keywords
+        )
+        register_keywords(self.document_keywords)
+
+        # Section header indicators used by segment_sections
+        self.section_keywords = {
+            'education': [
+                'education', 'academic', 'qualification', 'degree', 'university', 'college',
+                'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+                'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
+                'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+            ],
+            'experience': [
+                'experience', 'employment', 'work history', 'professional experience',
+                'work experience', 'career history', 'professional background',
+                'employment history', 'job history', 'positions held', 'experience',
+                'job title', 'job responsibilities', 'job description', 'job summary'
+            ],
+            'projects': [
+                'projects', 'personal projects', 'academic projects', 'key projects',
+                'major projects', 'professional projects', 'project experience',
+                'relevant projects', 'featured projects','latest projects',
+                'top projects'
+            ],
+            'skills': [
+                'skills', 'technical skills', 'competencies', 'expertise',
+                'core competencies', 'professional skills', 'key skills',
+                'technical expertise', 'proficiencies', 'qualifications',
+                'top skills', 'key skill', 'major skill', 'personal skill',
+                'soft skills', 'soft skill', 'soft skillset'
+            ],
+            'summary': [
+                'summary', 'professional summary', 'career summary', 'objective',
+                'career objective', 'professional objective', 'about me', 'profile',
+                'professional profile', 'career profile', 'overview', 'skill summary'
+            ]
+        }
+
+        # Common skill separators
+        self.skill_separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
+
+        # Compiled once so each line is scanned a single time for every section
+        self._section_headers = {
+            name: {keyword.lower() for keyword in keywords}
+            for name, keywords in self.section_keywords.items()
+        }
+        self._keyword_index = _compile_keyword_index(
+            dict(self.section_keywords, resume=self.document_types['resume'])
+        )
         
-    def detect_document_type(self, text):
-        text = text.lower()
+    def find_keywords(self, text, required_skills=()):
+        """Return the set of document-type, section and required-skill keywords in text.
+
+        All keyword sets share one automaton per process, so this is a single
+        word-bounded scan; pass the result to the check methods to reuse it.
+        """
+        return ParsedResume.of(text).keywords_in(self.document_keywords + tuple(required_skills))
+
+    def detect_document_type(self, text, keyword_hits=None):
+        parsed = ParsedResume.of(text)
+        if keyword_hits is None:
+            keyword_hits = self.find_keywords(parsed)
         scores = {}
         
         # Calculate score for each document type
         for doc_type, keywords in self.document_types.items():
-            matches = sum(1 for keyword in keywords if keyword in text)
+            matches = sum(1 for keyword in keywords if keyword in keyword_hits)
             density = matches / len(keywords)
-            frequency = matches / (len(text.split()) + 1)  # Add 1 to avoid division by zero
+            frequency = matches / (parsed.word_count + 1)  # Add 1 to avoid division by zero
             scores[doc_type] = (density * 0.7) + (frequency * 0.3)
         
         # Get the highest scoring document type
@@ -39,18 +177,30 @@ class ResumeAnalyzer:
         # Only return a document type if the score is significant
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
         
-    def calculate_keyword_match(self, resume_text, required_skills):
-        resume_text = resume_text.lower()
+    def calculate_keyword_match(self, resume_text, required_skills, keyword_hits=None, skill_ids=None):
+        """Score the share of required skills the resume has.
+
+        Skills known to the skills lexicon are compared by canonical ID, so
+        an alias ("JS", "ReactJS") or a more specific skill (React for
+        JavaScript) counts; other skills need a whole-word match.
+        """
+        lexicon = get_skill_lexicon()
+        if skill_ids is None:
+            skill_ids = ParsedResume.of(resume_text).skill_ids
+        skill_ids = lexicon.expand(skill_ids)
         found_skills = []
         missing_skills = []
         
         for skill in required_skills:
-            skill_lower = skill.lower()
-            # Check for exact match
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
+            skill_id = lexicon.resolve(skill)
+            if skill_id is not None:
+                found = skill_id in skill_ids
+            else:
+                if keyword_hits is None:
+                    keyword_hits = ParsedResume.of(resume_text).keywords_in(required_skills)
+                # Whole-word match, also inside longer phrases ("Python programming")
+                found = skill.lower() in keyword_hits
+            if found:
                 found_skills.append(skill)
             else:
                 missing_skills.append(skill)
@@ -63,115 +213,108 @@ class ResumeAnalyzer:
             'missing_skills': missing_skills
         }
         
-    def check_resume_sections(self, text):
-        text = text.lower()
-        essential_sections = {
-            'contact': ['email', 'phone', 'address', 'linkedin'],
-            'education': ['education', 'university', 'college', 'degree', 'academic'],
-            'experience': ['experience', 'work', 'employment', 'job', 'internship'],
-            'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
-        }
+    def check_resume_sections(self, text, keyword_hits=None):
+        if keyword_hits is None:
+            keyword_hits = self.find_keywords(text)
         
         section_scores = {}
-        for section, keywords in essential_sections.items():
-            found = sum(1 for keyword in keywords if keyword in text)
+        for section, keywords in self.essential_sections.items():
+            found = sum(1 for keyword in keywords if keyword in keyword_hits)
             section_scores[section] = min(25, (found / len(keywords)) * 25)
             
         return sum(section_scores.values())
         
     def check_formatting(self, text):
-        lines = text.split('\n')
+        return self.score_format_facts(self.format_facts(text))
+
+    def format_facts(self, text):
+        """Return the facts check_formatting scores.
+
+        Facts of texts joined with newlines can be combined without
+        rescanning them (see builder_analysis.combine_format_facts).
+        """
+        parsed = ParsedResume.of(text)
+        stripped_lines = parsed.stripped_lines
+        return {
+            'length': len(parsed.text),
+            'has_headers': any(line.isupper() for line in parsed.lines),
+            'has_bullets': any(line.startswith(('•', '-', '*', '→')) for line in stripped_lines),
+            'blank_run': any(not line and not next_line
+                             for line, next_line in zip(stripped_lines[:-1], stripped_lines[1:])),
+            'starts_blank': not stripped_lines[0],
+            'ends_blank': not stripped_lines[-1],
+            'has_contact_format': parsed.has_contact_format
+        }
+
+    def score_format_facts(self, facts):
+        """Return the format score and deductions for format_facts()"""
         score = 100
         deductions = []
         
         # Check for minimum content
-        if len(text) < 300:
+        if facts['length'] < 300:
             score -= 30
             deductions.append("Resume is too short")
             
         # Check for section headers
-        if not any(line.isupper() for line in lines):
+        if not facts['has_headers']:
             score -= 20
             deductions.append("No clear section headers found")
             
         # Check for bullet points
-        if not any(line.strip().startswith(('•', '-', '*', '→')) for line in lines):
+        if not facts['has_bullets']:
             score -= 20
             deductions.append("No bullet points found for listing details")
             
         # Check for consistent spacing
-        if any(len(line.strip()) == 0 and len(next_line.strip()) == 0 
-               for line, next_line in zip(lines[:-1], lines[1:])):
+        if facts['blank_run']:
             score -= 15
             deductions.append("Inconsistent spacing between sections")
             
         # Check for contact information format
-        contact_patterns = [
-            r'\b[\w\.-]+@[\w\.-]+\.\w+\b',  # email
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # phone
-            r'linkedin\.com/\w+',  # LinkedIn
-        ]
-        if not any(re.search(pattern, text) for pattern in contact_patterns):
+        if not facts['has_contact_format']:
             score -= 15
             deductions.append("Missing or improperly formatted contact information")
             
         return max(0, score), deductions
         
     def extract_text_from_pdf(self, file):
+        """Extract text from a PDF file with the shared extraction engine"""
         try:
-            import PyPDF2
-            import io
-            
-            # Create a PDF reader object
-            # First make sure we have the file content as bytes
-            if hasattr(file, 'read'):
-                # If it's already a file-like object, read it
-                file_content = file.read()
-                file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                file_content = file
-                
-            # Create BytesIO from bytes content
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-                
-            return text
+            return get_extraction_engine().extract_text(read_file_bytes(file), 'resume.pdf')
+        except Exception as e:
+            raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+    def iter_pages(self, file):
+        """Yield (page_number, text) for a PDF as each page is extracted.
+
+        Pages come from the shared extraction engine; joined with
+        join_pages they give the text extract_text_from_pdf returns, which
+        the engine caches. A cache hit is yielded as a single page.
+        """
+        try:
+            yield from get_extraction_engine().iter_pages(read_file_bytes(file), 'resume.pdf')
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
             
     def extract_text_from_docx(self, docx_file):
-        """Extract text from a DOCX file"""
+        """Extract text from a DOCX file, including tables, text boxes, headers and footers"""
         try:
-            from docx import Document
-            doc = Document(docx_file)
-            full_text = []
-            for paragraph in doc.paragraphs:
-                full_text.append(paragraph.text)
-            return '\n'.join(full_text)
+            return extract_docx_text(docx_file)
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX file: {str(e)}")
 
     def extract_personal_info(self, text):
         """Extract personal information from resume text"""
-        # Basic patterns for personal info
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        phone_pattern = r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        github_pattern = r'github\.com/[\w-]+'
-        
-        # Extract information
-        email = re.search(email_pattern, text)
-        phone = re.search(phone_pattern, text)
-        linkedin = re.search(linkedin_pattern, text)
-        github = re.search(github_pattern, text)
+        parsed = ParsedResume.of(text)
+        matches = parsed.contact_matches
+        email = matches['email']
+        phone = matches['phone']
+        linkedin = matches['linkedin']
+        github = matches['github']
         
         # Get the first line as name (basic assumption)
-        name = text.split('\n')[0].strip()
+        name = parsed.stripped_lines[0]
         
         return {
             'name': name if len(name) > 0 else 'Unknown',
@@ -182,276 +325,209 @@ class ResumeAnalyzer:
             'portfolio': ''  # Can be enhanced later
         }
 
-    def extract_education(self, text):
-        """Extract education information from resume text"""
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
-            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
-        ]
-        in_education_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    # This line contains education info, not just a header
-                    current_entry.append(line)
-                in_education_section = True
-                continue
-            
-            if in_education_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    education.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            education.append(' '.join(current_entry))
-        
-        return education
+    def segment_sections(self, text):
+        """Split resume text into all sections in a single pass over its lines.
 
-    def extract_experience(self, text):
-        """Extract work experience information from resume text"""
-        experience = []
-        lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held', 'experience',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    # This line contains experience info, not just a header
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return experience
-
-    def extract_projects(self, text):
-        """Extract project information from resume text"""
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    # This line contains project info, not just a header
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return projects
+        Returns a dict with 'education', 'experience', 'projects' (lists of
+        entries), 'skills' (list) and 'summary' (string). Each line is
+        stripped, lowercased and scanned for keywords once, then run through
+        every section's state machine. A ParsedResume keeps the result, so
+        the extract_* views share one segmentation.
+        """
+        parsed = ParsedResume.of(text)
+        return parsed.memo('sections', lambda: self._segment_sections(parsed))
 
-    def extract_skills(self, text):
-        """Extract skills from resume text"""
+    def _segment_sections(self, parsed):
+        names = list(self.section_keywords)
+        in_section = dict.fromkeys(names, False)
+        current = {name: [] for name in names}
+        entries = {name: [] for name in names}
         skills = set()  # Use set to avoid duplicates
-        lines = text.split('\n')
-        skills_keywords = [
-            'skills', 'technical skills', 'competencies', 'expertise',
-            'core competencies', 'professional skills', 'key skills',
-            'technical expertise', 'proficiencies', 'qualifications',
-            'top skills', 'key skill', 'major skill', 'personal skill',
-            'soft skills', 'soft skill', 'soft skillset'
-        ]
-        in_skills_section = False
-        current_entry = []
 
-        # Common skill separators
-        separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
-                    # This line contains skills, not just a header
-                    current_entry.append(line)
-                in_skills_section = True
-                continue
-            
-            if in_skills_section:
+        summary_prefix = self._leading_summary(parsed)
+        if summary_prefix:
+            entries['summary'].append(summary_prefix)
+
+        def flush(name):
+            if name == 'skills':
+                self._split_skills(' '.join(current[name]), skills)
+            else:
+                entries[name].append(' '.join(current[name]))
+            current[name] = []
+
+        for line, lowered in zip(parsed.stripped_lines, parsed.lower_lines):
+            hits = self._line_hits(lowered)
+
+            for name in names:
+                # Check for section header
+                if name in hits:
+                    if lowered not in self._section_headers[name]:
+                        # This line contains section info, not just a header
+                        current[name].append(line)
+                    in_section[name] = True
+                    continue
+
+                if not in_section[name]:
+                    continue
+
                 # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
-                        in_skills_section = False
-                        if current_entry:
-                            # Process the current entry
-                            text_to_process = ' '.join(current_entry)
-                            # Split by common separators
-                            for separator in separators:
-                                if separator in text_to_process:
-                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                            current_entry = []
-                        continue
-                
+                if line and 'resume' in hits:
+                    in_section[name] = False
+                    if current[name]:
+                        flush(name)
+                    continue
+
                 if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    # Process the current entry
-                    text_to_process = ' '.join(current_entry)
-                    # Split by common separators
-                    for separator in separators:
-                        if separator in text_to_process:
-                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                    current_entry = []
-        
-        if current_entry:
-            # Process any remaining skills
-            text_to_process = ' '.join(current_entry)
-            for separator in separators:
-                if separator in text_to_process:
-                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-        
-        return list(skills)
+                    current[name].append(line)
+                elif current[name]:  # Empty line and we have content
+                    flush(name)
 
-    def extract_summary(self, text):
-        """Extract summary/objective from resume text"""
-        summary = []
-        lines = text.split('\n')
-        summary_keywords = [
-            'summary', 'professional summary', 'career summary', 'objective',
-            'career objective', 'professional objective', 'about me', 'profile',
-            'professional profile', 'career profile', 'overview', 'skill summary'
-        ]
-        in_summary_section = False
-        current_entry = []
+        for name in names:
+            if current[name]:
+                flush(name)
+
+        return {
+            'education': entries['education'],
+            'experience': entries['experience'],
+            'projects': entries['projects'],
+            'skills': list(skills),
+            'summary': ' '.join(entries['summary'])
+        }
+
+    def _line_hits(self, lowered):
+        """Return the keyword groups (sections and 'resume') found in a lowercased line"""
+        hits = set()
+        for keyword, groups in self._keyword_index:
+            if keyword in lowered:
+                hits |= groups
+        return hits
+
+    def _split_skills(self, text, skills):
+        """Add the skills in text, split on common separators, to the skills set"""
+        for separator in self.skill_separators:
+            if separator in text:
+                skills.update(skill.strip() for skill in text.split(separator) if skill.strip())
 
+    def _leading_summary(self, parsed):
+        """Return the first few lines if they read like an unlabelled summary"""
+        lines = parsed.stripped_lines
         # Try to find summary at the beginning of the resume
         start_index = 0
-        while start_index < min(10, len(lines)) and not lines[start_index].strip():
+        while start_index < min(10, len(lines)) and not lines[start_index]:
             start_index += 1
 
         # Check first few non-empty lines for potential summary
         first_lines = []
-        lines_checked = 0
-        for line in lines[start_index:]:
-            if line.strip():
-                first_lines.append(line.strip())
-                lines_checked += 1
-                if lines_checked >= 5:  # Check first 5 non-empty lines
+        first_index = None
+        for index in range(start_index, len(lines)):
+            if lines[index]:
+                if first_index is None:
+                    first_index = index
+                first_lines.append(lines[index])
+                if len(first_lines) >= 5:  # Check first 5 non-empty lines
                     break
 
         # If first few lines look like a summary (no special formatting, no contact info)
-        if first_lines and not any(keyword in first_lines[0].lower() for keyword in summary_keywords):
+        if first_lines and 'summary' not in self._line_hits(parsed.lower_lines[first_index]):
             potential_summary = ' '.join(first_lines)
             if len(potential_summary.split()) > 10:  # More than 10 words
-                if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
-                    summary.append(potential_summary)
-
-        # Look for explicitly marked summary section
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
-                    # This line contains summary info, not just a header
-                    current_entry.append(line)
-                in_summary_section = True
-                continue
-            
-            if in_summary_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
-                        in_summary_section = False
-                        if current_entry:
-                            summary.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    summary.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            summary.append(' '.join(current_entry))
-        
-        return ' '.join(summary) if summary else ''
+                if not CONTACT_WORD_PATTERN.search(potential_summary.lower()):
+                    return potential_summary
+        return ''
+
+    def extract_education(self, text):
+        """Extract education information from resume text"""
+        return self.segment_sections(text)['education']
+
+    def extract_experience(self, text):
+        """Extract work experience information from resume text"""
+        return self.segment_sections(text)['experience']
+
+    def extract_projects(self, text):
+        """Extract project information from resume text"""
+        return self.segment_sections(text)['projects']
+
+    def extract_skills(self, text):
+        """Extract skills from resume text"""
+        return self.segment_sections(text)['skills']
+
+    def extract_summary(self, text):
+        """Extract summary/objective from resume text"""
+        return self.segment_sections(text)['summary']
+
+    def iter_analysis(self, pages, job_requirements, profile=None):
+        """Analyze a resume incrementally from (page_number, text) pairs.
+
+        Yields a partial result with contact info and summary as soon as the
+        first page arrives, a progress update for each later page, and then
+        the full analyze_resume result. When profiling, time spent waiting
+        for pages is reported as the 'extraction' stage.
+        """
+        profiler = StageProfiler.for_call('resume_analyzer', profile)
+        page_texts = []
+        preview = None
+        pages = iter(pages)
+        while True:
+            with profiler.stage('extraction'):
+                page = next(pages, None)
+            if page is None:
+                break
+            page_number, page_text = page
+            page_texts.append(page_text)
+            if preview is None:
+                first_page = ParsedResume(page_text)
+                preview = {
+                    **self.extract_personal_info(first_page),
+                    'summary': self.extract_summary(first_page)
+                }
+            yield {**preview, 'partial': True, 'pages_parsed': page_number}
+
+        yield self.analyze_resume({'raw_text': join_pages(page_texts)}, job_requirements, profiler)
+
+    def analyze_resume(self, resume_data, job_requirements, profile=None):
+        """Analyze resume and return scores and recommendations.
+
+        With profile=True (or RESUME_PROFILING=1, or a StageProfiler that
+        already timed earlier stages such as extraction) the result gets a
+        '_profile' key with wall and CPU time per stage.
 
-    def analyze_resume(self, resume_data, job_requirements):
-        """Analyze resume and return scores and recommendations"""
+        Results are memoized in the shared analysis cache by text, job
+        requirements and ANALYZER_VERSION unless use_cache is off.
+        """
+        profiler = StageProfiler.for_call('resume_analyzer', profile)
+        resume_data = dict(resume_data, raw_text=normalize_text(resume_data.get('raw_text', '')))
+        if not self.use_cache:
+            return profiler.attach(self._analyze_resume(resume_data, job_requirements, profiler))
+
+        cache = get_analysis_cache()
+        with profiler.stage('cache_lookup'):
+            key = cache.make_key('resume_analyzer', self.ANALYZER_VERSION,
+                                 resume_data['raw_text'], job_requirements)
+            result = cache.get(key)
+        if result is None:
+            result = self._analyze_resume(resume_data, job_requirements, profiler)
+            # Failed analyses are retried on the next run
+            if 'error' not in result:
+                cache.put(key, result)
+        return profiler.attach(result)
+
+    def _analyze_resume(self, resume_data, job_requirements, profiler):
         try:
-            text = resume_data.get('raw_text', '')
+            # Split, lowercase and pattern-match the text once for every step below
+            text = ParsedResume(resume_data.get('raw_text', ''))
             
             # Extract personal information
-            personal_info = self.extract_personal_info(text)
+            with profiler.stage('personal_info'):
+                personal_info = self.extract_personal_info(text)
             
+            # One keyword scan serves the document-type, skill and section checks
+            required_skills = job_requirements.get('required_skills', [])
+            with profiler.stage('keyword_matching'):
+                keyword_hits = self.find_keywords(text, required_skills)
+
             # First detect document type
-            doc_type = self.detect_document_type(text)
+            with profiler.stage('document_type'):
+                doc_type = self.detect_document_type(text, keyword_hits)
             if doc_type != 'resume':
                 return {
                     'ats_score': 0,
@@ -463,153 +539,252 @@ class ResumeAnalyzer:
                 }
                 
             # Calculate keyword match
-            required_skills = job_requirements.get('required_skills', [])
-            keyword_match = self.calculate_keyword_match(text, required_skills)
+            with profiler.stage('keyword_matching'):
+                keyword_match = self.calculate_keyword_match(text, required_skills, keyword_hits)
             
             # Extract all resume sections
-            education = self.extract_education(text)
-            experience = self.extract_experience(text)
-            projects = self.extract_projects(text)
-            skills = list(self.extract_skills(text))  # Convert skills set to list
-            summary = self.extract_summary(text)
+            with profiler.stage('section_parsing'):
+                sections = self.segment_sections(text)
+            education = sections['education']
+            experience = sections['experience']
+            skills = sections['skills']
+            summary = sections['summary']
             
             # Check resume sections
-            section_score = self.check_resume_sections(text)
+            with profiler.stage('section_check'):
+                section_score = self.check_resume_sections(text, keyword_hits)
             
             # Check formatting
-            format_score, format_deductions = self.check_formatting(text)
-            
-            # Generate section-specific suggestions
-            contact_suggestions = []
-            if not personal_info.get('email'):
-                contact_suggestions.append("Add your email address")
-            if not personal_info.get('phone'):
-                contact_suggestions.append("Add your phone number")
-            if not personal_info.get('linkedin'):
-                contact_suggestions.append("Add your LinkedIn profile URL")
+            with profiler.stage('formatting'):
+                format_score, format_deductions = self.check_formatting(text)
             
-            summary_suggestions = []
-            if not summary:
-                summary_suggestions.append("Add a professional summary to highlight your key qualifications")
-            elif len(summary.split()) < 30:
-                summary_suggestions.append("Expand your professional summary to better highlight your experience and goals")
-            elif len(summary.split()) > 100:
-                summary_suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
-            
-            skills_suggestions = []
-            if not skills:
-                skills_suggestions.append("Add a dedicated skills section")
-            if isinstance(skills, (list, set)) and len(list(skills)) < 5:
-                skills_suggestions.append("List more relevant technical and soft skills")
-            if keyword_match['score'] < 70:
-                skills_suggestions.append("Add more skills that match the job requirements")
-            
-            experience_suggestions = []
-            if not experience:
-                experience_suggestions.append("Add your work experience section")
-            else:
-                has_dates = any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience)
-                has_bullets = any(re.search(r'[•\-\*]', exp) for exp in experience)
-                has_action_verbs = any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b', 
-                                               exp.lower()) for exp in experience)
-                
-                if not has_dates:
-                    experience_suggestions.append("Include dates for each work experience")
-                if not has_bullets:
-                    experience_suggestions.append("Use bullet points to list your achievements and responsibilities")
-                if not has_action_verbs:
-                    experience_suggestions.append("Start bullet points with strong action verbs")
-            
-            education_suggestions = []
-            if not education:
-                education_suggestions.append("Add your educational background")
-            else:
-                has_dates = any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education)
-                has_degree = any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b', 
-                                         edu.lower()) for edu in education)
-                has_gpa = any(re.search(r'\b(gpa|cgpa|grade|percentage)\b', 
-                                      edu.lower()) for edu in education)
-                
-                if not has_dates:
-                    education_suggestions.append("Include graduation dates")
-                if not has_degree:
-                    education_suggestions.append("Specify your degree type")
-                if not has_gpa and job_requirements.get('require_gpa', False):
-                    education_suggestions.append("Include your GPA if it's above 3.0")
-            
-            format_suggestions = []
-            if format_score < 100:
-                format_suggestions.extend(format_deductions)
-            
-            # Calculate section-specific scores
-            contact_score = 100 - (len(contact_suggestions) * 25)  # -25 for each missing item
-            summary_score = 100 - (len(summary_suggestions) * 33)  # -33 for each issue
-            skills_score = keyword_match['score']
-            experience_score = 100 - (len(experience_suggestions) * 25)
-            education_score = 100 - (len(education_suggestions) * 25)
-            
-            # Calculate overall ATS score with weighted components
-            ats_score = (
-                int(round(contact_score * 0.1)) +      # 10% weight for contact info
-                int(round(summary_score * 0.1)) +      # 10% weight for summary
-                int(round(skills_score * 0.3)) +       # 30% weight for skills match
-                int(round(experience_score * 0.2)) +   # 20% weight for experience
-                int(round(education_score * 0.1)) +    # 10% weight for education
-                int(round(format_score * 0.2))         # 20% weight for formatting
-            )
-            
-            # Combine all suggestions into a single list
-            suggestions = []
-            suggestions.extend(contact_suggestions)
-            suggestions.extend(summary_suggestions)
-            suggestions.extend(skills_suggestions)
-            suggestions.extend(experience_suggestions)
-            suggestions.extend(education_suggestions)
-            suggestions.extend(format_suggestions)
-            
-            if not suggestions:
-                suggestions.append("Your resume is well-optimized for ATS systems")
-            
-            # Return final structured result
-            return {
-                **personal_info,  # Include extracted personal info
-                'ats_score': ats_score,
-                'document_type': 'resume',
-                'keyword_match': keyword_match,
-                'section_score': section_score,
-                'format_score': format_score,
-                'education': education,
-                'experience': experience,
-                'projects': projects,
-                'skills': skills,
-                'summary': summary,
-                'suggestions': suggestions,
-                'contact_suggestions': contact_suggestions,
-                'summary_suggestions': summary_suggestions,
-                'skills_suggestions': skills_suggestions,
-                'experience_suggestions': experience_suggestions,
-                'education_suggestions': education_suggestions,
-                'format_suggestions': format_suggestions,
-                'section_scores': {
-                    'contact': contact_score,
-                    'summary': summary_score,
-                    'skills': skills_score,
-                    'experience': experience_score,
-                    'education': education_score,
-                    'format': format_score
+            with profiler.stage('scoring'):
+                sub_scores = {
+                    'contact': self.contact_score(personal_info),
+                    'summary': self.summary_score(summary),
+                    'skills': self.skills_score(skills, keyword_match),
+                    'experience': self.experience_score(experience),
+                    'education': self.education_score(education, job_requirements),
+                    'format': (format_score, format_deductions if format_score < 100 else [])
                 }
-            }
+                return self.compose_result(personal_info, keyword_match, section_score, sections, sub_scores)
         except Exception as e:
             import traceback
             print(f"Error analyzing resume: {str(e)}")
             print(traceback.format_exc())
             # Return a default error response
-            return {
-                'error': f"Resume analysis failed: {str(e)}",
-                'ats_score': 0,
-                'document_type': 'unknown',
-                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
-                'section_score': 0,
-                'format_score': 0,
-                'suggestions': [f"Error analyzing resume: {str(e)}. Please check your file and try again."]
-            }
\ No newline at end of file
+            return _analysis_error(str(e))
+
+    def contact_score(self, personal_info):
+        """Return the contact sub-score and its suggestions"""
+        suggestions = []
+        if not personal_info.get('email'):
+            suggestions.append("Add your email address")
+        if not personal_info.get('phone'):
+            suggestions.append("Add your phone number")
+        if not personal_info.get('linkedin'):
+            suggestions.append("Add your LinkedIn profile URL")
+        return 100 - (len(suggestions) * 25), suggestions  # -25 for each missing item
+
+    def summary_score(self, summary):
+        """Return the summary sub-score and its suggestions"""
+        suggestions = []
+        if not summary:
+            suggestions.append("Add a professional summary to highlight your key qualifications")
+        elif len(summary.split()) < 30:
+            suggestions.append("Expand your professional summary to better highlight your experience and goals")
+        elif len(summary.split()) > 100:
+            suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
+        return 100 - (len(suggestions) * 33), suggestions  # -33 for each issue
+
+    def skills_score(self, skills, keyword_match):
+        """Return the skills sub-score (the keyword match score) and its suggestions"""
+        suggestions = []
+        if not skills:
+            suggestions.append("Add a dedicated skills section")
+        if isinstance(skills, (list, set)) and len(list(skills)) < 5:
+            suggestions.append("List more relevant technical and soft skills")
+        if keyword_match['score'] < 70:
+            suggestions.append("Add more skills that match the job requirements")
+        return keyword_match['score'], suggestions
+
+    def experience_score(self, experience):
+        """Return the experience sub-score and its suggestions"""
+        suggestions = []
+        if not experience:
+            suggestions.append("Add your work experience section")
+        else:
+            has_dates = any(YEAR_PATTERN.search(exp) for exp in experience)
+            has_bullets = any(BULLET_PATTERN.search(exp) for exp in experience)
+            has_action_verbs = any(ACTION_VERB_PATTERN.search(exp.lower()) for exp in experience)
+        
+            if not has_dates:
+                suggestions.append("Include dates for each work experience")
+            if not has_bullets:
+                suggestions.append("Use bullet points to list your achievements and responsibilities")
+            if not has_action_verbs:
+                suggestions.append("Start bullet points with strong action verbs")
+        return 100 - (len(suggestions) * 25), suggestions
+
+    def education_score(self, education, job_requirements):
+        """Return the education sub-score and its suggestions"""
+        suggestions = []
+        if not education:
+            suggestions.append("Add your educational background")
+        else:
+            has_dates = any(YEAR_PATTERN.search(edu) for edu in education)
+            has_degree = any(DEGREE_PATTERN.search(edu.lower()) for edu in education)
+            has_gpa = any(GPA_PATTERN.search(edu.lower()) for edu in education)
+        
+            if not has_dates:
+                suggestions.append("Include graduation dates")
+            if not has_degree:
+                suggestions.append("Specify your degree type")
+            if not has_gpa and job_requirements.get('require_gpa', False):
+                suggestions.append("Include your GPA if it's above 3.0")
+        return 100 - (len(suggestions) * 25), suggestions
+
+    def compose_result(self, personal_info, keyword_match, section_score, sections, sub_scores):
+        """Build the analyze_resume result from the (score, suggestions) of every sub-score"""
+        section_scores = {name: score for name, (score, _) in sub_scores.items()}
+        
+        # Calculate overall ATS score with weighted components
+        ats_score = (
+            int(round(section_scores['contact'] * 0.1)) +      # 10% weight for contact info
+            int(round(section_scores['summary'] * 0.1)) +      # 10% weight for summary
+            int(round(section_scores['skills'] * 0.3)) +       # 30% weight for skills match
+            int(round(section_scores['experience'] * 0.2)) +   # 20% weight for experience
+            int(round(section_scores['education'] * 0.1)) +    # 10% weight for education
+            int(round(section_scores['format'] * 0.2))         # 20% weight for formatting
+        )
+        
+        # Combine all suggestions into a single list
+        suggestions = []
+        for name in ('contact', 'summary', 'skills', 'experience', 'education', 'format'):
+            suggestions.extend(sub_scores[name][1])
+        if not suggestions:
+            suggestions.append("Your resume is well-optimized for ATS systems")
+        
+        # Return final structured result
+        return {
+            **personal_info,  # Include extracted personal info
+            'ats_score': ats_score,
+            'document_type': 'resume',
+            'keyword_match': keyword_match,
+            'section_score': section_score,
+            'format_score': section_scores['format'],
+            'education': sections['education'],
+            'experience': sections['experience'],
+            'projects': sections['projects'],
+            'skills': sections['skills'],
+            'summary': sections['summary'],
+            'suggestions': suggestions,
+            'contact_suggestions': list(sub_scores['contact'][1]),
+            'summary_suggestions': list(sub_scores['summary'][1]),
+            'skills_suggestions': list(sub_scores['skills'][1]),
+            'experience_suggestions': list(sub_scores['experience'][1]),
+            'education_suggestions': list(sub_scores['education'][1]),
+            'format_suggestions': list(sub_scores['format'][1]),
+            'section_scores': section_scores
+        }
+
+    def analyze_many(self, texts, job_requirements, workers=None, ordered=True, window=None, compact=False):
+        """Analyze many resume texts in a process pool, yielding (index, result) pairs.
+
+        index is the position of the text in the input. With ordered=True
+        results come in input order, otherwise as soon as each finishes. At
+        most window texts (default four per worker) are queued or held
+        back at once, so texts can be a lazy iterable of any length. A
+        failing item yields an analyze_resume-style error result and the
+        batch carries on. If a worker process dies, the pool is rebuilt and
+        the items it took down are re-run one at a time, so only the item
+        that crashes gets an error result.
+
+        With compact=True results are ResumeAnalysis objects (call
+        to_dict() for the usual dict), which take far less memory when a
+        batch keeps thousands of them.
+        """
+        workers = workers or os.cpu_count() or 1
+        window = max(1, window or workers * 4)
+        pack = ResumeAnalysis.from_dict if compact else (lambda result: result)
+        if workers < 2:
+            for index, text in enumerate(texts):
+                # A failing item gets an error result, as in the pool path
+                try:
+                    result = self.analyze_resume({'raw_text': text}, job_requirements)
+                except Exception as e:
+                    result = _analysis_error(str(e))
+                yield index, pack(result)
+            return
+
+        def new_pool():
+            # Spawned, not forked, like the extraction pool: a forked child of
+            # the multithreaded Streamlit server can inherit a held lock
+            return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_batch_worker, initargs=(self.use_cache,))
+
+        source = enumerate(texts)
+        exhausted = False
+        in_flight = {}      # future -> (index, text)
+        held = {}           # Finished results waiting for an earlier index (ordered only)
+        suspects = deque()  # Items lost in a crash, re-run alone to find the culprit
+        next_index = 0
+        finished = deque()
+        pool = new_pool()
+
+        def submit(index, text):
+            in_flight[pool.submit(_analyze_batch_item, text, job_requirements)] = (index, text)
+
+        try:
+            while True:
+                if suspects:
+                    if not in_flight:
+                        submit(*suspects.popleft())
+                else:
+                    while not exhausted and len(in_flight) + len(held) < window:
+                        item = next(source, None)
+                        if item is None:
+                            exhausted = True
+                        else:
+                            submit(*item)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                lost = []
+                for future in done:
+                    index, text = in_flight.pop(future)
+                    try:
+                        finished.append((index, future.result()))
+                    except BrokenProcessPool:
+                        lost.append((index, text))
+                    except Exception as e:
+                        finished.append((index, _analysis_error(str(e))))
+
+                if lost:
+                    # A dead worker takes the whole pool down; keep what finished
+                    for future, (index, text) in in_flight.items():
+                        if future.done() and future.exception() is None:
+                            finished.append((index, future.result()))
+                        else:
+                            lost.append((index, text))
+                    in_flight.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = new_pool()
+                    if len(lost) == 1:
+                        finished.append((lost[0][0], _analysis_error("worker process crashed")))
+                    else:
+                        suspects.extend(lost)
+
+                while finished:
+                    index, result = finished.popleft()
+                    result = pack(result)
+                    if not ordered:
+                        yield index, result
+                        continue
+                    held[index] = result
+                    while next_index in held:
+                        yield next_index, held.pop(next_index)
+                        next_index += 1
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -1,44 +1,34 @@
-import pypdf
-import docx
 import re
-from io import BytesIO
+
+from .docx_text import extract_docx_text
+from .extraction_cache import read_file_bytes
+from .extraction_engine import get_extraction_engine
+from .skills_lexicon import get_skill_lexicon
+
 
 class ResumeParser:
     def __init__(self):
-        pass
+        # Skills are recognized by the shared canonical skills lexicon
+        self.skill_lexicon = get_skill_lexicon()
         
     def extract_text_from_pdf(self, pdf_file):
         try:
-            # Handle different file input types
-            if hasattr(pdf_file, 'read'):
-                # If it's a file-like object
-                file_content = pdf_file.read()
-                pdf_file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                file_content = pdf_file
-                
-            pdf_reader = pypdf.PdfReader(BytesIO(file_content))
-            text = ""
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-                else:
-                    # Handle empty page text
-                    text += "\n"
-            return text.strip()
+            # The shared extraction engine picks the backend and caches the text
+            return get_extraction_engine().extract_text(read_file_bytes(pdf_file), 'resume.pdf')
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
+
+    def iter_pages(self, pdf_file):
+        """Yield (page_number, text) for a PDF as each page is extracted"""
+        try:
+            yield from get_extraction_engine().iter_pages(read_file_bytes(pdf_file), 'resume.pdf')
+        except Exception as e:
+            print(f"Error extracting text from PDF: {e}")
             
     def extract_text_from_docx(self, docx_file):
         try:
-            doc = docx.Document(BytesIO(docx_file.read()))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return extract_docx_text(docx_file).strip()
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
@@ -62,15 +52,10 @@ class ResumeParser:
         experience = []
         education = []
         
-        # Common programming languages and tools
-        skill_keywords = ['python', 'java', 'javascript', 'html', 'css', 'sql', 'react', 'angular', 'vue', 
-                         'node', 'express', 'django', 'flask', 'spring', 'docker', 'kubernetes', 'aws', 
-                         'azure', 'git', 'jenkins', 'jira']
-                         
-        # Look for skills
-        text_lower = text.lower()
-        for skill in skill_keywords:
-            if skill in text_lower:
+        # Look for skills: canonical names, in order of first mention
+        for _, skill_id in self.skill_lexicon.find(text):
+            skill = self.skill_lexicon.names[skill_id]
+            if skill not in skills:
                 skills.append(skill)
                 
         return {
@@ -0,0 +1,123 @@
+import numpy as np
+
+from .keyword_matcher import register_keywords
+from .parsed_resume import ParsedResume
+from .skills_lexicon import get_skill_lexicon
+
+try:
+    from scipy import sparse
+except ImportError:
+    # Dense fallback: the role catalogue is small enough either way
+    sparse = None
+
+
+class RoleMatcher:
+    """Scores a resume against every role of a JOB_ROLES catalogue at once.
+
+    Required skills are compiled into a role x skill 0/1 matrix. A resume
+    is turned into a skill-presence vector with one keyword scan, and a
+    single matrix-vector product gives the matched skill count of every
+    role. Skill matching is the same as in
+    ResumeAnalyzer.calculate_keyword_match: canonical skill IDs for skills
+    the lexicon knows, word-bounded keyword matching for the rest.
+    """
+
+    def __init__(self, job_roles):
+        self.roles = []   # (category, role) per matrix row
+        self.skills = []  # Original spelling of each matrix column
+        self.role_skills = []
+        skill_index = {}
+        rows, cols = [], []
+
+        for category, roles in job_roles.items():
+            for role, info in roles.items():
+                row = len(self.roles)
+                self.roles.append((category, role))
+                self.role_skills.append(list(info.get('required_skills', [])))
+                for skill in info.get('required_skills', []):
+                    key = skill.lower()
+                    if key not in skill_index:
+                        skill_index[key] = len(self.skills)
+                        self.skills.append(skill)
+                    rows.append(row)
+                    cols.append(skill_index[key])
+
+        self.skill_index = skill_index
+        lexicon = get_skill_lexicon()
+        # Columns of skills the lexicon knows, matched by canonical ID; the
+        # rest are matched by keyword
+        self.lexicon_columns = []
+        self.keyword_skills = []
+        for column, skill in enumerate(self.skills):
+            skill_id = lexicon.resolve(skill)
+            if skill_id is None:
+                self.keyword_skills.append(skill)
+            else:
+                self.lexicon_columns.append((column, skill_id))
+        register_keywords(self.keyword_skills)
+        shape = (len(self.roles), len(self.skills))
+        # Duplicate skills within a role collapse to a single 1
+        pairs = sorted(set(zip(rows, cols)))
+        data = np.ones(len(pairs), dtype=np.float64)
+        row_ids = np.array([row for row, _ in pairs], dtype=np.int32)
+        col_ids = np.array([col for _, col in pairs], dtype=np.int32)
+        if sparse is not None:
+            self.matrix = sparse.csr_matrix((data, (row_ids, col_ids)), shape=shape)
+        else:
+            self.matrix = np.zeros(shape, dtype=np.float64)
+            self.matrix[row_ids, col_ids] = 1
+        self.required_counts = np.asarray(self.matrix.sum(axis=1)).ravel()
+
+    def skill_vector(self, text):
+        """Return the 0/1 presence vector of every catalogue skill in text"""
+        parsed = ParsedResume.of(text)
+        found_ids = get_skill_lexicon().expand(parsed.skill_ids)
+        vector = np.zeros(len(self.skills), dtype=np.float64)
+        for column, skill_id in self.lexicon_columns:
+            if skill_id in found_ids:
+                vector[column] = 1
+        if self.keyword_skills:
+            for skill in parsed.keywords_in(self.keyword_skills):
+                vector[self.skill_index[skill]] = 1
+        return vector
+
+    def _scores(self, vector):
+        found_counts = self.matrix @ vector
+        return np.divide(found_counts * 100, self.required_counts,
+                         out=np.zeros_like(found_counts), where=self.required_counts > 0)
+
+    def score_all(self, text):
+        """Return the keyword match score (0-100) of every role, in self.roles order"""
+        return self._scores(self.skill_vector(text))
+
+    def rank_roles(self, text, top_k=5):
+        """Return the best-fitting roles with their found and missing skills.
+
+        Each entry has the same 'score', 'found_skills' and 'missing_skills'
+        keys as calculate_keyword_match, plus 'category' and 'role'.
+        """
+        vector = self.skill_vector(text)
+        scores = self._scores(vector)
+
+        # Stable sort keeps catalogue order between equally scored roles
+        order = np.argsort(-scores, kind='stable')
+        if top_k:
+            order = order[:top_k]
+
+        ranked = []
+        for row in order:
+            category, role = self.roles[row]
+            found_skills, missing_skills = [], []
+            for skill in self.role_skills[row]:
+                if vector[self.skill_index[skill.lower()]]:
+                    found_skills.append(skill)
+                else:
+                    missing_skills.append(skill)
+            ranked.append({
+                'category': category,
+                'role': role,
+                'score': float(scores[row]),
+                'found_skills': found_skills,
+                'missing_skills': missing_skills
+            })
+        return ranked
@@ -0,0 +1,238 @@
+import math
+import re
+
+import numpy as np
+
+from .keyword_matcher import keywords_in, register_keywords
+from .skills_lexicon import get_skill_lexicon, skills_from_column
+
+_TOKEN = re.compile(r'[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]')
+
+# Words that carry no signal when a free-text job description is the query
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it of on or our the to we will with you your
+this that these those who what which their they them us all any can should must able using
+experience work working team teams strong good excellent knowledge skills years year role
+""".split())
+
+
+def tokenize(text):
+    """Return the normalized terms of text (lowercased; keeps c++, c#, node.js)"""
+    return _TOKEN.findall(text.lower())
+
+
+def normalize_skill(skill):
+    """Return the canonical form of a skill phrase, e.g. 'UI/UX' -> 'ui ux', 'ReactJS' -> 'react'"""
+    return ' '.join(tokenize(get_skill_lexicon().canonical(skill)))
+
+
+class CandidateIndex:
+    """Inverted index over a batch of candidates for top-K screening.
+
+    Every candidate contributes normalized skill phrases (its parsed skills
+    plus any lexicon or vocabulary skill found in its text; lexicon skills
+    under their canonical names, with their parent skills) and terms (the
+    tokens of its text and skills). Postings are frozen into sorted numpy
+    arrays, so a query costs one vectorized add per required skill plus a
+    partial sort for the top K; no candidate text is rescanned.
+    """
+
+    def __init__(self, vocabulary=()):
+        # Known skill phrases looked for in candidate text, e.g. every JOB_ROLES skill
+        self.vocabulary = sorted({skill for skill in vocabulary if normalize_skill(skill)})
+        register_keywords(self.vocabulary)
+        self.candidates = []  # (candidate_id, info) per document number
+        # Postings are appended to as lists and frozen into arrays for queries
+        self._skill_lists = {}
+        self._term_lists = {}
+        self._skill_postings = {}
+        self._term_postings = {}
+        self._frozen = True
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def add(self, candidate_id, text='', skills=(), info=None):
+        """Index one candidate from its text and/or parsed skills list"""
+        doc = len(self.candidates)
+        self.candidates.append((candidate_id, info or {}))
+
+        lexicon = get_skill_lexicon()
+        phrases = set()
+        skill_ids = set()
+        for skill in skills:
+            skill_id = lexicon.resolve(skill)
+            if skill_id is None:
+                phrases.add(normalize_skill(skill))
+                skill_ids.update(lexicon.find_ids(skill))
+            else:
+                skill_ids.add(skill_id)
+        if text:
+            skill_ids.update(lexicon.find_ids(text))
+            if self.vocabulary:
+                found = keywords_in(text, self.vocabulary)
+                phrases.update(normalize_skill(skill) for skill in found)
+        # Lexicon skills (and their parents) count under their canonical names
+        phrases.update(normalize_skill(lexicon.names[skill_id]) for skill_id in lexicon.expand(skill_ids))
+        phrases.discard('')
+
+        terms = set(tokenize(text)) if text else set()
+        for phrase in phrases:
+            terms.update(phrase.split())
+
+        for phrase in phrases:
+            self._skill_lists.setdefault(phrase, []).append(doc)
+        for term in terms:
+            self._term_lists.setdefault(term, []).append(doc)
+        self._frozen = False
+
+    def _freeze(self):
+        """Convert postings lists to int arrays (sorted, as documents are numbered in order)"""
+        if self._frozen:
+            return
+        self._skill_postings = {key: np.asarray(docs, dtype=np.int32) for key, docs in self._skill_lists.items()}
+        self._term_postings = {key: np.asarray(docs, dtype=np.int32) for key, docs in self._term_lists.items()}
+        self._frozen = True
+
+    def _postings(self, skill, known=False):
+        """Return the documents that have a skill (normalized phrase).
+
+        Phrases and words a candidate was not indexed with fall back to its
+        terms, except for skills the lexicon knows (known=True): those are
+        indexed whenever the lexicon finds them, and their raw words would
+        bring back the ambiguous ones it leaves out ('node', 'spring').
+        """
+        docs = self._skill_postings.get(skill)
+        if known:
+            return docs if docs is not None else np.empty(0, dtype=np.int32)
+        tokens = skill.split()
+        if len(tokens) == 1:
+            term_docs = self._term_postings.get(skill)
+            if docs is None:
+                return term_docs if term_docs is not None else np.empty(0, dtype=np.int32)
+            return docs if term_docs is None else np.union1d(docs, term_docs)
+
+        if docs is not None:
+            return docs
+        # Phrase never indexed as a skill: fall back to candidates with all its terms
+        result = None
+        for token in tokens:
+            term_docs = self._term_postings.get(token)
+            if term_docs is None:
+                return np.empty(0, dtype=np.int32)
+            result = term_docs if result is None else np.intersect1d(result, term_docs, assume_unique=True)
+        return result
+
+    def _rank(self, items, weights, top_k, skills=False):
+        """Score documents by the weighted share of items they have; return the top_k.
+
+        With skills=True the items are skills, and lexicon skills only
+        match candidates indexed with them.
+        """
+        self._freeze()
+        lexicon = get_skill_lexicon()
+        scores = np.zeros(len(self.candidates), dtype=np.float64)
+        postings = []
+        for item, weight in zip(items, weights):
+            docs = self._postings(normalize_skill(item), skills and lexicon.resolve(item) is not None)
+            postings.append(docs)
+            scores[docs] += weight
+
+        total = sum(weights)
+        if total:
+            scores *= 100 / total
+
+        count = min(top_k or len(scores), len(scores))
+        if count == 0:
+            return []
+        if count < len(scores):
+            # Earlier-added candidates win ties at the cut-off score
+            cutoff = -np.partition(-scores, count - 1)[count - 1]
+            above = np.flatnonzero(scores > cutoff)
+            tied = np.flatnonzero(scores == cutoff)[:count - len(above)]
+            top = np.concatenate((above, tied))
+        else:
+            top = np.arange(len(scores))
+        # Best score first; earlier-added candidates win ties
+        top = top[np.lexsort((top, -scores[top]))]
+
+        results = []
+        for doc in top:
+            candidate_id, info = self.candidates[doc]
+            found_skills, missing_skills = [], []
+            for item, docs in zip(items, postings):
+                index = np.searchsorted(docs, doc)
+                if index < len(docs) and docs[index] == doc:
+                    found_skills.append(item)
+                else:
+                    missing_skills.append(item)
+            results.append(dict(
+                info,
+                candidate_id=candidate_id,
+                score=float(scores[doc]),
+                found_skills=found_skills,
+                missing_skills=missing_skills
+            ))
+        return results
+
+    def top_candidates(self, required_skills, top_k=10):
+        """Rank candidates for a role by the share of its required skills they have.
+
+        Scores use the same 0-100 scale as calculate_keyword_match.
+        """
+        required_skills = list(dict.fromkeys(required_skills))
+        return self._rank(required_skills, [1.0] * len(required_skills), top_k, skills=True)
+
+    def search(self, job_description, top_k=10):
+        """Rank candidates for a free-text job description.
+
+        Vocabulary skills named in the description are used as the required
+        skills. When it names none, its informative terms are used instead,
+        weighted by inverse document frequency.
+        """
+        if self.vocabulary:
+            found = keywords_in(job_description, self.vocabulary)
+            lexicon = get_skill_lexicon()
+            found_ids = lexicon.find_ids(job_description)
+            skills = [skill for skill in self.vocabulary
+                      if skill.lower() in found or lexicon.resolve(skill) in found_ids]
+            if skills:
+                return self.top_candidates(skills, top_k)
+
+        self._freeze()
+        terms = [term for term in dict.fromkeys(tokenize(job_description))
+                 if term not in STOPWORDS and term in self._term_postings]
+        total = len(self.candidates)
+        weights = [math.log(1 + total / len(self._term_postings[term])) for term in terms]
+        return self._rank(terms, weights, top_k)
+
+    @classmethod
+    def from_resumes(cls, resumes, vocabulary=()):
+        """Build an index from (candidate_id, parsed) pairs.
+
+        parsed is a ResumeParser.parse or ResumeAnalyzer.analyze_resume
+        result; its 'raw_text' and 'skills' are indexed and 'name' and
+        'email' are returned with each match.
+        """
+        index = cls(vocabulary)
+        for candidate_id, parsed in resumes:
+            index.add(
+                candidate_id,
+                text=parsed.get('raw_text', ''),
+                skills=parsed.get('skills', []),
+                info={'name': parsed.get('name', ''), 'email': parsed.get('email', '')}
+            )
+        return index
+
+    @classmethod
+    def from_rows(cls, rows, vocabulary=()):
+        """Build an index from get_resumes_for_screening() rows"""
+        index = cls(vocabulary)
+        for resume_id, name, email, target_role, skills, summary, experience in rows:
+            index.add(
+                resume_id,
+                text=' '.join(part for part in (summary, experience) if part),
+                skills=skills_from_column(skills),
+                info={'name': name, 'email': email, 'target_role': target_role}
+            )
+        return index
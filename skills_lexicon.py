@@ -0,0 +1,324 @@
+import ast
+import re
+import threading
+
+from .keyword_matcher import get_keyword_matcher, register_keywords
+
+# Canonical skills: (name, category, aliases, parent skills). A skill's ID is
+# its position here. Names follow config.job_roles so required skills
+# resolve directly; parents are broader skills a match also counts for
+# (React is JavaScript and frontend work).
+SKILLS = (
+    # Programming
+    ('Python', 'Programming', ('python3',), ()),
+    ('Java', 'Programming', (), ()),
+    ('JavaScript', 'Programming', ('js', 'ecmascript', 'es6'), ()),
+    ('TypeScript', 'Programming', (), ('JavaScript',)),
+    ('C++', 'Programming', ('cpp',), ()),
+    ('C#', 'Programming', ('c sharp', 'csharp'), ()),
+    ('R', 'Programming', ('r programming',), ()),
+    ('Kotlin', 'Programming', (), ()),
+    ('Swift', 'Programming', (), ()),
+    ('Golang', 'Programming', (), ()),
+    ('Ruby', 'Programming', (), ()),
+    ('PHP', 'Programming', (), ()),
+    ('Rust', 'Programming', (), ()),
+    ('Scala', 'Programming', (), ()),
+    # Web development
+    ('Frontend Tech', 'Web Development', ('frontend', 'front-end', 'front end'), ()),
+    ('Backend Tech', 'Web Development', ('backend', 'back-end', 'back end'), ()),
+    ('HTML', 'Web Development', ('html5',), ('Frontend Tech',)),
+    ('CSS', 'Web Development', ('css3',), ('Frontend Tech',)),
+    ('React', 'Web Development', ('react.js', 'reactjs', 'react js'), ('JavaScript', 'Frontend Tech')),
+    ('Angular', 'Web Development', ('angularjs', 'angular.js'), ('TypeScript', 'Frontend Tech')),
+    ('Vue.js', 'Web Development', ('vue', 'vuejs', 'vue js'), ('JavaScript', 'Frontend Tech')),
+    ('Node.js', 'Web Development', ('node', 'nodejs', 'node js'), ('JavaScript', 'Backend Tech')),
+    ('Express', 'Web Development', ('express.js', 'expressjs'), ('Node.js',)),
+    ('Django', 'Web Development', (), ('Python', 'Backend Tech')),
+    ('Flask', 'Web Development', (), ('Python', 'Backend Tech')),
+    ('Spring', 'Web Development', ('spring boot', 'spring framework', 'spring mvc'), ('Java', 'Backend Tech')),
+    ('APIs', 'Web Development', ('api', 'rest api', 'restful api', 'graphql'), ()),
+    ('Responsive Design', 'Web Development', ('responsive web design',), ('Frontend Tech',)),
+    # Mobile
+    ('React Native', 'Mobile', ('react-native',), ('JavaScript',)),
+    ('Flutter', 'Mobile', (), ()),
+    ('App Store Deployment', 'Mobile', ('app store', 'google play', 'play store'), ()),
+    ('Mobile UI/UX', 'Mobile', ('mobile ui', 'mobile ux', 'mobile design'), ('UI/UX',)),
+    # Databases
+    ('Databases', 'Database', ('database', 'dbms', 'rdbms'), ()),
+    ('SQL', 'Database', (), ('Databases',)),
+    ('MySQL', 'Database', (), ('SQL',)),
+    ('PostgreSQL', 'Database', ('postgres',), ('SQL',)),
+    ('MongoDB', 'Database', ('mongo',), ('Databases',)),
+    ('Redis', 'Database', (), ('Databases',)),
+    ('Database Design', 'Database', ('data modeling', 'data modelling', 'schema design'), ('Databases',)),
+    # Cloud
+    ('Cloud Computing', 'Cloud', ('cloud', 'cloud platforms', 'cloud infrastructure', 'cloud services'), ()),
+    ('AWS', 'Cloud', ('amazon web services',), ('Cloud Computing',)),
+    ('Azure', 'Cloud', ('microsoft azure',), ('Cloud Computing',)),
+    ('GCP', 'Cloud', ('google cloud', 'google cloud platform'), ('Cloud Computing',)),
+    # DevOps
+    ('DevOps', 'DevOps', ('dev ops',), ()),
+    ('Docker', 'DevOps', (), ()),
+    ('Kubernetes', 'DevOps', ('k8s',), ()),
+    ('CI/CD', 'DevOps', ('ci cd', 'continuous integration', 'continuous delivery',
+                         'continuous deployment'), ()),
+    ('Jenkins', 'DevOps', (), ('CI/CD',)),
+    ('GitHub Actions', 'DevOps', (), ('CI/CD',)),
+    ('Infrastructure as Code', 'DevOps', ('iac',), ()),
+    ('Terraform', 'DevOps', (), ('Infrastructure as Code',)),
+    ('Ansible', 'DevOps', (), ('Infrastructure as Code',)),
+    ('Monitoring', 'DevOps', ('observability',), ()),
+    ('Prometheus', 'DevOps', (), ('Monitoring',)),
+    ('Grafana', 'DevOps', (), ('Monitoring',)),
+    ('Linux', 'DevOps', (), ()),
+    ('Automation', 'DevOps', (), ()),
+    ('Performance Tuning', 'DevOps', ('performance optimization', 'performance optimisation'), ()),
+    ('System Design', 'DevOps', ('system architecture', 'software architecture'), ()),
+    # Data and AI
+    ('Machine Learning', 'Data & AI', ('ml',), ()),
+    ('Deep Learning', 'Data & AI', ('neural networks',), ('Machine Learning',)),
+    ('Artificial Intelligence', 'Data & AI', ('ai',), ()),
+    ('Data Science', 'Data & AI', (), ()),
+    ('Analytics', 'Data & AI', ('data analysis', 'data analytics'), ()),
+    ('Statistics', 'Data & AI', ('statistical analysis',), ()),
+    ('Data Visualization', 'Data & AI', ('data visualisation', 'data viz'), ()),
+    ('Tableau', 'Data & AI', (), ('Data Visualization',)),
+    ('Power BI', 'Data & AI', ('powerbi',), ('Data Visualization',)),
+    ('Excel', 'Data & AI', ('ms excel', 'microsoft excel'), ()),
+    ('TensorFlow', 'Data & AI', (), ('Deep Learning',)),
+    ('PyTorch', 'Data & AI', (), ('Deep Learning',)),
+    ('scikit-learn', 'Data & AI', ('sklearn', 'scikit learn'), ('Machine Learning',)),
+    ('Pandas', 'Data & AI', (), ('Python',)),
+    ('NumPy', 'Data & AI', (), ('Python',)),
+    ('MLOps', 'Data & AI', ('ml ops',), ('Machine Learning',)),
+    ('NLP', 'Data & AI', ('natural language processing',), ('Machine Learning',)),
+    ('Computer Vision', 'Data & AI', (), ('Machine Learning',)),
+    # Security
+    ('Security', 'Security', ('cybersecurity', 'cyber security', 'information security', 'infosec'), ()),
+    ('Network Security', 'Security', (), ('Security',)),
+    ('Web Security', 'Security', ('application security', 'appsec'), ('Security',)),
+    ('Ethical Hacking', 'Security', ('penetration testing', 'pentesting', 'pen testing'), ('Security',)),
+    ('Incident Response', 'Security', (), ('Security',)),
+    ('Threat Detection', 'Security', ('threat hunting',), ('Security',)),
+    ('Security Tools', 'Security', ('siem',), ('Security',)),
+    ('Wireshark', 'Security', (), ('Security Tools',)),
+    ('Metasploit', 'Security', (), ('Security Tools',)),
+    ('Nmap', 'Security', (), ('Security Tools',)),
+    ('Burp Suite', 'Security', (), ('Security Tools',)),
+    # Design
+    ('UI/UX', 'Design', ('ui ux', 'ux/ui', 'ux ui', 'user experience', 'user interface'), ()),
+    ('Figma', 'Design', (), ()),
+    ('Adobe XD', 'Design', (), ()),
+    ('Wireframing', 'Design', ('wireframes', 'wireframe'), ()),
+    ('Prototyping', 'Design', ('prototypes', 'prototype'), ()),
+    ('User Research', 'Design', (), ()),
+    ('Usability Testing', 'Design', ('user testing',), ()),
+    ('Visual Design', 'Design', (), ()),
+    ('Typography', 'Design', (), ()),
+    ('Color Theory', 'Design', ('colour theory',), ()),
+    ('3D Graphics', 'Design', ('3d modeling', '3d modelling'), ()),
+    # Game development
+    ('Unity', 'Game Development', ('unity3d',), ()),
+    ('Unreal Engine', 'Game Development', ('unreal', 'ue4', 'ue5'), ()),
+    ('Game Physics', 'Game Development', (), ()),
+    # Management
+    ('Agile', 'Management', (), ()),
+    ('Scrum', 'Management', (), ('Agile',)),
+    ('Kanban', 'Management', (), ('Agile',)),
+    ('Project Management', 'Management', (), ()),
+    ('Project Planning', 'Management', (), ()),
+    ('Risk Management', 'Management', (), ()),
+    ('Stakeholder Management', 'Management', (), ()),
+    ('Roadmapping', 'Management', ('roadmap', 'product roadmap'), ()),
+    ('Product Strategy', 'Management', (), ()),
+    ('Market Research', 'Management', (), ()),
+    ('User Stories', 'Management', ('user story',), ()),
+    # Tools
+    ('Git', 'Tools', ('github', 'gitlab'), ()),
+    ('Jira', 'Tools', (), ()),
+)
+
+# One-word names and aliases that are also everyday words ("Spring 2020",
+# "Express delivery", "network node"). They still resolve in skill lists
+# (required skills, a candidate's skills column), but in free text they
+# only count in the case-sensitive spellings given here, or not at all.
+# A one-letter spelling never counts as a middle initial ("John R. Smith").
+AMBIGUOUS_TERMS = {
+    'spring': (),
+    'express': (),
+    'node': (),
+    'r': ('R',),
+    'cloud': (),
+    'ai': ('AI',),
+    'swift': ('Swift',),
+    'unity': ('Unity',),
+    'excel': ('Excel',),
+    'rust': ('Rust',),
+    'unreal': ('Unreal',)
+}
+
+UNCATEGORIZED = 'Other'
+
+
+def _normalize(skill):
+    return ' '.join(skill.lower().split())
+
+
+def skills_from_column(value):
+    """Return the skill list of a stored resume_data.skills value.
+
+    Values are list literals, builder dict literals ({category: skills})
+    or plain comma-separated text.
+    """
+    if not value:
+        return []
+    try:
+        skills = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        skills = [skill.strip() for skill in value.split(',')]
+    if isinstance(skills, dict):
+        # Builder resumes store skills by category
+        skills = [skill for values in skills.values() for skill in values]
+    elif isinstance(skills, str):
+        skills = [skills]
+    return [str(skill) for skill in skills if str(skill).strip()]
+
+
+class SkillLexicon:
+    """Canonical skill IDs with aliases, categories and parent skills.
+
+    Every name and alias is compiled into the shared Aho-Corasick automaton
+    (keyword_matcher), so a text is resolved to skill IDs in the same single
+    scan that finds document and section keywords, with longest-match
+    (leftmost, longest alias wins: 'react native' is React Native, not
+    React). Matching skills is then a set operation on integer IDs.
+    Ambiguous terms resolve as skill names but are left out of the
+    automaton; in text only their case-sensitive spellings count.
+    """
+
+    def __init__(self, skills=SKILLS, ambiguous=AMBIGUOUS_TERMS):
+        self.names = [name for name, _, _, _ in skills]
+        self.categories = [category for _, category, _, _ in skills]
+        ids = {name: skill_id for skill_id, name in enumerate(self.names)}
+        self._alias_ids = {}
+        self._aliases = [[] for _ in self.names]  # Free-text aliases per skill
+        for skill_id, (name, _, aliases, _) in enumerate(skills):
+            for alias in (name,) + tuple(aliases):
+                key = _normalize(alias)
+                if self._alias_ids.get(key, skill_id) != skill_id:
+                    raise ValueError(f"Skill alias '{alias}' is used by two skills")
+                if key not in self._alias_ids and key not in ambiguous:
+                    self._aliases[skill_id].append(key)
+                self._alias_ids[key] = skill_id
+
+        # Case-sensitive free-text spellings of ambiguous terms
+        self._cased_ids = {}
+        self._cased_forms = [[] for _ in self.names]
+        for term, forms in ambiguous.items():
+            skill_id = self._alias_ids.get(term)
+            if skill_id is None:
+                raise ValueError(f"Ambiguous term '{term}' is not a skill name or alias")
+            for form in forms:
+                self._cased_ids[form] = skill_id
+                self._cased_forms[skill_id].append(form)
+        self._cased_pattern = None
+        if self._cased_ids:
+            forms = '|'.join(
+                re.escape(form) if len(form) > 1 else f'{re.escape(form)}(?!\\. [A-Z])'
+                for form in sorted(self._cased_ids, key=len, reverse=True)
+            )
+            # Whole words only, and not part of an ampersand abbreviation (R&D)
+            self._cased_pattern = re.compile(f'(?<![\\w&])({forms})(?![\\w&])')
+
+        # Ancestors include the skill itself, so expanding a set is one union per ID
+        parents = [[ids[parent] for parent in skill_parents] for _, _, _, skill_parents in skills]
+        self._ancestors = []
+        for skill_id in range(len(self.names)):
+            seen = {skill_id}
+            stack = list(parents[skill_id])
+            while stack:
+                parent = stack.pop()
+                if parent not in seen:
+                    seen.add(parent)
+                    stack.extend(parents[parent])
+            self._ancestors.append(frozenset(seen))
+
+        self._free_aliases = frozenset(alias for aliases in self._aliases for alias in aliases)
+        register_keywords(self._free_aliases)
+
+    def __len__(self):
+        return len(self.names)
+
+    def resolve(self, skill):
+        """Return the ID of a skill name or alias, or None if it is unknown"""
+        return self._alias_ids.get(_normalize(skill))
+
+    def aliases_of(self, skill_id):
+        """Return the normalized name and aliases that identify a skill in free text (any case)"""
+        return list(self._aliases[skill_id])
+
+    def cased_forms_of(self, skill_id):
+        """Return the spellings that identify a skill in free text only with this exact case"""
+        return list(self._cased_forms[skill_id])
+
+    def canonical(self, skill):
+        """Return the canonical name of a skill, or the skill itself if unknown"""
+        skill_id = self.resolve(skill)
+        return skill if skill_id is None else self.names[skill_id]
+
+    def find(self, text, lower=None, hits=None):
+        """Return (offset, skill ID) for the longest non-overlapping skill mentions in text.
+
+        Pass lower if the caller already has text.lower(), and hits if it
+        already scanned it with the shared automaton.
+        """
+        if lower is None:
+            lower = text.lower()
+        if hits is None:
+            hits = get_keyword_matcher(self._free_aliases).find_all(lower, lowered=True)
+        hits = [(start, start + len(alias), self._alias_ids[alias])
+                for start, alias in hits if alias in self._free_aliases]
+        if self._cased_pattern is not None:
+            hits.extend((match.start(), match.end(), self._cased_ids[match.group(1)])
+                        for match in self._cased_pattern.finditer(text))
+        hits.sort(key=lambda hit: (hit[0], -hit[1]))
+        found = []
+        end = 0
+        for start, hit_end, skill_id in hits:
+            if start >= end:
+                found.append((start, skill_id))
+                end = hit_end
+        return found
+
+    def find_ids(self, text, lower=None, hits=None):
+        """Return the set of skill IDs mentioned in text"""
+        return frozenset(skill_id for _, skill_id in self.find(text, lower, hits))
+
+    def expand(self, skill_ids):
+        """Return skill_ids with every parent skill added"""
+        return frozenset().union(*(self._ancestors[skill_id] for skill_id in skill_ids))
+
+    def category_of(self, skill):
+        """Return the category of a skill phrase: its own, or its first known skill's"""
+        skill_id = self.resolve(skill)
+        if skill_id is None:
+            found = self.find(skill)
+            if not found:
+                return UNCATEGORIZED
+            skill_id = found[0][1]
+        return self.categories[skill_id]
+
+
+_skill_lexicon = None
+_skill_lexicon_lock = threading.Lock()
+
+
+def get_skill_lexicon():
+    """Return the process-wide skill lexicon, compiled on first use"""
+    global _skill_lexicon
+    if _skill_lexicon is None:
+        with _skill_lexicon_lock:
+            if _skill_lexicon is None:
+                _skill_lexicon = SkillLexicon()
+    return _skill_lexicon
@@ -0,0 +1,106 @@
+import os
+import sys
+
+import pytest
+
+# Tests import utils.* from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SYNTHETIC_SECTIONS = [
+    ('Professional Summary', ["Data engineer with eight years of experience building reliable pipelines "
+                              "and analytics platforms for fast growing product teams"]),
+    ('Work Experience', ["Senior Engineer, Acme Corp, 2019 - Present",
+                         "Led migration of batch jobs to streaming, cutting latency by 80%",
+                         "", "Engineer, Initech, 2015 - 2019", "Maintained billing services"]),
+    ('Education', ["B.Tech in Computer Science, State University, 2015"]),
+    ('Projects', ["Resume parser: open source tool for structured resume data",
+                  "", "Metrics dashboard: real-time service health views"]),
+    ('Technical Skills', ["Python, SQL, Spark, Airflow | Docker / Kubernetes"]),
+]
+
+
+def _synthetic_resume(repeat):
+    lines = ["Jane Doe", "jane@example.com | +1 555 0100", ""]
+    for _ in range(repeat):
+        for header, body in SYNTHETIC_SECTIONS:
+            lines.extend([header] + body + [""])
+    return '\n'.join(lines)
+
+
+def _synthetic_resumes(count, size=None):
+    return [_synthetic_resume(size or index % 3 + 1) + f"\nCandidate {index}" for index in range(count)]
+
+
+@pytest.fixture
+def synthetic_resume():
+    """Builder of a resume whose sections are repeated to make a long document"""
+    return _synthetic_resume
+
+
+@pytest.fixture
+def synthetic_resumes():
+    """Builder of count distinct resumes, of size repeats or of one to three by default"""
+    return _synthetic_resumes
+
+
+def _legacy_section_scan(text, keywords, resume_keywords):
+    entries, current, in_section = [], [], False
+    for line in text.split('\n'):
+        line = line.strip()
+        if any(keyword.lower() in line.lower() for keyword in keywords):
+            if not any(keyword.lower() == line.lower() for keyword in keywords):
+                current.append(line)
+            in_section = True
+            continue
+        if in_section:
+            if line and any(keyword.lower() in line.lower() for keyword in resume_keywords):
+                if not any(key.lower() in line.lower() for key in keywords):
+                    in_section = False
+                    if current:
+                        entries.append(' '.join(current))
+                        current = []
+                    continue
+            if line:
+                current.append(line)
+            elif current:
+                entries.append(' '.join(current))
+                current = []
+    if current:
+        entries.append(' '.join(current))
+    return entries
+
+
+@pytest.fixture
+def legacy_section_scan():
+    """Per-section scan as ResumeAnalyzer did it before segment_sections"""
+    return _legacy_section_scan
+
+
+def _text_pdf(pages):
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>']
+    kids = ' '.join(f'{3 + 2 * index} 0 R' for index in range(len(pages)))
+    objects.append(f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>')
+    font = 3 + 2 * len(pages)
+    for index, page_text in enumerate(pages):
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 {font} 0 R >> >> /Contents {4 + 2 * index} 0 R >>')
+        stream = f'BT /F1 12 Tf 72 720 Td ({page_text}) Tj ET'
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+    objects.append('<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+
+    data = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f'{number} 0 obj\n{body}\nendobj\n'.encode()
+    xref = len(data)
+    data += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    data += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode()
+    data += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    return data
+
+
+@pytest.fixture
+def text_pdf():
+    """Builder of a minimal PDF with a text layer, one string per page"""
+    return _text_pdf
@@ -0,0 +1,37 @@
+import pickle
+
+import pytest
+
+from utils.analysis_results import ResumeAnalysis
+from utils.resume_analyzer import ResumeAnalyzer
+
+
+def test_resume_analysis_round_trips_analyze_resume_results(synthetic_resumes):
+    analyzer = ResumeAnalyzer(use_cache=False)
+    requirements = {'required_skills': ['Python', 'SQL', 'Kubernetes', 'Go']}
+    for text in synthetic_resumes(6):
+        # Batch workers send results pickled, so round-trip them the same way
+        result = pickle.loads(pickle.dumps(analyzer.analyze_resume({'raw_text': text}, requirements)))
+        assert ResumeAnalysis.from_dict(result).to_dict() == result
+
+
+def test_resume_analysis_round_trips_error_results():
+    result = {
+        'error': "Resume analysis failed: boom",
+        'ats_score': 0,
+        'document_type': 'unknown',
+        'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
+        'section_score': 0,
+        'format_score': 0,
+        'suggestions': ["Error analyzing resume: boom. Please check your file and try again."]
+    }
+    assert ResumeAnalysis.from_dict(result).to_dict() == result
+
+
+def test_profile_analysis_round_trips_analyze_batch_results(synthetic_resumes):
+    pytest.importorskip('spacy')
+    from utils.analysis_results import ProfileAnalysis
+    from utils.analyzer import ResumeAnalyzer as ProfileAnalyzer
+
+    for result in ProfileAnalyzer(use_cache=False).analyze_batch(synthetic_resumes(6)):
+        assert ProfileAnalysis.from_dict(result).to_dict() == result
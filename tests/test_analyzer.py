@@ -0,0 +1,101 @@
+import pytest
+
+pytest.importorskip('spacy')
+
+from utils.analyzer import ResumeAnalyzer
+from utils.doc_cache import DocCache
+from utils.nlp_models import get_nlp, model_version
+from utils.profile_matcher import get_profile_matcher
+
+# (text, years of experience the profile matcher should read)
+EXPERIENCE_CASES = (
+    ("I have 5 years of Python", 5),
+    ("3-5 years experience", 5),
+    ("3–5 years in data engineering", 5),
+    ("5+ yrs in AWS", 5),
+    ("10 + years.", 10),
+    ("2.5 years at Acme", 2),
+    ("18 months at Google", 1),
+    ("6 months internship", 0),
+    ("over 30 months", 2),
+    ("5years", 5),
+    ("5+years of Java", 5),
+    ("2.125years", 2),
+    ("3-5years", 5),
+    ("3–5yrs", 5),
+    ("18months", 1),
+    ("10YRS", 10),
+    ("5+Yrs", 5),
+    ("24mos", 2),
+    ("Class of 2020, 3.8 GPA", 0),
+)
+
+
+def test_get_nlp_shares_one_trimmed_pipeline():
+    nlp = get_nlp()
+    assert get_nlp() is nlp
+    assert ResumeAnalyzer(use_cache=False).nlp is nlp
+    assert nlp.has_pipe('sentencizer')
+    assert not {'parser', 'ner', 'lemmatizer'} & set(nlp.pipe_names)
+
+
+def _without_timestamp(result):
+    return {key: value for key, value in result.items() if key != 'timestamp'}
+
+
+@pytest.mark.parametrize('n_process', [1, 2])
+def test_analyze_batch_matches_analyze_resume(synthetic_resumes, n_process):
+    analyzer = ResumeAnalyzer(use_cache=False)
+    texts = synthetic_resumes(8)
+    single = [_without_timestamp(analyzer.analyze_resume(text)) for text in texts]
+    batched = analyzer.analyze_batch(texts, batch_size=3, n_process=n_process)
+    assert [_without_timestamp(result) for result in batched] == single
+
+
+@pytest.mark.parametrize('text, years', EXPERIENCE_CASES)
+def test_experience_years(text, years):
+    nlp = get_nlp()
+    assert get_profile_matcher(nlp)(nlp(text))[1] == years
+
+
+def test_skills_in_order_of_first_mention():
+    nlp = get_nlp()
+    matcher = get_profile_matcher(nlp)
+    skill_ids, _ = matcher(nlp("Built Node.js services and Docker images; more Node.js"))
+    assert [matcher.lexicon.names[skill_id] for skill_id in skill_ids][:2] == ['Node.js', 'Docker']
+
+
+def test_doc_cache_hits_match_parsing_and_are_yielded_a_chunk_at_a_time(tmp_path, synthetic_resumes):
+    batch_size = 4
+    texts = synthetic_resumes(12)
+    expected = [_without_timestamp(result)
+                for result in ResumeAnalyzer(use_cache=False).analyze_batch(texts)]
+    analyzer = ResumeAnalyzer(use_cache=False)
+    analyzer.doc_cache = DocCache(str(tmp_path / 'doc_cache.db'))
+
+    for _ in ('fill', 'hit'):
+        read = 0
+
+        def source():
+            nonlocal read
+            for text in texts:
+                read += 1
+                yield text
+
+        results = []
+        for result in analyzer.analyze_batch(source(), batch_size=batch_size):
+            results.append(_without_timestamp(result))
+            # Texts read beyond those yielded stay bounded, also when all are hits
+            assert read - len(results) < batch_size
+        assert results == expected
+    assert analyzer.doc_cache.stats()['hits'] == len(texts)
+
+
+def test_doc_cache_is_keyed_by_model_version(tmp_path):
+    cache = DocCache(str(tmp_path / 'doc_cache.db'))
+    nlp = get_nlp()
+    list(cache.parse(nlp, ["Python developer, 5 years"]))
+    assert cache.make_key("Python developer, 5 years", 'other-model') != \
+        cache.make_key("Python developer, 5 years", model_version(nlp))
+    assert [doc.text for doc in cache.parse(nlp, ["Python developer, 5 years"])] == ["Python developer, 5 years"]
+    assert cache.stats()['hits'] == 1
@@ -0,0 +1,115 @@
+import copy
+
+import pytest
+
+from utils.builder_analysis import FORM_SECTIONS, IncrementalAnalyzer, form_skills, render_form_sections, section_text
+from utils.resume_analyzer import ResumeAnalyzer
+
+JOB_REQUIREMENTS = {'required_skills': ['Python', 'SQL', 'Spark', 'Airflow', 'Docker', 'Java']}
+
+FORM_DATA = {
+    'personal_info': {
+        'full_name': 'Jane Doe',
+        'email': 'jane@example.com',
+        'phone': '+1 555 0100',
+        'location': 'Austin, TX',
+        'linkedin': 'linkedin.com/in/janedoe',
+        'portfolio': ''
+    },
+    'summary': "Data engineer with eight years of experience building reliable pipelines "
+               "and analytics platforms for product teams",
+    'experiences': [{
+        'position': 'Senior Engineer',
+        'company': 'Acme Corp',
+        'start_date': '2019',
+        'end_date': 'Present',
+        'description': 'Built streaming pipelines',
+        'responsibilities': ['Led migration of batch jobs to streaming, cutting latency by 80%'],
+        'achievements': ['Managed a team of 5 engineers']
+    }],
+    'education': [{
+        'degree': 'B.Tech',
+        'field': 'Computer Science',
+        'school': 'State University',
+        'graduation_date': '2015',
+        'gpa': '3.8',
+        'achievements': []
+    }],
+    'projects': [{
+        'name': 'Resume parser',
+        'technologies': 'Python, spaCy',
+        'description': 'Open source tool for structured resume data',
+        'responsibilities': [],
+        'achievements': [],
+        'link': ''
+    }],
+    'skills_categories': {
+        'technical': ['Python', 'SQL', 'Spark', 'Docker'],
+        'soft': ['Leadership'],
+        'languages': [],
+        'tools': ['Airflow']
+    }
+}
+
+# Result keys computed from the whole document rather than its sections
+DOCUMENT_KEYS = ('document_type', 'name', 'email', 'linkedin', 'keyword_match',
+                 'section_score', 'format_score', 'format_suggestions', 'contact_suggestions')
+
+
+def _rendered_text(form_data):
+    rendered = render_form_sections(form_data)
+    texts = (section_text(name, rendered[name]) for name in FORM_SECTIONS)
+    return '\n'.join(text for text in texts if text)
+
+
+def _edited(**changes):
+    form_data = copy.deepcopy(FORM_DATA)
+    for path, value in changes.items():
+        target = form_data
+        *parents, key = path.split('__')
+        for parent in parents:
+            target = target[int(parent) if parent.isdigit() else parent]
+        target[key] = value
+    return form_data
+
+
+def test_analyze_matches_full_analysis_of_rendered_text(monkeypatch):
+    incremental = IncrementalAnalyzer(ResumeAnalyzer(use_cache=False)).analyze(FORM_DATA, JOB_REQUIREMENTS)
+
+    full_analyzer = ResumeAnalyzer(use_cache=False)
+    text = _rendered_text(FORM_DATA)
+    full = full_analyzer.analyze_resume({'raw_text': text}, JOB_REQUIREMENTS)
+    for key in DOCUMENT_KEYS:
+        assert incremental[key] == full[key], key
+
+    # Given the form's own sections, the full analysis agrees on everything
+    rendered = render_form_sections(FORM_DATA)
+    monkeypatch.setattr(full_analyzer, 'segment_sections', lambda parsed: {
+        'education': rendered['education'],
+        'experience': rendered['experience'],
+        'projects': rendered['projects'],
+        'skills': form_skills(FORM_DATA),
+        'summary': rendered['summary'][0]
+    })
+    assert incremental == full_analyzer.analyze_resume({'raw_text': text}, JOB_REQUIREMENTS)
+
+
+@pytest.mark.parametrize('changes, recomputed', [
+    ({}, []),
+    ({'summary': FORM_DATA['summary'] + " across three continents"}, ['summary', 'format']),
+    ({'personal_info__phone': '555-010-0199'}, ['contact', 'format']),
+    # Same length, so the format facts are unchanged
+    ({'education__0__gpa': '3.9'}, ['education']),
+    ({'skills_categories__technical': ['Python', 'SQL', 'Spark', 'Docker', 'Java']},
+     ['skills', 'format', 'section_check']),
+])
+def test_analyze_recomputes_only_what_an_edit_touched(changes, recomputed):
+    analyzer = ResumeAnalyzer(use_cache=False)
+    incremental = IncrementalAnalyzer(analyzer)
+    incremental.analyze(FORM_DATA, JOB_REQUIREMENTS)
+
+    form_data = _edited(**changes)
+    result = incremental.analyze(form_data, JOB_REQUIREMENTS)
+
+    assert incremental.recomputed == recomputed
+    assert result == IncrementalAnalyzer(analyzer).analyze(form_data, JOB_REQUIREMENTS)
@@ -0,0 +1,187 @@
+import pytest
+
+from utils import extraction_cache
+from utils.extraction_cache import ExtractionCache
+from utils.extraction_engine import ExtractionEngine, create_default_engine, join_pages
+from utils.extraction_workers import ExtractionError, SandboxedExtractor
+from utils.page_extraction import OCR_MIN_CHARS, needs_ocr
+
+FIRST_PAGE = "Jane Doe Senior Python developer with eight years of experience"
+SECOND_PAGE = "Skills: Python SQL Spark Airflow Docker Kubernetes"
+
+
+def _features(kind='pdf', page_count=1, has_text=True, has_images=False):
+    return {'kind': kind, 'size': 1000, 'page_count': page_count,
+            'has_text': has_text, 'has_images': has_images}
+
+
+def _engine(*backends):
+    engine = ExtractionEngine(use_cache=False, parallel=False)
+    for name, extract, kinds, cost, options in backends:
+        engine.register_backend(name, extract, kinds, cost, **options)
+    return engine
+
+
+def _names(backends):
+    return [backend.name for backend in backends]
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    # Spawned sandbox workers inherit the working directory, so their disk
+    # cache lands in tmp_path; the parent uses a memory-only cache
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(extraction_cache, '_extraction_cache', ExtractionCache(db_path=None))
+
+
+def test_needs_ocr_counts_non_whitespace_characters():
+    assert needs_ocr("")
+    assert needs_ocr(" \n\t " * 50)
+    assert needs_ocr("x " * (OCR_MIN_CHARS - 1))
+    assert not needs_ocr("x " * OCR_MIN_CHARS)
+    assert not needs_ocr(FIRST_PAGE)
+    assert needs_ocr("short", min_chars=6)
+    assert not needs_ocr("short", min_chars=5)
+
+
+def test_plan_orders_backends_by_expected_cost():
+    engine = _engine(
+        ('slow', None, ['pdf'], 0.05, {'paged': True}),
+        ('fast', None, ['pdf'], 0.01, {'paged': True}),
+        ('ocr', None, ['pdf'], 2.0, {'needs_images': True, 'paged': True}),
+        ('docx', None, ['docx'], 0.001, {}),
+    )
+
+    assert _names(engine.plan(_features())) == ['fast', 'slow']
+    assert _names(engine.plan(_features(has_images=True))) == ['fast', 'slow', 'ocr']
+    # Image-only documents skip text-layer backends
+    assert _names(engine.plan(_features(has_text=False, has_images=True))) == ['ocr']
+    assert _names(engine.plan(_features(kind='docx'))) == ['docx']
+
+
+def test_plan_prefers_backends_that_succeed():
+    engine = _engine(
+        ('fast', None, ['pdf'], 0.01, {'paged': True}),
+        ('slow', None, ['pdf'], 0.02, {'paged': True}),
+    )
+    for _ in range(4):
+        engine.backends['fast'].record(0.01, 1, '', False)
+        engine.backends['slow'].record(0.02, 1, FIRST_PAGE, True)
+
+    assert _names(engine.plan(_features())) == ['slow', 'fast']
+
+
+def test_extract_escalates_past_a_backend_without_usable_text():
+    engine = _engine(
+        ('empty', lambda buffer, features: ['', ' '], ['text'], 0.001, {'paged': True}),
+        ('full', lambda buffer, features: FIRST_PAGE, ['text'], 0.01, {}),
+    )
+
+    result = engine.extract(b'plain text document')
+
+    assert result['backend'] == 'full'
+    assert result['text'] == FIRST_PAGE
+    assert [attempt['ok'] for attempt in result['attempts']] == [False, True]
+
+
+def test_extract_ocrs_only_pages_without_text(text_pdf):
+    ocr_calls = []
+
+    def fake_ocr(buffer, features, page_numbers):
+        ocr_calls.append(list(page_numbers))
+        return [SECOND_PAGE for _ in page_numbers]
+
+    engine = create_default_engine(use_cache=False, parallel=False)
+    engine.register_backend('ocr', fake_ocr, ['pdf'], cost=2.0, needs_images=True, paged=True)
+
+    result = engine.extract(text_pdf([FIRST_PAGE, "", FIRST_PAGE]))
+
+    assert ocr_calls == [[2]]
+    assert result['ocr_pages'] == [2]
+    assert result['text'] == join_pages([FIRST_PAGE, SECOND_PAGE, FIRST_PAGE])
+
+
+def test_iter_pages_joins_to_extract_text(text_pdf):
+    engine = create_default_engine(use_cache=False, parallel=False)
+    data = text_pdf([FIRST_PAGE, SECOND_PAGE])
+
+    pages = list(engine.iter_pages(data, 'resume.pdf'))
+
+    assert [page_number for page_number, _ in pages] == [1, 2]
+    assert join_pages([page_text for _, page_text in pages]) == engine.extract_text(data, 'resume.pdf')
+
+
+@pytest.fixture
+def sandbox():
+    sandboxes = []
+
+    def build(**options):
+        sandboxes.append(SandboxedExtractor(**options))
+        return sandboxes[-1]
+
+    yield build
+    for extractor in sandboxes:
+        extractor.close()
+
+
+def _idle_worker(extractor):
+    worker = extractor._idle.get_nowait()
+    extractor._idle.put(worker)
+    return worker
+
+
+def test_sandbox_extracts_pdf_text(sandbox, text_pdf):
+    extractor = sandbox(workers=1)
+
+    text = extractor.extract_text(text_pdf([FIRST_PAGE, SECOND_PAGE]), 'resume.pdf')
+
+    assert text == join_pages([FIRST_PAGE, SECOND_PAGE])
+
+
+def test_sandbox_enforces_page_cap(sandbox, text_pdf):
+    extractor = sandbox(workers=1, max_pages=1)
+
+    with pytest.raises(ExtractionError, match="limit is 1"):
+        extractor.extract_text(text_pdf([FIRST_PAGE, SECOND_PAGE]), 'resume.pdf')
+    # A refused document does not cost the worker
+    assert _idle_worker(extractor).process.is_alive()
+
+
+def test_sandbox_timeout_replaces_the_worker(sandbox, text_pdf):
+    # A freshly spawned worker is still importing, so a tiny timeout expires
+    extractor = sandbox(workers=1, timeout=0.01)
+    extractor._ensure_started()
+    stuck = _idle_worker(extractor)
+
+    with pytest.raises(ExtractionError, match="timed out"):
+        extractor.extract_text(text_pdf([FIRST_PAGE]), 'resume.pdf')
+
+    assert not stuck.process.is_alive()
+    replacement = _idle_worker(extractor)
+    assert replacement is not stuck
+    assert replacement.process.is_alive()
+
+
+def test_sandbox_recycles_workers_after_max_jobs(sandbox, text_pdf):
+    extractor = sandbox(workers=1, max_jobs_per_worker=2)
+    extractor._ensure_started()
+    first = _idle_worker(extractor)
+
+    extractor.extract_text(text_pdf([FIRST_PAGE]), 'first.pdf')
+    assert _idle_worker(extractor) is first
+
+    extractor.extract_text(text_pdf([SECOND_PAGE]), 'second.pdf')
+    assert _idle_worker(extractor) is not first
+    first.process.join(timeout=5)
+    assert not first.process.is_alive()
+
+
+def test_sandbox_refuses_work_when_every_worker_stays_busy(sandbox, text_pdf):
+    extractor = sandbox(workers=1, wait_timeout=0.1)
+    extractor._ensure_started()
+    busy = extractor._idle.get_nowait()
+    try:
+        with pytest.raises(ExtractionError, match="busy"):
+            extractor.extract_text(text_pdf([FIRST_PAGE]), 'resume.pdf')
+    finally:
+        extractor._idle.put(busy)
@@ -0,0 +1,41 @@
+import pytest
+
+from utils.keyword_matcher import KeywordMatcher, get_keyword_matcher, keywords_in, register_keywords
+from utils.parsed_resume import ParsedResume
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.skills_lexicon import get_skill_lexicon
+
+KEYWORD_SETS = (
+    ['Java', 'C++', 'Spring', 'Airflow'],
+    ['project', 'React', 'React Native', 'Node.js'],
+    ['an unregistered phrase', 'Kafka Streams'],
+)
+
+
+@pytest.fixture
+def resume_text(synthetic_resume):
+    return synthetic_resume(2) + "\nJavaScript, Spring Boot, React Native and C++ side projects"
+
+
+@pytest.mark.parametrize('keywords', KEYWORD_SETS)
+def test_shared_automaton_finds_what_a_dedicated_one_does(resume_text, keywords):
+    assert keywords_in(resume_text, keywords) == KeywordMatcher(keywords).keywords_in(resume_text)
+    assert ParsedResume(resume_text).keywords_in(keywords) == KeywordMatcher(keywords).keywords_in(resume_text)
+
+
+def test_registered_keywords_share_one_automaton(resume_text):
+    analyzer = ResumeAnalyzer(use_cache=False)
+    lexicon = get_skill_lexicon()
+    register_keywords(KEYWORD_SETS[0])
+    matcher = get_keyword_matcher()
+
+    parsed = ParsedResume(resume_text)
+    hits = parsed.keywords_in(analyzer.document_keywords)
+    parsed.keywords_in(KEYWORD_SETS[0])
+    skill_ids = parsed.skill_ids
+
+    assert get_keyword_matcher(KEYWORD_SETS[0]) is matcher
+    # Document keywords, role skills and lexicon aliases all came from one scan
+    assert [key for key in parsed._memo if key[0] == 'keyword_hits'] == [('keyword_hits', matcher)]
+    assert hits == KeywordMatcher(analyzer.document_keywords).keywords_in(resume_text)
+    assert skill_ids == frozenset(skill_id for _, skill_id in lexicon.find(resume_text))
@@ -0,0 +1,121 @@
+import pytest
+
+from utils.parsed_resume import ParsedResume
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.skills_lexicon import get_skill_lexicon
+
+REQUIRED_SKILLS = ['Python', 'SQL', 'Spark', 'Airflow', 'Docker', 'Java']
+
+# (text, required skills, skills that must be found): everyday words that
+# are also skill names must not earn a skill, unambiguous forms must
+LEXICON_CASES = (
+    ("Internship, Spring 2020", ['Java', 'Spring'], []),
+    ("Spring Boot microservices", ['Java', 'Spring'], ['Java', 'Spring']),
+    ("Express delivery driver", ['JavaScript', 'Express'], []),
+    ("Express.js REST services", ['JavaScript', 'Express'], ['JavaScript', 'Express']),
+    ("Configured every network node", ['Node.js'], []),
+    ("Node.js backend", ['Node.js', 'JavaScript'], ['Node.js', 'JavaScript']),
+    ("Led the R&D department", ['R'], []),
+    ("Statistics in R programming", ['R'], ['R']),
+    ("Skills: Python, SQL, R", ['R'], ['R']),
+    ("Languages: Python, R.", ['R'], ['R']),
+    ("John R. Smith, analyst", ['R'], []),
+    ("Stipend of Rs. 20,000", ['R'], []),
+    ("Moved to the cloud team", ['Cloud Computing'], []),
+    ("AWS cloud infrastructure", ['Cloud Computing'], ['Cloud Computing']),
+    ("Ai Chen, sales associate", ['Artificial Intelligence'], []),
+    ("Built AI assistants", ['Artificial Intelligence'], ['Artificial Intelligence']),
+    ("Known for swift turnaround", ['Swift'], []),
+    ("iOS apps in Swift", ['Swift'], ['Swift']),
+    ("Fostered unity across teams", ['Unity'], []),
+    ("Unity game developer", ['Unity'], ['Unity']),
+    ("Strive to excel at support", ['Excel'], []),
+    ("Advanced Excel reporting", ['Excel'], ['Excel']),
+    ("Handled rust removal", ['Rust'], []),
+    ("Systems programming in Rust", ['Rust'], ['Rust']),
+    ("An unreal deadline", ['Unreal Engine'], []),
+    ("Unreal Engine 5 levels", ['Unreal Engine'], ['Unreal Engine']),
+)
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return ResumeAnalyzer(use_cache=False)
+
+
+@pytest.mark.parametrize('size', [1, 10])
+def test_segment_sections_matches_per_section_scans(analyzer, synthetic_resume, legacy_section_scan, size):
+    text = synthetic_resume(size)
+    resume_keywords = analyzer.document_types['resume']
+    sections = analyzer.segment_sections(text)
+    for name in ('education', 'experience', 'projects'):
+        keywords = analyzer.section_keywords[name]
+        assert sections[name] == legacy_section_scan(text, keywords, resume_keywords)
+
+
+@pytest.mark.parametrize('size', [1, 10])
+def test_steps_give_the_same_result_on_parsed_resume(analyzer, synthetic_resume, size):
+    text = synthetic_resume(size)
+    parsed = ParsedResume(text)
+    steps = [
+        analyzer.extract_personal_info,
+        analyzer.detect_document_type,
+        lambda resume: analyzer.calculate_keyword_match(resume, REQUIRED_SKILLS),
+        analyzer.extract_education,
+        analyzer.extract_experience,
+        analyzer.extract_projects,
+        analyzer.extract_skills,
+        analyzer.extract_summary,
+        analyzer.check_resume_sections,
+        analyzer.check_formatting
+    ]
+    for step in steps:
+        assert step(parsed) == step(text)
+
+
+def test_parsed_resume_views():
+    parsed = ParsedResume("Led ML work. Built APIs in Python\nSQL, python")
+    assert [parsed.text[start:end] for start, end in parsed.sentence_spans] == [
+        "Led ML work", " Built APIs in Python\nSQL, python"
+    ]
+    assert parsed.tokens == {'led', 'ml', 'work', 'built', 'apis', 'in', 'python', 'sql'}
+    assert parsed.lower_lines == ["led ml work. built apis in python", "sql, python"]
+
+
+def test_analyze_many_matches_analyze_resume(analyzer, synthetic_resumes):
+    requirements = {'required_skills': REQUIRED_SKILLS}
+    texts = synthetic_resumes(6)
+    expected = [analyzer.analyze_resume({'raw_text': text}, requirements) for text in texts]
+    results = list(analyzer.analyze_many(texts, requirements, workers=2))
+    assert [index for index, _ in results] == list(range(len(texts)))
+    for (_, result), single in zip(results, expected):
+        # Skills are collected in a set, whose order differs between processes
+        assert sorted(result.pop('skills')) == sorted(single.pop('skills'))
+        assert result == single
+
+
+def test_analyze_many_unordered_yields_every_index(analyzer, synthetic_resumes):
+    texts = synthetic_resumes(5)
+    results = analyzer.analyze_many(texts, {'required_skills': REQUIRED_SKILLS}, workers=2, ordered=False)
+    assert sorted(index for index, _ in results) == list(range(len(texts)))
+
+
+def test_profile_adds_stage_timings_only(analyzer, synthetic_resume):
+    requirements = {'required_skills': REQUIRED_SKILLS}
+    text = synthetic_resume(2)
+    plain = analyzer.analyze_resume({'raw_text': text}, requirements)
+    profiled = analyzer.analyze_resume({'raw_text': text}, requirements, profile=True)
+    profile = profiled.pop('_profile')
+    assert profiled == plain
+    assert 'keyword_matching' in profile['stages']
+
+
+@pytest.mark.parametrize('text, required, expected', LEXICON_CASES)
+def test_ambiguous_skill_words(analyzer, text, required, expected):
+    assert analyzer.calculate_keyword_match(text, required)['found_skills'] == expected
+
+
+@pytest.mark.parametrize('size', [1, 10])
+def test_lexicon_scan_matches_parsed_skill_ids(synthetic_resume, size):
+    text = synthetic_resume(size)
+    assert get_skill_lexicon().find_ids(text, text.lower()) == ParsedResume(text).skill_ids
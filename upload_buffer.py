@@ -0,0 +1,94 @@
+import io
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+_stats_lock = threading.Lock()
+_copy_stats = {
+    'requests': 0,
+    'bytes_copied': 0,
+    'temp_files': 0
+}
+
+
+class UploadBuffer:
+    """In-memory view of an uploaded document.
+
+    pdfplumber, pypdf and python-docx all read from a seekable stream, so
+    they are fed io.BytesIO objects that share the upload's bytes instead
+    of a temporary file. Only tools that need a real path (pdf2image and
+    the poppler binaries behind it) get a temp file, via temp_path().
+    Every copy of the document bytes is counted in bytes_copied.
+    """
+
+    def __init__(self, file):
+        self.bytes_copied = 0
+        self.temp_files = 0
+        self.data = self._load(file)
+        with _stats_lock:
+            _copy_stats['requests'] += 1
+            _copy_stats['bytes_copied'] += self.bytes_copied
+
+    def _load(self, file):
+        if isinstance(file, bytes):
+            return file
+        if isinstance(file, (bytearray, memoryview)):
+            return self._copied(bytes(file))
+        if isinstance(file, io.BytesIO):
+            # BytesIO.getvalue() hands back its buffer without copying as
+            # long as no getbuffer() view is alive (Streamlit uploads are
+            # BytesIO subclasses)
+            return file.getvalue()
+        if hasattr(file, 'getvalue'):
+            return self._copied(file.getvalue())
+        if hasattr(file, 'read'):
+            content = file.read()
+            file.seek(0)  # Reset file pointer
+            return self._copied(content)
+        with open(file, 'rb') as f:
+            return self._copied(f.read())
+
+    def _copied(self, data):
+        self.bytes_copied += len(data)
+        return data
+
+    def __len__(self):
+        return len(self.data)
+
+    def stream(self):
+        """Return a fresh seekable stream over the bytes.
+
+        io.BytesIO initialised from a bytes object shares that object's
+        memory until it is written to, so this does not copy.
+        """
+        return io.BytesIO(self.data)
+
+    @contextmanager
+    def temp_path(self, suffix=''):
+        """Write the bytes to a temp file for path-only tools and always remove it"""
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+            temp_file.write(self.data)
+            temp_path = temp_file.name
+        self.bytes_copied += len(self.data)
+        self.temp_files += 1
+        with _stats_lock:
+            _copy_stats['bytes_copied'] += len(self.data)
+            _copy_stats['temp_files'] += 1
+        try:
+            yield temp_path
+        finally:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+def get_copy_stats():
+    """Return process-wide counters of upload bytes copied and temp files written"""
+    with _stats_lock:
+        stats = dict(_copy_stats)
+    stats['bytes_copied_per_request'] = (
+        stats['bytes_copied'] / stats['requests'] if stats['requests'] else 0
+    )
+    return stats